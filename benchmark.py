@@ -0,0 +1,181 @@
+"""Benchmark reprodutível do núcleo de grafos (roteamento e geração).
+
+Gera grafos sintéticos com semente fixa e mede os caminhos quentes do GraphModel:
+
+- geração do grafo (grafos.generators: grade, geométrico aleatório, livre de escala e o
+  modelo árvore geradora + extras de create_random_complete);
+- construção do CSR;
+- Dijkstra completo e ponto a ponto (dicts) e completo sobre o CSR (índices, dijkstra_csr);
+- find_shortest_path com vários destinos;
+- reroteamento após falha (simulate_failure_and_reroute).
+
+Se o NetworkX estiver instalado, as mesmas consultas rodam nele como referência. O resultado
+sai em JSON (stdout ou --output) para acompanhar regressões ao longo do tempo. O desenho no
+canvas (Tk) precisa de display e fica fora deste benchmark headless.
+
+Uso:
+    python benchmark.py --sizes 10 100 1000 10000 --repeat 3 --output bench.json
+    python benchmark.py --models grid --sizes 1000000
+"""
+
+import argparse
+import json
+import math
+import platform
+import random
+import sys
+import time
+
+from grafos import CSRGraph, GraphModel, dijkstra_csr, generators
+
+try:
+    import networkx as nx
+except ImportError:
+    nx = None
+
+# ============================================================
+# GERADORES SINTÉTICOS
+# ============================================================
+
+def build_grid(n, rng):
+    """Grade side x side (side = √n) com vizinhança 4 e pesos 1..10."""
+    side = max(2, int(math.isqrt(n)))
+    return generators.grid(side, side, rng)
+
+
+def build_geometric(n, rng, avg_degree=6):
+    """Grafo geométrico aleatório: n pontos no quadrado 1000x1000 ligados se a distância for
+    menor que o raio que dá o grau médio pedido. Pesos = distância euclidiana."""
+    return generators.random_geometric(n, avg_degree, rng=rng)
+
+
+def build_scale_free(n, rng):
+    """Barabási-Albert com 2 arestas por nó novo, pesos = distância."""
+    return generators.scale_free(n, 2, rng=rng)
+
+
+def build_random_complete(n, rng):
+    """O próprio GraphModel.create_random_complete (árvore geradora + arestas extras)."""
+    g = GraphModel()
+    g.create_random_complete(n, 700, rng=rng)
+    return g
+
+
+MODELS = {
+    "grid": build_grid,
+    "geometric": build_geometric,
+    "scale_free": build_scale_free,
+    "random_complete": build_random_complete,
+}
+
+
+# ============================================================
+# MEDIÇÃO
+# ============================================================
+
+def timed(fn, repeat):
+    """Menor tempo (s) entre `repeat` execuções de fn() e o último resultado."""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def reachable_nodes(g, src):
+    dist, _ = g.dijkstra(src)
+    return sorted(dist)
+
+
+def bench_graph(model, n, seed, repeat, n_dests):
+    rng = random.Random(seed)
+    gen_time, g = timed(lambda: MODELS[model](n, random.Random(seed)), 1)
+    n_nodes = len(g.adj)
+    n_edges = sum(1 for _ in g.edges())
+    rows = []
+
+    def add(op, seconds, **extra):
+        row = {"model": model, "n": n_nodes, "m": n_edges, "op": op, "seconds": seconds}
+        row.update(extra)
+        rows.append(row)
+
+    add("generate", gen_time)
+    add("csr_build", timed(lambda: CSRGraph.from_adj(g.adj), repeat)[0])
+
+    # origem/destinos sorteados dentro da componente alcançável a partir de src
+    src = rng.randrange(n_nodes)
+    reachable = reachable_nodes(g, src)
+    target = rng.choice(reachable)
+    dests = [rng.choice(reachable) for _ in range(n_dests)]
+
+    add("dijkstra_full", timed(lambda: g.dijkstra(src), repeat)[0])
+    add("dijkstra_p2p", timed(lambda: g.dijkstra(src, target=target), repeat)[0])
+    csr = g.csr()
+    add("dijkstra_csr_full", timed(lambda: dijkstra_csr(csr, csr.node_index(src)), repeat)[0])
+    add("find_shortest_path", timed(lambda: g.find_shortest_path(src, dests), repeat)[0],
+        dests=n_dests)
+
+    # reroteamento: mede só o reparo após a falha (a rota dinâmica é preparada fora do tempo)
+    path, _ = g.find_shortest_path(src, dests, dynamic=True)
+    if len(path) >= 2:
+        version = g.version
+        t0 = time.perf_counter()
+        u, v, _ = g.simulate_failure(path, rng=rng)
+        try:
+            g.reroute_after_failure(src, dests, u, v, version)
+        except ValueError:
+            pass
+        add("failure_reroute", time.perf_counter() - t0,
+            recomputed=len(g.last_reroute["recomputed"]), affected=g.last_reroute["affected"])
+
+    if nx is not None:
+        G = nx.DiGraph() if g.directed else nx.Graph()
+        G.add_nodes_from(g.adj)
+        G.add_weighted_edges_from(g.edges())
+        add("nx_dijkstra_full", timed(lambda: nx.single_source_dijkstra_path_length(G, src), repeat)[0])
+        add("nx_dijkstra_p2p", timed(lambda: nx.dijkstra_path(G, src, target), repeat)[0])
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark do núcleo de grafos (grafos/).")
+    parser.add_argument("--models", nargs="+", choices=sorted(MODELS), default=sorted(MODELS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=[10, 100, 1000, 10000, 100000])
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--dests", type=int, default=10, help="destinos em find_shortest_path")
+    parser.add_argument("--output", help="arquivo JSON (padrão: stdout)")
+    args = parser.parse_args(argv)
+
+    results = []
+    for model in args.models:
+        for n in args.sizes:
+            rows = bench_graph(model, n, args.seed, args.repeat, args.dests)
+            for r in rows:
+                print(f"{r['model']:>16} n={r['n']:<8} {r['op']:<20} {r['seconds'] * 1000:10.2f} ms",
+                      file=sys.stderr)
+            results.extend(rows)
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "networkx": getattr(nx, "__version__", None),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
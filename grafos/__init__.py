@@ -0,0 +1,15 @@
+"""Núcleo de grafos (sem interface gráfica) do sistema de entregas."""
+
+from .ch import ContractionHierarchy
+from .csr import CSRGraph
+from .heaps import RadixHeap
+from .model import GraphModel, RouteError
+from .resilience import replacement_path_costs, resilience_sweep
+from .search import Landmarks, astar, bidirectional_dijkstra
+from .shortest_path import dijkstra, dijkstra_csr, reconstruct_path
+from .tsp import distance_matrix, optimize_order, route_cost
+
+__all__ = ["CSRGraph", "ContractionHierarchy", "GraphModel", "Landmarks", "RadixHeap", "RouteError", "astar",
+           "bidirectional_dijkstra", "dijkstra", "dijkstra_csr",
+           "distance_matrix", "optimize_order", "reconstruct_path", "replacement_path_costs",
+           "resilience_sweep", "route_cost"]
@@ -0,0 +1,153 @@
+"""Animação de veículos guiada por relógio (headless: a interface só desenha o que tick devolve).
+
+Track descreve o trajeto de um veículo como função do tempo: os pontos (coordenadas de mundo)
+e o instante em que cada um é alcançado. A posição num instante sai por interpolação no trecho
+certo (busca binária), então não depende de quantos quadros já foram desenhados nem de ler a
+posição de volta do canvas.
+
+Fleet guarda os trajetos ativos e o relógio de quadros: um único tick por quadro move todos os
+veículos. Se um tick atrasa mais de um quadro, os quadros perdidos são pulados (os veículos
+saltam para onde deveriam estar) em vez de acumulados; frames/skipped/fps informam a taxa
+efetivamente alcançada.
+"""
+
+import bisect
+import math
+import time
+from collections import deque
+
+
+class Track:
+    """Polilinha percorrida no tempo: points[i] é alcançado em times[i] (segundos, crescentes)."""
+
+    def __init__(self, points, times):
+        if not points or len(points) != len(times):
+            raise ValueError("Track precisa de um instante para cada ponto.")
+        self.points = [tuple(p) for p in points]
+        self.times = list(times)
+        # direção (graus, eixo y para baixo como no canvas) de cada trecho; trechos de
+        # comprimento zero mantêm a direção anterior
+        self.headings = []
+        heading = 0.0
+        for (x1, y1), (x2, y2) in zip(self.points, self.points[1:]):
+            if x1 != x2 or y1 != y2:
+                heading = math.degrees(math.atan2(y2 - y1, x2 - x1))
+            self.headings.append(heading)
+        if not self.headings:
+            self.headings.append(heading)
+
+    @classmethod
+    def uniform(cls, points, leg_seconds, start=0.0):
+        """Cada trecho leva leg_seconds, qualquer que seja o comprimento."""
+        return cls(points, [start + i * leg_seconds for i in range(len(points))])
+
+    @classmethod
+    def at_speed(cls, points, speed, start=0.0):
+        """Velocidade constante (unidades de mundo por segundo)."""
+        times = [start]
+        for (x1, y1), (x2, y2) in zip(points, points[1:]):
+            times.append(times[-1] + math.hypot(x2 - x1, y2 - y1) / speed)
+        return cls(points, times)
+
+    @property
+    def duration(self):
+        return self.times[-1]
+
+    def at(self, t):
+        """(x, y, direção) no instante t; antes do início / depois do fim, o primeiro / último ponto."""
+        times = self.times
+        if t <= times[0]:
+            x, y = self.points[0]
+            return x, y, self.headings[0]
+        if t >= times[-1]:
+            x, y = self.points[-1]
+            return x, y, self.headings[-1]
+        i = bisect.bisect_right(times, t) - 1
+        (x1, y1), (x2, y2) = self.points[i], self.points[i + 1]
+        span = times[i + 1] - times[i]
+        f = (t - times[i]) / span if span > 0 else 1.0
+        return x1 + (x2 - x1) * f, y1 + (y2 - y1) * f, self.headings[i]
+
+
+class Fleet:
+    """Veículos ativos (chave -> Track) sob um único relógio de quadros de 1/fps segundos."""
+
+    def __init__(self, fps=60, clock=time.perf_counter):
+        self.frame_time = 1.0 / fps
+        self.clock = clock
+        self.tracks = {}       # chave -> (track, instante de início no relógio)
+        self.frames = 0        # ticks executados
+        self.skipped = 0       # quadros pulados por atraso
+        self._deadline = None  # instante previsto do próximo quadro
+        self._recent = deque()  # instantes dos ticks do último segundo (para o fps)
+
+    def __len__(self):
+        return len(self.tracks)
+
+    def add(self, key, track, now=None):
+        """Inicia `track` agora (ou em `now`); uma chave repetida substitui o veículo."""
+        now = self.clock() if now is None else now
+        self.tracks[key] = (track, now)
+        if self._deadline is None:
+            self._deadline = now
+
+    def remove(self, key):
+        self.tracks.pop(key, None)
+
+    def clear(self):
+        self.tracks.clear()
+        self.frames = 0
+        self.skipped = 0
+        self._deadline = None
+        self._recent.clear()
+
+    def tick(self, now=None):
+        """Avança um quadro. Retorna ({chave: (x, y, direção)}, [chaves que chegaram ao fim]);
+        as que chegaram saem da frota (na posição final)."""
+        now = self.clock() if now is None else now
+        self.frames += 1
+        ft = self.frame_time
+        if self._deadline is None:
+            self._deadline = now
+        late = now - self._deadline
+        if late > ft:
+            # atrasado: não tenta recuperar os quadros perdidos, realinha no próximo
+            missed = int(late / ft)
+            self.skipped += missed
+            self._deadline += missed * ft
+        self._deadline += ft
+        recent = self._recent
+        recent.append(now)
+        while recent[0] < now - 1.0:
+            recent.popleft()
+
+        positions = {}
+        finished = []
+        for key, (track, start) in self.tracks.items():
+            t = now - start
+            positions[key] = track.at(t)
+            if t >= track.duration:
+                finished.append(key)
+        for key in finished:
+            del self.tracks[key]
+        if not self.tracks:
+            self._deadline = None
+        return positions, finished
+
+    def next_delay(self, now=None):
+        """Milissegundos até o próximo quadro (para after()); 1 se já passou da hora."""
+        if self._deadline is None:
+            return int(self.frame_time * 1000)
+        now = self.clock() if now is None else now
+        return max(1, int((self._deadline - now) * 1000))
+
+    @property
+    def fps(self):
+        """Quadros por segundo alcançados no último segundo."""
+        recent = self._recent
+        if len(recent) < 2:
+            return 0.0
+        span = recent[-1] - recent[0]
+        if span <= 0:
+            return 0.0   # ticks no mesmo instante (relógio de baixa resolução)
+        return (len(recent) - 1) / span
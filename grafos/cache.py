@@ -0,0 +1,85 @@
+"""Cache de árvores de caminhos mínimos por origem (LRU com limite de memória).
+
+Cada entrada guarda a árvore completa (dist, prev) de uma origem. A invalidação é precisa:
+ao mudar a aresta u->v, só caem as árvores que ela pode afetar:
+
+- remoção ou aumento de peso: apenas se u->v é aresta da árvore (prev[v] == u);
+- inserção ou redução de peso: apenas se ela encurta algum caminho (dist[u] + w < dist[v]).
+
+Qualquer outra edição deixa a árvore exatamente correta.
+"""
+
+import sys
+from collections import OrderedDict
+
+INF = float("inf")
+
+
+def tree_nbytes(dist, prev):
+    """Estimativa da memória de uma árvore: os dois dicts mais um float por nó."""
+    return sys.getsizeof(dist) + sys.getsizeof(prev) + 24 * len(dist)
+
+
+class RouteCache:
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()   # origem -> (dist, prev, nbytes), do menos ao mais recente
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, src):
+        return src in self.entries
+
+    def get(self, src):
+        """Retorna (dist, prev) da origem ou None; conta acerto/falha."""
+        entry = self.entries.get(src)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(src)
+        self.hits += 1
+        return entry[0], entry[1]
+
+    def put(self, src, dist, prev):
+        self.discard(src)
+        size = tree_nbytes(dist, prev)
+        if size > self.max_bytes:
+            return
+        self.entries[src] = (dist, prev, size)
+        self.nbytes += size
+        # despejar as menos usadas até caber no orçamento
+        while self.nbytes > self.max_bytes:
+            _, (_, _, old) = self.entries.popitem(last=False)
+            self.nbytes -= old
+
+    def discard(self, src):
+        entry = self.entries.pop(src, None)
+        if entry is not None:
+            self.nbytes -= entry[2]
+
+    def clear(self):
+        self.entries.clear()
+        self.nbytes = 0
+
+    def edge_changed(self, u, v, old_w, new_w):
+        """Avisa que a aresta u->v passou de old_w para new_w (None = inexistente)."""
+        stale = []
+        for src, (dist, prev, _) in self.entries.items():
+            if old_w is not None and (new_w is None or new_w > old_w):
+                if prev.get(v) == u:
+                    stale.append(src)
+            elif new_w is not None and (old_w is None or new_w < old_w):
+                if u in dist and dist[u] + new_w < dist.get(v, INF):
+                    stale.append(src)
+        for src in stale:
+            self.discard(src)
+        self.invalidations += len(stale)
+
+    def stats(self):
+        return {"entries": len(self.entries), "bytes": self.nbytes, "hits": self.hits,
+                "misses": self.misses, "invalidations": self.invalidations}
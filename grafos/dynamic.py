@@ -0,0 +1,109 @@
+"""Árvore de caminhos mínimos com reparo incremental após remoção de arestas.
+
+Quando uma aresta some, só os nós da subárvore "pendurada" nela podem ter a distância
+alterada (remover arestas nunca encurta caminhos). DynamicSPT desliga essa subárvore,
+semeia cada nó afetado com o melhor vizinho de entrada ainda intacto e roda um Dijkstra
+restrito aos afetados (no espírito de Ramalingam-Reps). O custo é proporcional ao dano,
+não ao tamanho do grafo.
+"""
+
+import heapq
+
+from .shortest_path import dijkstra, reconstruct_path
+
+INF = float("inf")
+
+
+class DynamicSPT:
+    def __init__(self, adj, src, directed=False, tree=None):
+        self.adj = adj
+        self.src = src
+        self.directed = directed
+        if tree is None:
+            self.dist, self.prev = dijkstra(adj, src)
+        else:
+            # árvore completa já calculada (ex.: do RouteCache); copiada pois será reparada in-place
+            self.dist = dict(tree[0])
+            self.prev = dict(tree[1])
+        self.children = {}
+        for x, p in self.prev.items():
+            self.children.setdefault(p, set()).add(x)
+        # arestas de entrada: em grafo não direcionado adj já é simétrico
+        self.radj = None
+        if directed:
+            self.radj = {}
+            for u, nbrs in adj.items():
+                for v, w in nbrs.items():
+                    self.radj.setdefault(v, {})[u] = w
+
+    def path_to(self, target):
+        """Caminho src -> target na árvore atual (None se inalcançável)."""
+        if target not in self.dist:
+            return None
+        return reconstruct_path(self.prev, self.src, target)
+
+    def _in_edges(self, x):
+        if self.radj is None:
+            return self.adj.get(x, {}).items()
+        return self.radj.get(x, {}).items()
+
+    def delete_edge(self, u, v):
+        """Atualiza a árvore após a aresta u->v ter sido removida de adj.
+        Retorna o conjunto de nós cuja distância/caminho foi recalculado (vazio se u->v não era da árvore)."""
+        if self.radj is not None:
+            self.radj.get(v, {}).pop(u, None)
+        if self.prev.get(v) != u:
+            return set()
+
+        # subárvore pendurada em v
+        affected = set()
+        stack = [v]
+        while stack:
+            x = stack.pop()
+            affected.add(x)
+            stack.extend(self.children.get(x, ()))
+        for x in affected:
+            p = self.prev.pop(x)
+            self.children[p].discard(x)
+            del self.dist[x]
+
+        # semear com o melhor vizinho de entrada fora da subárvore
+        dist = self.dist
+        prev = self.prev
+        pq = []
+        for x in affected:
+            best = INF
+            arg = None
+            for p, w in self._in_edges(x):
+                if p in affected or p not in dist:
+                    continue
+                nd = dist[p] + w
+                if nd < best:
+                    best = nd
+                    arg = p
+            if arg is not None:
+                dist[x] = best
+                prev[x] = arg
+                pq.append((best, x))
+        heapq.heapify(pq)
+
+        # Dijkstra restrito aos nós afetados
+        done = set()
+        while pq:
+            d, x = heapq.heappop(pq)
+            if x in done or d > dist[x]:
+                continue
+            done.add(x)
+            for y, w in self.adj.get(x, {}).items():
+                if y not in affected or y in done:
+                    continue
+                nd = d + w
+                if nd < dist.get(y, INF):
+                    dist[y] = nd
+                    prev[y] = x
+                    heapq.heappush(pq, (nd, y))
+
+        for x in affected:
+            if x in prev:
+                self.children.setdefault(prev[x], set()).add(x)
+        return affected
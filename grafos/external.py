@@ -0,0 +1,254 @@
+"""Ingestão de grafos maiores que a RAM (memória externa).
+
+build_external lê as arestas de um iterador (ou arquivo) em blocos de `chunk_edges`: cada
+bloco é ordenado em memória e gravado como um "run" temporário; depois um merge de k vias
+percorre os runs em ordem (u, v), descarta duplicatas (fica o menor peso) e grava o CSR
+direto no formato binário de formats.write_binary. Só um bloco e um buffer por run ficam
+na memória, além das páginas em uso pelo sistema de arquivos.
+
+MappedGraph consulta o arquivo resultante via mmap com estado esparso (dicts do tamanho da
+região explorada, não de n) e devolve as páginas lidas ao sistema após cada consulta, então a
+memória ocupada não cresce com o tamanho da rede. last_stats traz tempo e pico de RSS.
+
+Os ids dos nós devem ser inteiros 0..n-1 (n = maior id + 1); use iter_edge_file para ler CSV
+"u,v,w" ou DIMACS .gr (ids 1..n viram 0..n-1).
+
+Uso:
+    python -m grafos.external build USA-road-d.USA.gr rede.bin
+    python -m grafos.external query rede.bin 0 123456
+"""
+
+import argparse
+import heapq
+import mmap
+import os
+import shutil
+import struct
+import sys
+import tempfile
+import time
+from array import array
+
+from .formats import FLAG_DIRECTED, HEADER, HEADER_SIZE, MAGIC, _pad, open_binary
+from .shortest_path import INF
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+RECORD = struct.Struct("<iid")   # (u, v, w) nos runs temporários
+READ_RECORDS = 1 << 14           # registros lidos por vez de cada run durante o merge
+
+
+def peak_rss():
+    """Pico de memória residente do processo em bytes (None se a plataforma não informa)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux informa em KiB, macOS em bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def iter_edge_file(path, delimiter=","):
+    """Gera (u, v, w) de um CSV "u,v[,w]" ou de um DIMACS .gr, linha a linha."""
+    dimacs = path.endswith(".gr")
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if dimacs:
+                if line.startswith("a "):
+                    _, u, v, w = line.split()
+                    yield int(u) - 1, int(v) - 1, float(w)
+                continue
+            parts = line.strip().split(delimiter)
+            if len(parts) < 2 or not parts[0].strip().isdigit():
+                continue   # cabeçalho, comentário ou linha vazia
+            yield int(parts[0]), int(parts[1]), float(parts[2]) if len(parts) > 2 else 1.0
+
+
+# ============================================================
+# CONSTRUÇÃO (ORDENAÇÃO EXTERNA)
+# ============================================================
+
+def build_external(edges, path, directed=False, chunk_edges=1_000_000, tmpdir=None):
+    """Grava em `path` o CSR das arestas (u, v, w) de `edges` usando memória limitada.
+    Em grafo não direcionado cada aresta entra nos dois sentidos. Retorna (n, m)."""
+    with tempfile.TemporaryDirectory(dir=tmpdir, prefix="grafos-") as tmp:
+        runs, n = _write_runs(edges, directed, chunk_edges, tmp)
+        parts = [os.path.join(tmp, name) for name in ("offsets", "targets", "weights")]
+        m = _merge_runs(runs, n, parts)
+        with open(path, "wb") as out:
+            flags = FLAG_DIRECTED if directed else 0
+            out.write(HEADER.pack(MAGIC, 1, flags, n, m, 0).ljust(HEADER_SIZE, b"\0"))
+            for part in parts:
+                with open(part, "rb") as f:
+                    shutil.copyfileobj(f, out)
+                _pad(out)
+    return n, m
+
+
+def _write_runs(edges, directed, chunk_edges, tmp):
+    runs = []
+    n = 0
+    chunk = []
+
+    def flush():
+        chunk.sort()
+        run = os.path.join(tmp, f"run{len(runs)}")
+        with open(run, "wb") as f:
+            f.writelines(RECORD.pack(*rec) for rec in chunk)
+        runs.append(run)
+        chunk.clear()
+
+    for u, v, w in edges:
+        if u < 0 or v < 0:
+            raise ValueError(f"Ids de nó devem ser inteiros não negativos: ({u}, {v}).")
+        if u == v:
+            continue
+        n = max(n, u + 1, v + 1)
+        chunk.append((u, v, w))
+        if not directed:
+            chunk.append((v, u, w))
+        if len(chunk) >= chunk_edges:
+            flush()
+    if chunk:
+        flush()
+    return runs, n
+
+
+def _read_run(run):
+    with open(run, "rb") as f:
+        while True:
+            block = f.read(RECORD.size * READ_RECORDS)
+            if not block:
+                return
+            yield from RECORD.iter_unpack(block)
+
+
+def _merge_runs(runs, n, parts):
+    """Merge k-vias dos runs ordenados gravando offsets/targets/weights em arquivos separados."""
+    offsets = array("i", [0])
+    targets = array("i")
+    weights = array("d")
+    m = 0
+    row = 0   # próximo nó cuja linha ainda não começou
+    last = None
+    with open(parts[0], "wb") as fo, open(parts[1], "wb") as ft, open(parts[2], "wb") as fw:
+        def spill():
+            offsets.tofile(fo)
+            targets.tofile(ft)
+            weights.tofile(fw)
+            del offsets[:], targets[:], weights[:]
+
+        for u, v, w in heapq.merge(*(_read_run(r) for r in runs)):
+            if (u, v) == last:
+                continue   # duplicata: a primeira tem o menor peso (ordem por (u, v, w))
+            last = (u, v)
+            while row < u:
+                row += 1
+                offsets.append(m)
+            targets.append(v)
+            weights.append(w)
+            m += 1
+            if len(targets) >= READ_RECORDS:
+                spill()
+        while row < n:
+            row += 1
+            offsets.append(m)
+        spill()
+    return m
+
+
+# ============================================================
+# CONSULTA
+# ============================================================
+
+class MappedGraph:
+    """Consultas de menor caminho sobre um arquivo binário mapeado em memória."""
+
+    def __init__(self, path, release=True):
+        self.csr = open_binary(path)
+        self.release = release
+        self.last_stats = {}
+        if hasattr(mmap, "MADV_RANDOM"):
+            # acesso espalhado: sem leitura antecipada de páginas vizinhas
+            self.csr._mmap.madvise(mmap.MADV_RANDOM)
+
+    def __len__(self):
+        return len(self.csr)
+
+    def shortest_path(self, src, dst):
+        """(custo, caminho) de src a dst; (inf, None) se inalcançável."""
+        t0 = time.perf_counter()
+        offsets = self.csr.offsets
+        targets = self.csr.targets
+        weights = self.csr.weights
+        dist = {src: 0.0}
+        prev = {}
+        done = set()
+        pq = [(0.0, src)]
+        while pq:
+            d, u = heapq.heappop(pq)
+            if u in done:
+                continue
+            done.add(u)
+            if u == dst:
+                break
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                nd = d + weights[k]
+                if nd < dist.get(v, INF):
+                    dist[v] = nd
+                    prev[v] = u
+                    heapq.heappush(pq, (nd, v))
+        path = None
+        if dst in done:
+            path = [dst]
+            while path[-1] != src:
+                path.append(prev[path[-1]])
+            path.reverse()
+        if self.release and hasattr(mmap, "MADV_DONTNEED"):
+            # devolve as páginas do arquivo: o próximo acesso as relê do page cache/disco
+            self.csr._mmap.madvise(mmap.MADV_DONTNEED)
+        self.last_stats = {
+            "seconds": time.perf_counter() - t0,
+            "settled": len(done),
+            "peak_rss": peak_rss(),
+        }
+        return (dist[dst], path) if path else (INF, None)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Grafos maiores que a RAM (grafos.external).")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    b = sub.add_parser("build", help="arestas (CSV ou DIMACS .gr) -> binário CSR")
+    b.add_argument("edges")
+    b.add_argument("output")
+    b.add_argument("--directed", action="store_true", help="padrão para .gr")
+    b.add_argument("--chunk", type=int, default=1_000_000, help="arestas por bloco ordenado")
+    q = sub.add_parser("query", help="menor caminho no binário mapeado")
+    q.add_argument("graph")
+    q.add_argument("src", type=int)
+    q.add_argument("dst", type=int)
+    args = parser.parse_args(argv)
+
+    if args.cmd == "build":
+        t0 = time.perf_counter()
+        directed = args.directed or args.edges.endswith(".gr")
+        n, m = build_external(iter_edge_file(args.edges), args.output, directed, args.chunk)
+        print(f"{n} nós, {m} arestas em {time.perf_counter() - t0:.1f} s; "
+              f"pico de RSS {_mb(peak_rss())}")
+    else:
+        g = MappedGraph(args.graph)
+        cost, path = g.shortest_path(args.src, args.dst)
+        stats = g.last_stats
+        print(f"custo {cost}, {len(path) if path else 0} nós no caminho, {stats['settled']} fixados, "
+              f"{stats['seconds'] * 1000:.1f} ms; pico de RSS {_mb(stats['peak_rss'])}")
+
+
+def _mb(nbytes):
+    return "n/d" if nbytes is None else f"{nbytes / 2**20:.1f} MB"
+
+
+if __name__ == "__main__":
+    main()
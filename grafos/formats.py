@@ -0,0 +1,196 @@
+"""Importação/exportação de grafos.
+
+- read_edge_csv: lista de arestas "u,v,w" (cabeçalho opcional, detectado ou via header=);
+- read_dimacs: formato do 9º DIMACS Challenge (".gr": linhas "a u v w"; ".co" opcional
+  com coordenadas "v id x y");
+- write_binary / open_binary: formato nativo = cabeçalho fixo + arrays do CSR gravados
+  crus. open_binary faz mmap do arquivo e devolve um CSRGraph cujos arrays são memoryviews
+  sobre o próprio arquivo: nada é lido nem convertido em objetos Python na abertura, e o
+  sistema operacional traz as páginas sob demanda durante as buscas.
+
+Os leitores de texto renumeram os nós para 0..n-1 (índices = ids, sem mapa no CSR); o CSV
+guarda os ids originais em graph.labels, no DIMACS o id original é simplesmente i + 1.
+"""
+
+import csv
+import json
+import mmap
+import struct
+from array import array
+
+from .csr import CSRGraph
+from .model import GraphModel
+
+MAGIC = b"GRAFCSR1"
+# magic, versão, flags (bit 0 = direcionado, bit 1 = tem rótulos), n, m, bytes dos rótulos
+HEADER = struct.Struct("<8sIIqqq")
+HEADER_SIZE = 64
+FLAG_DIRECTED = 1
+FLAG_LABELS = 2
+
+
+def _new_graph(graph, directed):
+    graph = graph if graph is not None else GraphModel()
+    graph.directed = directed
+    graph.reset()
+    return graph
+
+
+def _parse_id(text):
+    try:
+        return int(text)
+    except ValueError:
+        return text.strip()
+
+
+def _is_number(text):
+    try:
+        float(text)
+    except ValueError:
+        return False
+    return True
+
+
+def read_edge_csv(path, directed=False, delimiter=",", graph=None, header=None):
+    """Lê arestas u,v[,w] (peso padrão 1). Retorna o GraphModel (novo ou `graph`, limpo antes).
+    header=None detecta o cabeçalho: a primeira linha o é se alguma coluna não for número (com
+    ids textuais sem cabeçalho, passe header=False); True/False força."""
+    graph = _new_graph(graph, directed)
+    index = {}
+    labels = []
+
+    def node(raw):
+        key = _parse_id(raw)
+        i = index.get(key)
+        if i is None:
+            i = index[key] = len(labels)
+            labels.append(key)
+            graph.adj[i] = {}
+        return i
+
+    def edges(rows):
+        first = True
+        for row in rows:
+            if not row or row[0].startswith("#"):
+                continue
+            if first:
+                first = False
+                if header or (header is None and not all(map(_is_number, row[:3]))):
+                    continue
+            try:
+                w = float(row[2]) if len(row) > 2 else 1.0
+            except ValueError:
+                raise ValueError(f"{path}:{rows.line_num}: peso inválido {row[2]!r}.") from None
+            yield node(row[0]), node(row[1]), w
+
+    with open(path, newline="", encoding="utf-8") as f:
+        graph.add_edges(edges(csv.reader(f, delimiter=delimiter)))
+    graph.n_nodes = len(labels)
+    graph.labels = labels
+    return graph
+
+
+def read_dimacs(path, coords=None, graph=None):
+    """Lê um arquivo DIMACS .gr (sempre direcionado; ids 1..n viram 0..n-1).
+    `coords` é o .co correspondente, que preenche graph.positions. Linhas malformadas e ids
+    fora de 1..n (n da linha "p") geram ValueError com arquivo e número da linha."""
+    graph = _new_graph(graph, True)
+    n = None
+
+    def arcs(f):
+        nonlocal n
+        for lineno, line in enumerate(f, 1):
+            if line.startswith("a "):
+                if n is None:
+                    raise ValueError(f"{path}:{lineno}: arco antes da linha 'p'.")
+                yield _dimacs_fields(path, lineno, line, n, 2)
+            elif line.startswith("p "):
+                fields = line.split()
+                if n is not None or len(fields) != 4 or not fields[2].isdigit():
+                    raise ValueError(f"{path}:{lineno}: linha 'p' inválida {line.strip()!r}.")
+                n = int(fields[2])
+                graph.reset(n)
+
+    with open(path, encoding="ascii") as f:
+        graph.add_edges(arcs(f))
+    if n is None:
+        raise ValueError(f"{path}: falta a linha 'p' com o número de nós.")
+    if coords:
+        with open(coords, encoding="ascii") as f:
+            for lineno, line in enumerate(f, 1):
+                if line.startswith("v "):
+                    i, x, y = _dimacs_fields(coords, lineno, line, n, 1)
+                    graph.positions[i] = (x, y)
+        graph.layout_version += 1
+    return graph
+
+
+def _dimacs_fields(path, lineno, line, n, ids):
+    """Os três campos de "a u v w" (ids=2) ou "v i x y" (ids=1): os `ids` primeiros são nós
+    1..n devolvidos como 0..n-1, o resto são números."""
+    fields = line.split()[1:]
+    try:
+        if len(fields) != 3:
+            raise ValueError
+        nodes = [int(x) for x in fields[:ids]]
+        values = [float(x) for x in fields[ids:]]
+    except ValueError:
+        raise ValueError(f"{path}:{lineno}: linha inválida {line.strip()!r}.") from None
+    for i in nodes:
+        if not 1 <= i <= n:
+            raise ValueError(f"{path}:{lineno}: nó {i} fora de 1..{n}.")
+    return [i - 1 for i in nodes] + values
+
+
+def write_binary(path, graph, directed=None, labels=None):
+    """Grava o grafo (GraphModel ou CSRGraph) no formato binário nativo."""
+    if isinstance(graph, GraphModel):
+        directed = graph.directed if directed is None else directed
+        labels = graph.labels if labels is None else labels
+        csr = graph.csr()
+    else:
+        csr = graph
+    if labels is None and csr.nodes is not None:
+        labels = csr.nodes
+    label_bytes = json.dumps(labels).encode() if labels is not None else b""
+    flags = (FLAG_DIRECTED if directed else 0) | (FLAG_LABELS if labels is not None else 0)
+    arrays = [array("i", csr.offsets), array("i", csr.targets), array("d", csr.weights)]
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, 1, flags, len(csr), csr.n_edges, len(label_bytes)).ljust(HEADER_SIZE, b"\0"))
+        for a in arrays:
+            a.tofile(f)
+            _pad(f)
+        f.write(label_bytes)
+
+
+def open_binary(path):
+    """Abre um arquivo do formato nativo via mmap, sem ler os arrays para a memória.
+    Retorna um CSRGraph somente leitura; csr.directed e csr.labels vêm do cabeçalho."""
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, version, flags, n, m, label_len = HEADER.unpack_from(mm, 0)
+    if magic != MAGIC or version != 1:
+        mm.close()
+        raise ValueError(f"{path}: não é um grafo binário {MAGIC.decode()}.")
+    view = memoryview(mm)
+    pos = HEADER_SIZE
+    sections = []
+    for typecode, length in (("i", n + 1), ("i", m), ("d", m)):
+        size = array(typecode).itemsize * length
+        sections.append(view[pos:pos + size].cast(typecode))
+        pos = _align(pos + size)
+    labels = json.loads(bytes(view[pos:pos + label_len])) if flags & FLAG_LABELS else None
+    csr = CSRGraph(*sections)
+    csr.directed = bool(flags & FLAG_DIRECTED)
+    csr.labels = labels
+    csr._mmap = mm   # mantém o mapeamento vivo enquanto o CSR existir
+    return csr
+
+
+def _align(pos):
+    return (pos + 7) & ~7
+
+
+def _pad(f):
+    pos = f.tell()
+    f.write(b"\0" * (_align(pos) - pos))
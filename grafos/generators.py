@@ -0,0 +1,167 @@
+"""Geradores de grafos sintéticos, reprodutíveis (rng = random.Random(semente)).
+
+- gnp_pairs: pares (u, v) de um G(n, p) sem testar todos os n² pares — o salto até o próximo
+  par sorteado segue uma distribuição geométrica (Batagelj-Brandes), então o custo é
+  O(n + arestas);
+- random_connected: árvore geradora aleatória + arestas extras G(n, p) (o modelo do botão
+  "Criar Aleatório");
+- grid: grade com vizinhança 4;
+- random_geometric: pontos no quadrado ligados por distância, com hash de células;
+- scale_free: preferential attachment (Barabási-Albert) sobre pontos no plano, com peso =
+  distância: poucos "eixos" muito conectados, como rodovias entre cidades.
+
+Todos preenchem um GraphModel (novo ou `graph`, limpo antes) via add_edges, em lote. Com
+`graph` informado a direção dele é mantida; random_connected aceita directed=True para um
+grafo novo de mão única.
+"""
+
+import math
+import random
+
+from .model import GraphModel
+
+# pesos "de interface": 1.0 .. 10.0 com uma casa decimal, sorteados por índice (mais rápido
+# que round(uniform()) por aresta)
+WEIGHTS = [round(1.0 + k / 10, 1) for k in range(91)]
+
+
+def _graph(graph, n, directed=None):
+    # graph informado mantém a própria direção (salvo directed explícito); add_edges gera
+    # arestas de mão única quando o grafo é direcionado
+    if graph is None:
+        graph = GraphModel(bool(directed))
+    elif directed is not None:
+        graph.directed = directed
+    graph.reset(n)
+    return graph
+
+
+def _weight(rng):
+    return WEIGHTS[int(rng.random() * 91)]
+
+
+def gnp_pairs(n, p, rng=None):
+    """Gera os pares (u, v), u < v, de um grafo G(n, p) em O(n + arestas)."""
+    rng = rng or random
+    if p <= 0 or n < 2:
+        return
+    if p >= 1:
+        for v in range(1, n):
+            for u in range(v):
+                yield u, v
+        return
+    rnd = rng.random
+    log_q = math.log(1.0 - p)
+    v = 1
+    u = -1
+    while v < n:
+        # quantos pares pular até o próximo sorteado (geométrica com parâmetro p)
+        u += 1 + int(math.log(1.0 - rnd()) / log_q)
+        while u >= v and v < n:
+            u -= v
+            v += 1
+        if v < n:
+            yield u, v
+
+
+def random_connected(n, extra_prob=0.25, rng=None, graph=None, directed=None):
+    """Árvore geradora aleatória (conexo) + cada par extra com probabilidade extra_prob.
+    Direcionado: a árvore liga i -> j < i e os extras u -> v (u < v), de mão única.
+    Não define posições (ver GraphModel.create_random_complete)."""
+    rng = rng or random
+    graph = _graph(graph, n, directed)
+    randint = rng.randint
+    graph.add_edges((i, randint(0, i - 1), _weight(rng)) for i in range(1, n))
+    graph.add_edges((u, v, _weight(rng)) for u, v in gnp_pairs(n, extra_prob, rng))
+    return graph
+
+
+def grid(rows, cols, rng=None, spacing=10.0, graph=None):
+    """Grade rows x cols com vizinhança 4, pesos 1..10 (inteiros) e posições espaçadas."""
+    rng = rng or random
+    graph = _graph(graph, rows * cols)
+    pos = graph.positions
+    for r in range(rows):
+        for c in range(cols):
+            pos[r * cols + c] = (c * spacing, r * spacing)
+    graph.layout_version += 1
+
+    def edges():
+        randint = rng.randint
+        for r in range(rows):
+            base = r * cols
+            for c in range(cols):
+                u = base + c
+                if c + 1 < cols:
+                    yield u, u + 1, float(randint(1, 10))
+                if r + 1 < rows:
+                    yield u, u + cols, float(randint(1, 10))
+    graph.add_edges(edges())
+    return graph
+
+
+def _scatter(graph, n, size, rng):
+    rnd = rng.random
+    pos = graph.positions
+    for u in range(n):
+        pos[u] = (rnd() * size, rnd() * size)
+    graph.layout_version += 1
+    return pos
+
+
+def random_geometric(n, avg_degree=6, size=1000.0, rng=None, graph=None):
+    """n pontos uniformes no quadrado size x size, ligados quando a distância é menor que o
+    raio que dá o grau médio pedido. Peso = distância (uma casa decimal, mínimo 0.1)."""
+    rng = rng or random
+    graph = _graph(graph, n)
+    pos = _scatter(graph, n, size, rng)
+    radius = size * math.sqrt(avg_degree / (math.pi * max(n, 1)))
+    cells = {}
+    for u, (x, y) in pos.items():
+        cells.setdefault((int(x // radius), int(y // radius)), []).append(u)
+
+    def edges():
+        hypot = math.hypot
+        for (cx, cy), members in cells.items():
+            for dx in (-1, 0, 1):
+                for dy in (-1, 0, 1):
+                    other = cells.get((cx + dx, cy + dy))
+                    if not other:
+                        continue
+                    for u in members:
+                        ux, uy = pos[u]
+                        for v in other:
+                            if v <= u:
+                                continue
+                            vx, vy = pos[v]
+                            d = hypot(ux - vx, uy - vy)
+                            if d < radius:
+                                yield u, v, round(d, 1) or 0.1
+    graph.add_edges(edges())
+    return graph
+
+
+def scale_free(n, m=2, size=1000.0, rng=None, graph=None):
+    """Barabási-Albert: cada novo nó liga-se a m nós existentes com probabilidade proporcional
+    ao grau (sorteio na lista de extremidades). Posições uniformes, peso = distância."""
+    rng = rng or random
+    graph = _graph(graph, n)
+    pos = _scatter(graph, n, size, rng)
+    m = max(1, min(m, n - 1)) if n > 1 else 0
+    ends = list(range(m))   # cada nó aparece uma vez por aresta incidente (+ sementes)
+
+    def edges():
+        hypot = math.hypot
+        rnd = rng.random
+        for u in range(m, n):
+            chosen = set()
+            while len(chosen) < m:
+                chosen.add(ends[int(rnd() * len(ends))])
+            ux, uy = pos[u]
+            for v in chosen:
+                vx, vy = pos[v]
+                ends.append(v)
+                ends.append(u)
+                yield u, v, round(hypot(ux - vx, uy - vy), 1) or 0.1
+    graph.add_edges(edges())
+    return graph
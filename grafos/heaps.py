@@ -0,0 +1,39 @@
+"""Filas de prioridade usadas pelos algoritmos de caminho mínimo."""
+
+
+class RadixHeap:
+    """Fila de prioridade monótona para chaves inteiras não negativas (radix heap).
+    Cada chave vai para o balde do bit mais alto em que difere do último mínimo extraído;
+    push/pop custam O(log C) amortizado, C = maior peso de aresta."""
+
+    def __init__(self):
+        self.last = 0
+        self.size = 0
+        self.buckets = [[] for _ in range(65)]
+
+    def __len__(self):
+        return self.size
+
+    def push(self, key, item):
+        if key < self.last:
+            raise ValueError("RadixHeap exige chaves monótonas (não decrescentes).")
+        self.buckets[(key ^ self.last).bit_length()].append((key, item))
+        self.size += 1
+
+    def pop(self):
+        if not self.size:
+            raise IndexError("pop de RadixHeap vazio")
+        buckets = self.buckets
+        if not buckets[0]:
+            # achar o primeiro balde não vazio e redistribuir a partir do seu mínimo
+            i = 1
+            while not buckets[i]:
+                i += 1
+            moved = buckets[i]
+            buckets[i] = []
+            self.last = min(key for key, _ in moved)
+            last = self.last
+            for key, item in moved:
+                buckets[(key ^ last).bit_length()].append((key, item))
+        self.size -= 1
+        return buckets[0].pop()
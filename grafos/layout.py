@@ -0,0 +1,245 @@
+"""Layouts para grafos grandes (sem dependências além da stdlib).
+
+- poisson_disk: amostragem de Bridson sobre uma grade hash de células r/√2 (no máximo um
+  ponto por célula). Cada candidato só é comparado com as 21 células vizinhas e a amostragem
+  nunca usa espaçamento menor que o necessário para n pontos, então o custo é O(n) e toda
+  dupla de pontos fica a pelo menos `min_dist` — sem a busca O(n²) por tentativa e erro nem o
+  "aceita sobreposto" quando as tentativas acabam;
+- force_directed: Fruchterman-Reingold com repulsão aproximada por uma quadtree de Barnes-Hut
+  (células distantes contam como um ponto no centro de massa): O(n log n + m) por iteração.
+"""
+
+import math
+import random
+
+# candidatos em volta de cada ponto ativo antes de descartá-lo. Variante de Roberts: em vez de
+# sortear no anel [r, 2r] (Bridson usa 30), os candidatos ficam logo além de r, igualmente
+# espaçados a partir de um ângulo sorteado — empacota mais e testa bem menos
+POISSON_TRIES = 8
+# pontos * r² / área ao fim da amostragem (medido: ~0.78); usado para escolher min_dist
+# quando não é informado, com folga para sobrar pontos a sortear
+POISSON_DENSITY = 0.7
+# profundidade máxima da quadtree (pontos coincidentes param aqui, numa folha só)
+MAX_DEPTH = 32
+
+
+# ============================================================
+# POISSON DISK (BRIDSON)
+# ============================================================
+
+def poisson_disk(n, width, height, min_dist=None, rng=None, margin=0.0):
+    """n pontos em [margin, width - margin] x [margin, height - margin], quaisquer dois a pelo
+    menos min_dist. Amostra com o maior espaçamento que comporta os n pontos quando ele passa de
+    min_dist (ou min_dist=None): os pontos cobrem a área toda e o custo fica O(n), sem amostrar
+    O(área / min_dist²) pontos para descartar quase todos. min_dist só é reduzido se n pontos não
+    cabem com ele. Retorna (pontos, espaçamento garantido)."""
+    rng = rng or random
+    if n <= 0:
+        return [], min_dist or 0.0
+    w = max(width - 2 * margin, 1.0)
+    h = max(height - 2 * margin, 1.0)
+    fit = math.sqrt(POISSON_DENSITY * w * h / n)
+    r = fit if min_dist is None else max(min_dist, fit)
+    while True:
+        points = _bridson(w, h, r, rng)
+        if len(points) >= n:
+            break
+        # não coube: aproxima os pontos e tenta de novo, indo direto para perto de `fit` se
+        # min_dist estava muito acima dele
+        r = min(r * 0.9, fit * 1.25)
+    # a amostragem cobre a área inteira crescendo a partir de um ponto; sortear n deles mantém
+    # a cobertura uniforme e desfaz a correlação entre índice e posição
+    points = rng.sample(points, n)
+    return [(margin + x, margin + y) for x, y in points], r
+
+
+def _bridson(w, h, r, rng):
+    rnd = rng.random
+    cos = math.cos
+    sin = math.sin
+    cell = r / math.sqrt(2)
+    gw = int(w / cell) + 1
+    gh = int(h / cell) + 1
+    grid = [-1] * (gw * gh)   # índice do ponto na célula, -1 = vazia
+    xs = []
+    ys = []
+    r2 = r * r
+    ring = r * (1 + 1e-7)
+    step = 2 * math.pi / POISSON_TRIES
+    # células que podem conter um ponto a menos de r (5x5 sem os cantos), as mais próximas antes
+    near = sorted(((dx, dy) for dy in range(-2, 3) for dx in range(-2, 3)
+                   if abs(dx) + abs(dy) < 4), key=lambda o: abs(o[0]) + abs(o[1]))
+
+    x = rnd() * w
+    y = rnd() * h
+    grid[int(y / cell) * gw + int(x / cell)] = 0
+    xs.append(x)
+    ys.append(y)
+    active = [0]
+    while active:
+        slot = int(rnd() * len(active))
+        i = active[slot]
+        px = xs[i]
+        py = ys[i]
+        a0 = rnd() * 2 * math.pi
+        for t in range(POISSON_TRIES):
+            a = a0 + t * step
+            x = px + ring * cos(a)
+            y = py + ring * sin(a)
+            if not (0.0 <= x < w and 0.0 <= y < h):
+                continue
+            gx = int(x / cell)
+            gy = int(y / cell)
+            ok = True
+            for dx, dy in near:
+                cx = gx + dx
+                cy = gy + dy
+                if 0 <= cx < gw and 0 <= cy < gh:
+                    j = grid[cy * gw + cx]
+                    if j >= 0:
+                        ex = xs[j] - x
+                        ey = ys[j] - y
+                        if ex * ex + ey * ey < r2:
+                            ok = False
+                            break
+            if ok:
+                grid[gy * gw + gx] = len(xs)
+                active.append(len(xs))
+                xs.append(x)
+                ys.append(y)
+                break
+        else:
+            # nenhum candidato coube: o ponto sai da lista ativa (troca com o último, O(1))
+            active[slot] = active[-1]
+            active.pop()
+    return list(zip(xs, ys))
+
+
+# ============================================================
+# FORCE-DIRECTED (BARNES-HUT)
+# ============================================================
+
+class _QuadTree:
+    """Quadtree em listas paralelas: por célula, centro de massa, massa, lado e filhos (ou os
+    pontos, nas folhas)."""
+
+    def __init__(self, xs, ys):
+        self.cx = []
+        self.cy = []
+        self.mass = []
+        self.side = []
+        self.children = []   # tupla de células filhas, ou None nas folhas
+        self.points = []     # pontos da folha (None nas células internas)
+        x0, x1 = min(xs), max(xs)
+        y0, y1 = min(ys), max(ys)
+        side = max(x1 - x0, y1 - y0, 1e-9)
+        self._build(list(range(len(xs))), xs, ys, x0, y0, side, 0)
+
+    def _build(self, ids, xs, ys, x0, y0, side, depth):
+        k = len(self.mass)
+        self.cx.append(sum(xs[i] for i in ids) / len(ids))
+        self.cy.append(sum(ys[i] for i in ids) / len(ids))
+        self.mass.append(len(ids))
+        self.side.append(side)
+        self.children.append(None)
+        self.points.append(None)
+        if len(ids) == 1 or depth >= MAX_DEPTH:
+            self.points[k] = ids
+            return k
+        half = side / 2
+        mx = x0 + half
+        my = y0 + half
+        quads = ([], [], [], [])
+        for i in ids:
+            quads[(xs[i] >= mx) + 2 * (ys[i] >= my)].append(i)
+        kids = []
+        for q, sub in enumerate(quads):
+            if sub:
+                kids.append(self._build(sub, xs, ys, mx if q & 1 else x0, my if q & 2 else y0,
+                                        half, depth + 1))
+        self.children[k] = tuple(kids)
+        return k
+
+
+def force_directed(nodes, edges, positions, size, iterations=50, theta=0.9, rng=None):
+    """Fruchterman-Reingold com Barnes-Hut. `nodes` em ordem, `edges` pares (u, v) e
+    `positions` as posições iniciais (nós sem posição são sorteados). Pesos não entram: o
+    objetivo é legibilidade. Retorna {nó: (x, y)} em [0, size] x [0, size], sem reescalar."""
+    rng = rng or random
+    nodes = list(nodes)
+    n = len(nodes)
+    if n == 0:
+        return {}
+    index = {u: i for i, u in enumerate(nodes)}
+    xs = []
+    ys = []
+    for u in nodes:
+        p = positions.get(u)
+        if p is None:
+            p = (rng.random() * size, rng.random() * size)
+        xs.append(float(p[0]))
+        ys.append(float(p[1]))
+    pairs = [(index[u], index[v]) for u, v in edges if u != v]
+    k = size / math.sqrt(n)   # distância "ideal" entre vizinhos
+    k2 = k * k
+    theta2 = theta * theta
+    t = size / 10
+    cool = t / (iterations + 1)
+    for _ in range(iterations):
+        tree = _QuadTree(xs, ys)
+        cx, cy, mass, side = tree.cx, tree.cy, tree.mass, tree.side
+        children, leaf = tree.children, tree.points
+        fx = [0.0] * n
+        fy = [0.0] * n
+        # repulsão k²/d: células com side²/d² < theta² contam como um ponto de massa `mass`
+        for i in range(n):
+            xi = xs[i]
+            yi = ys[i]
+            sx = sy = 0.0
+            stack = [0]
+            while stack:
+                c = stack.pop()
+                dx = xi - cx[c]
+                dy = yi - cy[c]
+                d2 = dx * dx + dy * dy
+                kids = children[c]
+                if kids is None:
+                    for j in leaf[c]:
+                        if j != i:
+                            dx = xi - xs[j]
+                            dy = yi - ys[j]
+                            d2 = dx * dx + dy * dy
+                            if d2 < 1e-9:
+                                # pontos coincidentes: empurrão numa direção sorteada
+                                dx = rng.random() - 0.5
+                                dy = rng.random() - 0.5
+                                d2 = dx * dx + dy * dy + 1e-9
+                            f = k2 / d2
+                            sx += dx * f
+                            sy += dy * f
+                elif side[c] * side[c] < theta2 * d2:
+                    f = k2 * mass[c] / d2
+                    sx += dx * f
+                    sy += dy * f
+                else:
+                    stack.extend(kids)
+            fx[i] = sx
+            fy[i] = sy
+        # atração d²/k ao longo das arestas
+        for i, j in pairs:
+            dx = xs[i] - xs[j]
+            dy = ys[i] - ys[j]
+            f = math.sqrt(dx * dx + dy * dy) / k
+            fx[i] -= dx * f
+            fy[i] -= dy * f
+            fx[j] += dx * f
+            fy[j] += dy * f
+        # desloca no máximo t (temperatura), que esfria a cada iteração
+        for i in range(n):
+            f = math.hypot(fx[i], fy[i])
+            if f > 0:
+                step = min(f, t) / f
+                xs[i] = min(size, max(0.0, xs[i] + fx[i] * step))
+                ys[i] = min(size, max(0.0, ys[i] + fy[i] * step))
+        t -= cool
+    return {u: (xs[i], ys[i]) for i, u in enumerate(nodes)}
@@ -0,0 +1,111 @@
+"""Matriz de distâncias muitos-para-muitos (depósitos x clientes) em paralelo.
+
+As origens são divididas em lotes e distribuídas num ProcessPoolExecutor. O grafo vai para
+os workers uma única vez, por memória compartilhada: os três arrays do CSR são copiados para
+blocos multiprocessing.shared_memory e cada worker os anexa no initializer (memoryview sobre
+o mesmo buffer), sem pickle do grafo por tarefa. Cada busca para assim que todos os destinos
+pedidos foram fixados.
+
+O resultado é uma lista de linhas array('d') (len(sources) x len(targets)), inf onde não há
+caminho.
+"""
+
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from .csr import CSRGraph
+from .shortest_path import dijkstra_csr
+
+# CSR anexado à memória compartilhada dentro de cada worker (ver _init_worker)
+_worker_csr = None
+_worker_blocks = []
+
+
+class SharedCSR:
+    """Copia os arrays de um CSRGraph para memória compartilhada. Use como context manager:
+    ao sair, os blocos são liberados (unlink)."""
+
+    def __init__(self, csr):
+        self.blocks = []
+        self.meta = []
+        for arr in (csr.offsets, csr.targets, csr.weights):
+            raw = memoryview(arr).cast("B")
+            shm = shared_memory.SharedMemory(create=True, size=max(1, len(raw)))
+            shm.buf[:len(raw)] = raw
+            self.blocks.append(shm)
+            self.meta.append((shm.name, arr.typecode, len(arr)))
+
+    def close(self):
+        for shm in self.blocks:
+            shm.close()
+            shm.unlink()
+        self.blocks = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def attach_csr(meta):
+    """Reconstrói um CSRGraph (somente leitura) sobre os blocos descritos por SharedCSR.meta.
+    Retorna (csr, blocos); os blocos precisam continuar vivos enquanto o csr for usado."""
+    arrays = []
+    blocks = []
+    for name, typecode, length in meta:
+        shm = shared_memory.SharedMemory(name=name)
+        itemsize = array(typecode).itemsize
+        arrays.append(shm.buf[:length * itemsize].cast(typecode))
+        blocks.append(shm)
+    return CSRGraph(*arrays), blocks
+
+
+def _init_worker(meta):
+    global _worker_csr, _worker_blocks
+    _worker_csr, _worker_blocks = attach_csr(meta)
+
+
+def _rows(csr, sources, targets):
+    stop = set(targets)
+    rows = []
+    for s in sources:
+        dist, _ = dijkstra_csr(csr, s, targets=stop - {s} or None)
+        rows.append(array("d", [dist[t] for t in targets]))
+    return rows
+
+
+def _worker_rows(sources, targets):
+    return _rows(_worker_csr, sources, targets)
+
+
+def many_to_many(graph, sources, targets, workers=None, batch_size=None):
+    """Distâncias de caminho mínimo de cada nó em `sources` para cada nó em `targets`.
+    `graph` pode ser GraphModel, CSRGraph ou adj {u: {v: w}}. workers=1 roda no processo
+    atual; None usa os.cpu_count(). Retorna lista de linhas array('d')."""
+    if hasattr(graph, "csr"):
+        csr = graph.csr()
+    elif isinstance(graph, CSRGraph):
+        csr = graph
+    else:
+        csr = CSRGraph.from_adj(graph)
+    src_idx = [csr.node_index(s) for s in sources]
+    tgt_idx = [csr.node_index(t) for t in targets]
+
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(src_idx) <= 1:
+        return _rows(csr, src_idx, tgt_idx)
+
+    # lotes pequenos o bastante para balancear a carga entre os workers
+    batch_size = batch_size or max(1, len(src_idx) // (workers * 4))
+    batches = [src_idx[i:i + batch_size] for i in range(0, len(src_idx), batch_size)]
+    with SharedCSR(csr) as shared:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(shared.meta,)) as pool:
+            futures = [pool.submit(_worker_rows, batch, tgt_idx) for batch in batches]
+            rows = []
+            for f in futures:
+                rows.extend(f.result())
+    return rows
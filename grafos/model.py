@@ -0,0 +1,587 @@
+"""Modelo do grafo de entregas, independente da interface gráfica.
+
+GraphModel guarda a lista de adjacência e as posições dos nós e oferece as operações de
+roteamento (Dijkstra, rota com vários destinos, simulação de falha) e de geração aleatória,
+sem depender de tkinter ou PIL — pode rodar em servidores e benchmarks sem display.
+
+Edições devem passar por add_edge/remove_edge/reset: elas incrementam `version`, que invalida
+as estruturas derivadas (como o CSR usado pelo Dijkstra).
+"""
+
+import math
+import os
+import random
+import time
+
+from .cache import RouteCache
+from .ch import ContractionHierarchy, graph_fingerprint
+from .csr import CSRGraph
+from .dynamic import DynamicSPT
+from .layout import force_directed, poisson_disk
+from .resilience import resilience_sweep
+from .search import (Landmarks, astar, bidirectional_dijkstra, euclidean_heuristic,
+                     min_cost_per_unit, reverse_adj)
+from .shortest_path import dijkstra, dijkstra_csr, reconstruct_path
+from .spatial import SpatialIndex
+from .timedep import earliest_arrival
+from .tsp import distance_matrix, optimize_order, route_cost
+from .vrp import solve_vrp
+
+
+# paradas x nós a partir do qual plan_fleet monta a matriz no pool de processos por padrão
+# (~5 s de buscas seriais; abaixo disso o custo de subir os workers não compensa)
+FLEET_POOL_WORK = 1_000_000
+
+
+class RouteError(ValueError):
+    """Erro de roteamento (destino inalcançável, caminho inválido...)."""
+
+
+class GraphModel:
+    def __init__(self, directed=False):
+        self.directed = directed
+        self.n_nodes = 0
+        self.positions = {}
+        self.adj = {}
+        # ids originais dos nós quando o grafo veio de arquivo (labels[i] = id do nó i)
+        self.labels = None
+        # incrementado a cada edição; invalida estruturas derivadas (CSR, caches...)
+        self.version = 0
+        # idem para as posições (layouts e arrasto de nós)
+        self.layout_version = 0
+        self._csr = None
+        self._csr_version = -1
+        # índice espacial (seleção/recorte na interface) e o estado do grafo para o qual vale
+        self._spatial = None
+        self._spatial_key = None
+        # estatísticas do roteamento em lote (find_shortest_path)
+        self.last_route_stats = {"legs": 0, "searches": 0, "saved": 0}
+        self.searches_saved = 0
+        # árvores completas por origem, invalidadas de forma precisa pelas edições
+        self.route_cache = RouteCache()
+        self._searches = 0
+        # pré-processamento das buscas ponto a ponto: (versão, dado)
+        self._p2p = {}
+        # Contraction Hierarchy e a versão do grafo para a qual ela vale (None = desatualizada)
+        self.hierarchy = None
+        self._hierarchy_version = None
+        self.last_ch_fallback = False
+        # rota mantida para reparo incremental após falhas (ver reroute_after_failure)
+        self._route = None
+        self.last_reroute = {"legs": 0, "recomputed": [], "affected": 0, "rebuilt": False}
+        # tempos de viagem por horário (grafos.timedep.TravelTimes); None = só pesos estáticos
+        self.travel_times = None
+        # horário de chegada a cada destino da última rota com partida (find_shortest_path(depart=...))
+        self.last_arrivals = []
+        # resumo do último plano de frota (plan_fleet)
+        self.last_fleet_stats = {"trucks": 0, "loads": [], "cost": 0.0, "matrix_seconds": 0.0,
+                                 "workers": 1, "seconds": 0.0}
+
+    # ============================================================
+    # NÓS E ARESTAS
+    # ============================================================
+
+    def reset(self, n=0):
+        """Limpa o grafo e cria n nós isolados (0..n-1)."""
+        self.positions.clear()
+        self.adj.clear()
+        self.labels = None
+        self.travel_times = None
+        self.route_cache.clear()
+        self.version += 1
+        self.layout_version += 1
+        self.n_nodes = n
+        for i in range(n):
+            self.adj[i] = {}
+
+    def edge_key(self, u, v):
+        """Chave canônica da aresta: (u, v) se direcionado, par ordenado caso contrário."""
+        return (u, v) if self.directed else tuple(sorted((u, v)))
+
+    def add_edge(self, u, v, w):
+        # Não permitir arestas que liguem um nó a si mesmo (self-loop)
+        if u == v:
+            raise ValueError("Arestas que ligam um nó a si mesmo não são permitidas.")
+        current = self._spatial_current()
+        self._set_weight(u, v, w)
+        if not self.directed:
+            self._set_weight(v, u, w)
+        self.version += 1
+        if current:
+            self._spatial.add_edge(u, v)
+            self._spatial_key = self._spatial_state()
+
+    def add_edges(self, edges):
+        """Adiciona arestas (u, v, w) em lote (os nós já devem existir). Ignora laços, limpa o
+        cache de rotas uma vez e incrementa a versão uma vez. Retorna quantas foram lidas."""
+        adj = self.adj
+        count = 0
+        if self.directed:
+            for u, v, w in edges:
+                if u != v:
+                    adj[u][v] = w
+                    count += 1
+        else:
+            for u, v, w in edges:
+                if u != v:
+                    adj[u][v] = w
+                    adj[v][u] = w
+                    count += 1
+        self.route_cache.clear()
+        self.version += 1
+        return count
+
+    def _set_weight(self, u, v, w):
+        # w=None remove a aresta; o cache descarta só as árvores afetadas
+        old = self.adj[u].get(v)
+        if w is None:
+            del self.adj[u][v]
+        else:
+            self.adj[u][v] = w
+        self.route_cache.edge_changed(u, v, old, w)
+
+    def remove_edge(self, u, v):
+        """Remove a aresta u-v (e v-u se não direcionado). Retorna True se u->v existia."""
+        current = self._spatial_current()
+        removed = False
+        if v in self.adj.get(u, {}):
+            self._set_weight(u, v, None)
+            removed = True
+        if not self.directed and u in self.adj.get(v, {}):
+            self._set_weight(v, u, None)
+        if self.travel_times is not None:
+            self.travel_times.discard(u, v)
+            if not self.directed:
+                self.travel_times.discard(v, u)
+        self.version += 1
+        if current:
+            self._spatial.remove_edge(u, v)
+            self._spatial_key = self._spatial_state()
+        return removed
+
+    def move_node(self, node, x, y):
+        """Atualiza a posição de um nó (ex.: arrasto na interface)."""
+        current = self._spatial_current()
+        self.positions[node] = (x, y)
+        self.layout_version += 1
+        if current:
+            self._spatial.move_node(node, x, y)
+            self._spatial_key = self._spatial_state()
+
+    def spatial_index(self):
+        """SpatialIndex de nós e arestas. Reconstruído após layouts e edições em massa;
+        add_edge, remove_edge e move_node o mantêm em dia incrementalmente."""
+        if not self._spatial_current():
+            self._spatial = SpatialIndex(self.positions, self.adj, self.directed)
+            self._spatial_key = self._spatial_state()
+        return self._spatial
+
+    def _spatial_state(self):
+        return self.version, self.layout_version, self.directed
+
+    def _spatial_current(self):
+        return self._spatial is not None and self._spatial_key == self._spatial_state()
+
+    def edges(self):
+        """Itera (u, v, w) uma vez por aresta (em grafos não direcionados apenas u < v)."""
+        for u, nbrs in self.adj.items():
+            for v, w in nbrs.items():
+                if not self.directed and v < u:
+                    continue
+                yield u, v, w
+
+    # ============================================================
+    # LAYOUTS
+    # ============================================================
+
+    def generate_circle_layout(self, size):
+        R = size / 2 - 60
+        cx = cy = size / 2
+
+        for i in range(self.n_nodes):
+            ang = 2 * math.pi * i / self.n_nodes
+            x = cx + R * math.cos(ang)
+            y = cy + R * math.sin(ang)
+            self.positions[i] = (x, y)
+        self.layout_version += 1
+
+    def generate_random_layout(self, size, node_radius=20, rng=None):
+        """Posições aleatórias sem sobreposição (Poisson disk, O(n)): nós a pelo menos
+        max(20, 4 * node_radius) uns dos outros, distância reduzida só se os n nós não couberem
+        em size x size."""
+        min_dist = max(20, 4 * node_radius)
+        points, _ = poisson_disk(self.n_nodes, size, size, min_dist=min_dist, rng=rng, margin=40)
+        for i, pos in enumerate(points):
+            self.positions[i] = pos
+        self.layout_version += 1
+
+    def generate_force_layout(self, size, iterations=50, rng=None, margin=40):
+        """Layout por forças (Fruchterman-Reingold + Barnes-Hut) partindo das posições atuais:
+        vizinhos se aproximam, o resto se repele. Chamar de novo refina o resultado."""
+        inner = size - 2 * margin
+        start = {u: (x - margin, y - margin) for u, (x, y) in self.positions.items()}
+        pairs = [(u, v) for u, v, _ in self.edges()]
+        placed = force_directed(range(self.n_nodes), pairs, start, inner, iterations, rng=rng)
+        for u, (x, y) in placed.items():
+            self.positions[u] = (margin + x, margin + y)
+        self.layout_version += 1
+
+    def fit_layout(self, size, margin=40):
+        """Reescala as posições atuais (ex.: coordenadas lidas de arquivo) para caber em size x size."""
+        if not self.positions:
+            return
+        xs = [x for x, _ in self.positions.values()]
+        ys = [y for _, y in self.positions.values()]
+        x0, y0 = min(xs), min(ys)
+        span = max(max(xs) - x0, max(ys) - y0) or 1.0
+        scale = (size - 2 * margin) / span
+        for i, (x, y) in self.positions.items():
+            # y invertido: no canvas o eixo cresce para baixo
+            self.positions[i] = (margin + (x - x0) * scale, size - margin - (y - y0) * scale)
+        self.layout_version += 1
+
+    # ============================================================
+    # DIJKSTRA E ROTAS
+    # ============================================================
+
+    def csr(self):
+        """Versão CSR (compacta, imutável) do grafo; reconstruída só quando houve edição."""
+        if self._csr is None or self._csr_version != self.version:
+            self._csr = CSRGraph.from_adj(self.adj)
+            self._csr_version = self.version
+        return self._csr
+
+    def dijkstra(self, src, target=None, heap="binary", targets=None):
+        """Ver grafos.shortest_path.dijkstra. Retorna (dist, prev).
+        Roda direto sobre os dicts de adj: quem devolve dicts não ganha nada com o CSR (que
+        teria de ser reconstruído após cada edição e convertido de volta). O CSR (csr()) fica
+        para o trabalho em lote por índices, como grafos.matrix e dijkstra_csr."""
+        return dijkstra(self.adj, src, target=target, heap=heap, targets=targets)
+
+    def shortest_path_tree(self, src):
+        """Árvore completa (dist, prev) a partir de src, servida pelo route_cache quando possível.
+        Os dicts retornados são compartilhados com o cache: não devem ser alterados."""
+        tree = self.route_cache.get(src)
+        if tree is None:
+            tree = self.dijkstra(src)
+            self.route_cache.put(src, *tree)
+            self._searches += 1
+        return tree
+
+    def shortest_path_trees(self, legs, batch=True, use_cache=False):
+        """Calcula as árvores (dist, prev) necessárias para os trechos [(origem, destino), ...].
+        Em lote, cada origem distinta é buscada uma única vez, com parada múltipla quando todos
+        os seus destinos pendentes foram fixados. Com use_cache=True usa árvores completas do
+        route_cache (falhas calculam e guardam a árvore inteira). Retorna {origem: (dist, prev)}
+        (batch=True) ou uma lista alinhada com legs (batch=False)."""
+        self._searches = 0
+        if not batch:
+            trees = [self.dijkstra(s, target=t) for s, t in legs]
+            self._record_route_stats(len(legs), len(legs))
+            return trees
+        pending = {}
+        for s, t in legs:
+            pending.setdefault(s, set()).add(t)
+        if use_cache:
+            trees = {s: self.shortest_path_tree(s) for s in pending}
+            self._record_route_stats(len(legs), self._searches)
+        else:
+            trees = {s: self.dijkstra(s, targets=ts) for s, ts in pending.items()}
+            self._record_route_stats(len(legs), len(trees))
+        return trees
+
+    def _record_route_stats(self, legs, searches):
+        saved = legs - searches
+        self.last_route_stats = {"legs": legs, "searches": searches, "saved": saved}
+        self.searches_saved += saved
+
+    def find_shortest_path(self, src, dests, batch=True, dynamic=False, use_cache=False, depart=None):
+        """Percorre os destinos na ordem dada: src->d1, d1->d2, ...
+        Retorna (caminho_total, distancia_total); levanta RouteError se algum trecho for inalcançável.
+        Com batch=True as origens repetidas são buscadas uma só vez (ver shortest_path_trees).
+        Com dynamic=True guarda uma árvore completa por origem, reparável após falhas (sempre
+        partindo do route_cache).
+        Com depart (minuto do dia) usa travel_times: cada trecho parte no horário de chegada do
+        anterior; a "distância" vira o tempo total e last_arrivals guarda a chegada a cada destino."""
+        legs = self._legs(src, dests)
+        if depart is not None:
+            return self._timed_route(legs, depart)
+        if dynamic:
+            trees = self._build_dynamic_route(src, dests, legs)
+            return self._assemble_route(legs, lambda k, s: (trees[s].dist, trees[s].prev))
+        trees = self.shortest_path_trees(legs, batch=batch, use_cache=use_cache)
+        if batch:
+            return self._assemble_route(legs, lambda k, s: trees[s])
+        return self._assemble_route(legs, lambda k, s: trees[k])
+
+    def earliest_arrival(self, src, depart, target=None):
+        """Ver grafos.timedep.earliest_arrival (com self.travel_times). Retorna (arrival, prev)."""
+        return earliest_arrival(self.adj, src, depart, self.travel_times, target=target)
+
+    def _timed_route(self, legs, depart):
+        # árvores dependem do horário de saída de cada trecho: uma busca por trecho, sem cache
+        self.last_arrivals = []
+        t = depart
+        total_path = []
+        for cur_start, dest in legs:
+            arrival, prev = self.earliest_arrival(cur_start, t, target=dest)
+            if dest not in arrival:
+                raise RouteError(f"Destino {dest} não alcançável a partir de {cur_start}.")
+            seg = reconstruct_path(prev, cur_start, dest)
+            if total_path and total_path[-1] == seg[0]:
+                total_path.pop()
+            total_path.extend(seg)
+            t = arrival[dest]
+            self.last_arrivals.append(t)
+        self._record_route_stats(len(legs), len(legs))
+        return total_path, t - depart
+
+    def _legs(self, src, dests):
+        return list(zip([src] + list(dests[:-1]), dests))
+
+    def _build_dynamic_route(self, src, dests, legs):
+        self._searches = 0
+        trees = {}
+        for s, _ in legs:
+            if s not in trees:
+                trees[s] = DynamicSPT(self.adj, s, self.directed, tree=self.shortest_path_tree(s))
+        self._route = {"key": (src, tuple(dests)), "trees": trees, "version": self.version}
+        self._record_route_stats(len(legs), self._searches)
+        return trees
+
+    def _assemble_route(self, legs, tree_of):
+        """Concatena os trechos usando tree_of(k, origem) -> (dist, prev)."""
+        total_path = []
+        total_dist = 0.0
+        for k, (cur_start, dest) in enumerate(legs):
+            dist, prev = tree_of(k, cur_start)
+            if dest not in dist or dist[dest] == float("inf"):
+                raise RouteError(f"Destino {dest} não alcançável a partir de {cur_start}.")
+            # reconstruir segmento
+            seg = reconstruct_path(prev, cur_start, dest)
+            if seg is None:
+                raise RouteError("Erro ao reconstruir caminho.")
+            # concatenar sem duplicar o nó de ligação
+            if total_path and total_path[-1] == seg[0]:
+                total_path.pop()
+            total_path.extend(seg)
+            total_dist += dist[dest]
+        return total_path, total_dist
+
+    def plan_fleet(self, src, stops, capacity, demands=None, return_to_depot=True, time_limit=None,
+                   workers=None):
+        """Divide as paradas entre caminhões saindo de src com carga máxima `capacity` (CVRP,
+        ver grafos.vrp). demands = {parada: demanda} (padrão 1 por parada). Retorna a lista de
+        caminhos completos no grafo, um por caminhão; last_fleet_stats traz cargas e custo.
+
+        A matriz de distâncias domina o custo: uma busca com parada múltipla por parada, que
+        quase sempre percorre o grafo inteiro quando as paradas se espalham por ele. Medido num
+        núcleo: 1000 paradas num grafo de 20k nós levam ~100 s, quase tudo na matriz. Com
+        workers=1 os predecessores dessas buscas (4 bytes x nós x paradas) reconstroem os
+        trechos sem buscar de novo. Com workers > 1 a matriz vem de grafos.matrix.many_to_many
+        (pool de processos) e cada trecho usado sai de uma busca ponto a ponto, curta porque
+        liga paradas vizinhas. workers=None usa o pool com os.cpu_count() workers quando
+        paradas x nós passa de FLEET_POOL_WORK, e o processo atual abaixo disso."""
+        t0 = time.perf_counter()
+        stops = [d for d in dict.fromkeys(stops) if d != src]
+        nodes = [src] + stops
+        csr = self.csr()
+        idx = [csr.node_index(x) for x in nodes]
+        if workers is None:
+            workers = (os.cpu_count() or 1) if len(nodes) * len(csr) >= FLEET_POOL_WORK else 1
+        if workers > 1:
+            from .matrix import many_to_many   # multiprocessing só quando usado
+            D = [list(row) for row in many_to_many(csr, idx, idx, workers=workers)]
+            prevs = None
+        else:
+            wanted = set(idx)
+            D = []
+            prevs = []
+            for s in idx:
+                dist, prev = dijkstra_csr(csr, s, targets=wanted - {s} or None)
+                D.append([dist[t] for t in idx])
+                prevs.append(prev)
+        t_matrix = time.perf_counter() - t0
+        dem = [0] + [demands.get(s, 1) if demands else 1 for s in stops]
+        try:
+            routes, cost = solve_vrp(D, dem, capacity, return_to_depot, time_limit=time_limit)
+        except ValueError as e:
+            raise RouteError(str(e)) from e
+        paths = []
+        for route in routes:
+            order = [0] + route + ([0] if return_to_depot else [])
+            path = [src]
+            for a, b in zip(order, order[1:]):
+                if D[a][b] == float("inf"):
+                    raise RouteError(f"Destino {nodes[b]} não alcançável a partir de {nodes[a]}.")
+                prev = prevs[a] if prevs is not None else dijkstra_csr(csr, idx[a], target=idx[b])[1]
+                seg = []
+                c = idx[b]
+                while c != idx[a]:
+                    seg.append(csr.node_id(c))
+                    c = prev[c]
+                path.extend(reversed(seg))
+            paths.append(path)
+        self.last_fleet_stats = {
+            "trucks": len(routes),
+            "loads": [sum(dem[i] for i in route) for route in routes],
+            "cost": cost,
+            "matrix_seconds": t_matrix,
+            "workers": workers,
+            "seconds": time.perf_counter() - t0,
+        }
+        return paths
+
+    def optimize_delivery_order(self, src, dests, exact_limit=15):
+        """Reordena os destinos para minimizar a distância total da rota src->d1->d2->...
+        Usa a matriz de caminhos mínimos entre origem e destinos (ver grafos.tsp).
+        Retorna (destinos_ordenados, custo_antes, custo_depois)."""
+        stops = [d for d in dict.fromkeys(dests) if d != src]
+        nodes = [src] + stops
+        D = distance_matrix(self, nodes)
+        before = route_cost(list(range(len(nodes))), D)
+        order, after = optimize_order(D, exact_limit=exact_limit)
+        return [nodes[i] for i in order[1:]], before, after
+
+    # ============================================================
+    # FALHA E ROTA ALTERNATIVA
+    # ============================================================
+
+    def simulate_failure(self, path, rng=None):
+        """Remove uma aresta aleatória do caminho. Retorna (u, v, removida)."""
+        if not path or len(path) < 2:
+            raise RouteError("Calcule primeiro o caminho.")
+        rng = rng or random
+        idx = rng.randint(0, len(path) - 2)
+        u = path[idx]
+        v = path[idx + 1]
+        return u, v, self.remove_edge(u, v)
+
+    def simulate_failure_and_reroute(self, path, src, dests, rng=None):
+        """Simula a falha de uma aresta do caminho e recalcula a rota (incrementalmente).
+        Retorna (u, v, removida, novo_caminho, nova_distancia)."""
+        version = self.version
+        u, v, removed = self.simulate_failure(path, rng=rng)
+        new_path, total = self.reroute_after_failure(src, dests, u, v, version)
+        return u, v, removed, new_path, total
+
+    def reroute_after_failure(self, src, dests, u, v, version):
+        """Recalcula a rota src->dests depois que a aresta u-v foi removida.
+        `version` é a versão do grafo antes da remoção: se a rota guardada é desse estado, só as
+        árvores que usavam a aresta são reparadas (DynamicSPT); senão todas são reconstruídas.
+        last_reroute informa os índices dos trechos recalculados e quantos nós foram afetados."""
+        legs = self._legs(src, dests)
+        route = self._route
+        if (route is None or route["key"] != (src, tuple(dests))
+                or route["version"] != version or self.version - version > 1):
+            trees = self._build_dynamic_route(src, dests, legs)
+            self.last_reroute = {"legs": len(legs), "recomputed": list(range(len(legs))),
+                                 "affected": len(self.adj), "rebuilt": True}
+        else:
+            trees = route["trees"]
+            affected = {}
+            for s, tree in trees.items():
+                aff = tree.delete_edge(u, v)
+                if not self.directed:
+                    aff |= tree.delete_edge(v, u)
+                affected[s] = aff
+            route["version"] = self.version
+            recomputed = [k for k, (s, t) in enumerate(legs) if t in affected[s]]
+            self.last_reroute = {"legs": len(legs), "recomputed": recomputed,
+                                 "affected": sum(len(a) for a in affected.values()), "rebuilt": False}
+        return self._assemble_route(legs, lambda k, s: (trees[s].dist, trees[s].prev))
+
+    def point_to_point(self, src, dst, method="astar"):
+        """Menor caminho de src a dst explorando só parte do grafo.
+        method: "astar" (posições + custo mínimo por unidade calibrado), "alt" (marcos),
+        "bidirectional" ou "dijkstra" (referência). Retorna (caminho, custo, nós_fixados);
+        levanta RouteError se dst é inalcançável."""
+        if method == "astar":
+            k = self._p2p_data("k", lambda: min_cost_per_unit(self.adj, self.positions), layout=True)
+            cost, path, settled = astar(self.adj, src, dst, euclidean_heuristic(self.positions, dst, k))
+        elif method == "alt":
+            lm = self._p2p_data("alt", lambda: Landmarks(self.adj, directed=self.directed))
+            cost, path, settled = astar(self.adj, src, dst, lm.heuristic(dst))
+        elif method == "bidirectional":
+            radj = self._p2p_data("radj", lambda: reverse_adj(self.adj)) if self.directed else None
+            cost, path, settled = bidirectional_dijkstra(self.adj, src, dst, radj)
+        elif method == "dijkstra":
+            cost, path, settled = astar(self.adj, src, dst)
+        else:
+            raise ValueError(f"método desconhecido: {method!r}")
+        if path is None:
+            raise RouteError(f"Destino {dst} não alcançável a partir de {src}.")
+        return path, cost, settled
+
+    def _p2p_data(self, name, build, layout=False):
+        # recalcula o pré-processamento só quando o grafo (ou o layout, se usado) mudou
+        key = (self.version, self.layout_version if layout else None)
+        cached = self._p2p.get(name)
+        if cached is None or cached[0] != key:
+            cached = self._p2p[name] = (key, build())
+        return cached[1]
+
+    def build_hierarchy(self, witness_limit=60, witness_hops=5):
+        """Pré-processa a Contraction Hierarchy do grafo atual (ver grafos.ch)."""
+        self.hierarchy = ContractionHierarchy.build(self.adj, witness_limit=witness_limit,
+                                                    witness_hops=witness_hops)
+        self._hierarchy_version = self.version
+        return self.hierarchy
+
+    def save_hierarchy(self, path):
+        if self.hierarchy is None:
+            raise ValueError("Nenhuma hierarquia construída.")
+        self.hierarchy.save(path)
+
+    def load_hierarchy(self, path):
+        """Carrega uma hierarquia salva. Ela só é usada se foi construída para este mesmo grafo
+        (mesma impressão digital); retorna True nesse caso."""
+        self.hierarchy = ContractionHierarchy.load(path)
+        valid = self.hierarchy.fingerprint == graph_fingerprint(self.adj)
+        self._hierarchy_version = self.version if valid else None
+        return valid
+
+    def ch_query(self, src, dst):
+        """Menor caminho src -> dst pela hierarquia; se o grafo foi editado desde a construção
+        (ou não há hierarquia), cai no Dijkstra comum. Retorna (caminho, custo)."""
+        if self.hierarchy is not None and self._hierarchy_version == self.version:
+            self.last_ch_fallback = False
+            cost, path = self.hierarchy.query(src, dst)
+        else:
+            self.last_ch_fallback = True
+            dist, prev = self.dijkstra(src, target=dst)
+            cost = dist.get(dst, float("inf"))
+            path = reconstruct_path(prev, src, dst) if dst in dist else None
+        if path is None:
+            raise RouteError(f"Destino {dst} não alcançável a partir de {src}.")
+        return path, cost
+
+    def resilience_sweep(self, src, dests):
+        """Tabela de criticidade das arestas da rota (ver grafos.resilience.resilience_sweep)."""
+        return resilience_sweep(self, src, dests)
+
+    # ============================================================
+    # GERAÇÃO ALEATÓRIA
+    # ============================================================
+
+    def create_random_complete(self, n, size, node_radius=20, extra_prob=None, rng=None):
+        """Cria grafo aleatório conexo (árvore geradora + arestas extras) com layout aleatório.
+        extra_prob=None usa 0.25 em grafos pequenos e limita o grau extra médio a ~12 nos grandes.
+        Retorna (origem, destino) distintos sorteados, ou None se n < 2."""
+        from .generators import random_connected   # generators importa este módulo
+
+        rng = rng or random
+        if extra_prob is None:
+            extra_prob = min(0.25, 12 / max(n, 1))
+        # árvore geradora aleatória (conectividade) + pares extras sorteados sem testar todos
+        random_connected(n, extra_prob, rng=rng, graph=self)
+        self.generate_random_layout(size, node_radius, rng=rng)
+
+        # escolher origem e destino distintos
+        if n < 2:
+            return None
+        s = rng.randint(0, n - 1)
+        t = s
+        while t == s:
+            t = rng.randint(0, n - 1)
+        return s, t
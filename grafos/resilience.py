@@ -0,0 +1,137 @@
+"""Análise de resiliência: custo do desvio quando cada aresta da rota falha.
+
+Para um trecho s -> t com caminho mínimo P = p0 p1 ... pk, o "caminho de substituição" de
+cada aresta e_i = (p_i, p_i+1) é o menor caminho s -> t que não usa e_i. Em vez de rodar um
+Dijkstra por aresta, o caso não direcionado usa o algoritmo de Malik-Mittal-Gupta:
+
+1. árvores de caminhos mínimos a partir de s (Ts) e de t (dist_t);
+2. cada nó x recebe label(x) = índice do último nó de P no caminho de s até x em Ts;
+   remover e_i desconecta de s exatamente os nós com label > i;
+3. toda aresta (x, y) fora de P com label(x) = a < label(y) = b dá um desvio de custo
+   dist_s[x] + w + dist_t[y], válido para as arestas e_a .. e_b-1;
+4. os candidatos são aplicados do mais barato ao mais caro, "pintando" cada e_i uma única
+   vez (union-find sobre os índices) — O(E log E) no total.
+
+Em grafos direcionados esse atalho não vale; cai-se em um Dijkstra com parada no destino
+por aresta do caminho (k buscas, não E), que apenas pula a aresta removida — o grafo não é
+alterado durante a análise.
+"""
+
+import heapq
+
+from .shortest_path import dijkstra, reconstruct_path
+
+INF = float("inf")
+
+
+def replacement_path_costs(adj, s, t, directed=False):
+    """Custos dos caminhos de substituição para cada aresta do caminho mínimo s -> t.
+    Retorna (caminho, custo_base, custos) com custos[i] = menor custo s -> t sem a aresta
+    (caminho[i], caminho[i+1]) — inf se a aresta é uma ponte para o trecho."""
+    dist_s, prev_s = dijkstra(adj, s)
+    if t not in dist_s:
+        return None, INF, []
+    path = reconstruct_path(prev_s, s, t)
+    if directed:
+        return path, dist_s[t], _replacement_costs_directed(adj, path)
+
+    k = len(path) - 1
+    dist_t, _ = dijkstra(adj, t)
+
+    # label de cada nó: percorre Ts a partir de s herdando o label do pai
+    children = {}
+    for x, p in prev_s.items():
+        children.setdefault(p, []).append(x)
+    on_path = {x: i for i, x in enumerate(path)}
+    label = {s: 0}
+    stack = [s]
+    while stack:
+        x = stack.pop()
+        lx = label[x]
+        for c in children.get(x, ()):
+            label[c] = on_path.get(c, lx)
+            stack.append(c)
+
+    candidates = []
+    for x, nbrs in adj.items():
+        a = label.get(x)
+        if a is None:
+            continue
+        dx = dist_s[x]
+        for y, w in nbrs.items():
+            b = label.get(y)
+            if b is None or b <= a or y not in dist_t:
+                continue
+            if b == a + 1 and x == path[a] and y == path[b]:
+                continue  # a própria aresta e_a
+            candidates.append((dx + w + dist_t[y], a, b))
+    candidates.sort()
+
+    costs = [INF] * k
+    nxt = list(range(k + 1))   # nxt[i]: menor índice >= i ainda sem custo (union-find)
+
+    def find(i):
+        root = i
+        while nxt[root] != root:
+            root = nxt[root]
+        while nxt[i] != root:
+            nxt[i], i = root, nxt[i]
+        return root
+
+    for c, a, b in candidates:
+        i = find(a)
+        while i < b:
+            costs[i] = c
+            nxt[i] = i + 1
+            i = find(i + 1)
+    return path, dist_s[t], costs
+
+
+def _replacement_costs_directed(adj, path):
+    s = path[0]
+    t = path[-1]
+    return [_distance_without(adj, s, t, u, v) for u, v in zip(path, path[1:])]
+
+
+def _distance_without(adj, s, t, bu, bv):
+    """Distância s -> t ignorando a aresta bu -> bv (o grafo não é alterado)."""
+    dist = {s: 0}
+    done = set()
+    pq = [(0, s)]
+    push = heapq.heappush
+    pop = heapq.heappop
+    while pq:
+        d, u = pop(pq)
+        if u == t:
+            return d
+        if u in done:
+            continue
+        done.add(u)
+        for v, w in adj.get(u, {}).items():
+            if u == bu and v == bv:
+                continue
+            nd = d + w
+            if nd < dist.get(v, INF):
+                dist[v] = nd
+                push(pq, (nd, v))
+    return INF
+
+
+def resilience_sweep(graph, src, dests):
+    """Criticidade de cada aresta usada pela rota src -> d1 -> d2 -> ... de um GraphModel.
+    Retorna linhas ordenadas da mais crítica para a menos:
+    {"edge": chave, "legs": [índices dos trechos], "delta": aumento do custo total da rota}.
+    Arestas fora da rota não mudam o custo e não aparecem na tabela."""
+    rows = {}
+    legs = list(zip([src] + list(dests[:-1]), dests))
+    for k, (s, t) in enumerate(legs):
+        if s == t:
+            continue
+        path, base, costs = replacement_path_costs(graph.adj, s, t, graph.directed)
+        if path is None:
+            continue
+        for (u, v), c in zip(zip(path, path[1:]), costs):
+            row = rows.setdefault(graph.edge_key(u, v), {"edge": graph.edge_key(u, v), "legs": [], "delta": 0.0})
+            row["legs"].append(k)
+            row["delta"] += c - base
+    return sorted(rows.values(), key=lambda r: r["delta"], reverse=True)
@@ -0,0 +1,167 @@
+"""Buscas ponto a ponto (uma origem, um destino) que exploram menos nós que o Dijkstra completo.
+
+- bidirectional_dijkstra: avança a partir de s e (no grafo reverso) a partir de t e para
+  quando as duas fronteiras garantem o melhor encontro;
+- astar: Dijkstra guiado por uma estimativa h(v) <= dist(v, t);
+- euclidean_heuristic: h(v) = k · |v - t| usando as posições dos nós, com k = menor custo por
+  unidade de distância entre todas as arestas (calibrado no próprio grafo => admissível);
+- Landmarks (ALT): distâncias pré-calculadas de/para alguns nós "marco" dão, pela
+  desigualdade triangular, limites inferiores que não dependem de pesos geométricos.
+
+Todas retornam (custo, caminho, nós_fixados); custo = inf e caminho = None se t é inalcançável.
+"""
+
+import heapq
+import math
+
+from .shortest_path import dijkstra, reconstruct_path
+
+INF = float("inf")
+
+
+def reverse_adj(adj):
+    """Lista de adjacência com todas as arestas invertidas ({v: {u: w}})."""
+    radj = {u: {} for u in adj}
+    for u, nbrs in adj.items():
+        for v, w in nbrs.items():
+            radj.setdefault(v, {})[u] = w
+    return radj
+
+
+def astar(adj, s, t, heuristic=None):
+    """A* de s até t. heuristic(v) deve ser consistente (None = Dijkstra comum com parada em t)."""
+    h = heuristic or (lambda v: 0.0)
+    dist = {s: 0}
+    prev = {}
+    done = set()
+    pq = [(h(s), s)]
+    while pq:
+        _, u = heapq.heappop(pq)
+        if u in done:
+            continue
+        done.add(u)
+        if u == t:
+            return dist[t], reconstruct_path(prev, s, t), len(done)
+        du = dist[u]
+        for v, w in adj.get(u, {}).items():
+            nd = du + w
+            if nd < dist.get(v, INF):
+                dist[v] = nd
+                prev[v] = u
+                heapq.heappush(pq, (nd + h(v), v))
+    return INF, None, len(done)
+
+
+def bidirectional_dijkstra(adj, s, t, radj=None):
+    """Dijkstra bidirecional. radj é o grafo reverso (None = grafo não direcionado, usa adj)."""
+    if s == t:
+        return 0, [s], 1
+    radj = adj if radj is None else radj
+    dist = [{s: 0}, {t: 0}]
+    prev = [{}, {}]
+    done = [set(), set()]
+    pqs = [[(0, s)], [(0, t)]]
+    graphs = [adj, radj]
+    best = INF
+    meet = None
+    while pqs[0] and pqs[1]:
+        # critério de parada: nenhum caminho ainda não visto pode ser menor que best
+        if pqs[0][0][0] + pqs[1][0][0] >= best:
+            break
+        side = 0 if pqs[0][0][0] <= pqs[1][0][0] else 1
+        d, u = heapq.heappop(pqs[side])
+        if u in done[side]:
+            continue
+        done[side].add(u)
+        my_dist = dist[side]
+        other_dist = dist[1 - side]
+        for v, w in graphs[side].get(u, {}).items():
+            nd = d + w
+            if nd < my_dist.get(v, INF):
+                my_dist[v] = nd
+                prev[side][v] = u
+                heapq.heappush(pqs[side], (nd, v))
+            if v in other_dist and my_dist[v] + other_dist[v] < best:
+                best = my_dist[v] + other_dist[v]
+                meet = v
+    settled = len(done[0]) + len(done[1])
+    if meet is None:
+        return INF, None, settled
+    path = reconstruct_path(prev[0], s, meet)
+    c = meet
+    while c != t:
+        c = prev[1][c]
+        path.append(c)
+    return best, path, settled
+
+
+def min_cost_per_unit(adj, positions):
+    """Menor razão peso / comprimento euclidiano entre as arestas (0 se alguma tem comprimento 0)."""
+    k = INF
+    for u, nbrs in adj.items():
+        ux, uy = positions[u]
+        for v, w in nbrs.items():
+            vx, vy = positions[v]
+            length = math.hypot(ux - vx, uy - vy)
+            if length == 0:
+                return 0.0
+            k = min(k, w / length)
+    return 0.0 if k == INF else k
+
+
+def euclidean_heuristic(positions, t, k):
+    """h(v) = k · distância euclidiana de v até t (admissível se k <= min_cost_per_unit)."""
+    tx, ty = positions[t]
+
+    def h(v):
+        x, y = positions[v]
+        return k * math.hypot(x - tx, y - ty)
+    return h
+
+
+class Landmarks:
+    """Limites inferiores ALT a partir de `count` marcos escolhidos pelo mais distante."""
+
+    def __init__(self, adj, count=8, directed=False, start=None):
+        self.directed = directed
+        radj = reverse_adj(adj) if directed else None
+        self.landmarks = []
+        self.from_l = []   # dist(L, v)
+        self.to_l = []     # dist(v, L) (só em grafos direcionados)
+        if not adj:
+            return
+        node = next(iter(adj)) if start is None else start
+        # seleção "mais distante": cada novo marco é o nó mais longe dos marcos já escolhidos
+        closest = {}
+        for _ in range(count):
+            d, _ = dijkstra(adj, node)
+            self.landmarks.append(node)
+            self.from_l.append(d)
+            if directed:
+                self.to_l.append(dijkstra(radj, node)[0])
+            for v, dv in d.items():
+                if dv < closest.get(v, INF):
+                    closest[v] = dv
+            candidates = [v for v in closest if v not in self.landmarks]
+            if not candidates:
+                break
+            node = max(candidates, key=closest.__getitem__)
+
+    def heuristic(self, t):
+        """h(v) = max sobre os marcos L de d(L,t) - d(L,v) e d(v,L) - d(t,L) (desigualdade triangular)."""
+        bounds = []
+        for i, dl in enumerate(self.from_l):
+            tl = self.to_l[i] if self.directed else dl
+            bounds.append((dl, dl.get(t), tl, tl.get(t)))
+
+        def h(v):
+            best = 0.0
+            for dl, dlt, tl, dtl in bounds:
+                dlv = dl.get(v)
+                if dlt is not None and dlv is not None and dlt - dlv > best:
+                    best = dlt - dlv
+                dvl = tl.get(v)
+                if dtl is not None and dvl is not None and dvl - dtl > best:
+                    best = dvl - dtl
+            return best
+        return h
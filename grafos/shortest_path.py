@@ -0,0 +1,155 @@
+"""Dijkstra com fila de prioridade (heap binário ou radix heap)."""
+
+import heapq
+from array import array
+
+from .csr import CSRGraph
+from .heaps import RadixHeap
+
+INF = float("inf")
+
+
+def dijkstra(adj, src, target=None, heap="binary", targets=None):
+    """Dijkstra sobre adj = {u: {v: w}} (ou um CSRGraph) com fila de prioridade e remoção preguiçosa.
+    Retorna (dist, prev) onde dist[n] é a distância mínima de src a n e prev permite reconstruir caminhos.
+    Nós não alcançados ficam fora de dist. Se `target` for informado a busca para assim que ele é
+    fixado (apenas dist[target] é garantidamente final); `targets` faz o mesmo para um conjunto,
+    parando quando todos foram fixados. heap="radix" usa RadixHeap (pesos inteiros)."""
+    stop = _stop_set(target, targets)
+    if isinstance(adj, CSRGraph):
+        if heap != "binary":
+            raise ValueError("CSRGraph suporta apenas heap='binary'.")
+        if stop is not None:
+            stop = {adj.node_index(t) for t in stop}
+        return _csr_to_dicts(adj, *_dijkstra_csr(adj, adj.node_index(src), stop))
+
+    dist = {src: 0}
+    prev = {}
+    done = set()
+
+    if heap == "radix":
+        pq = RadixHeap()
+        pq.push(0, src)
+        while pq:
+            d, u = pq.pop()
+            if u in done:
+                continue  # entrada obsoleta (remoção preguiçosa)
+            done.add(u)
+            if stop and u in stop:
+                stop.discard(u)
+                if not stop:
+                    break
+            for v, w in adj.get(u, {}).items():
+                if v in done:
+                    continue
+                if w != int(w) or w < 0:
+                    raise ValueError("heap='radix' exige pesos inteiros não negativos.")
+                nd = d + int(w)
+                if nd < dist.get(v, INF):
+                    dist[v] = nd
+                    prev[v] = u
+                    pq.push(nd, v)
+        return dist, prev
+
+    if heap != "binary":
+        raise ValueError(f"heap desconhecido: {heap!r}")
+
+    pq = [(0, src)]
+    push = heapq.heappush
+    pop = heapq.heappop
+    while pq:
+        d, u = pop(pq)
+        if u in done:
+            continue  # entrada obsoleta (remoção preguiçosa)
+        done.add(u)
+        if stop and u in stop:
+            stop.discard(u)
+            if not stop:
+                break
+        for v, w in adj.get(u, {}).items():
+            nd = d + w
+            if nd < dist.get(v, INF):
+                dist[v] = nd
+                prev[v] = u
+                push(pq, (nd, v))
+    return dist, prev
+
+
+def dijkstra_csr(csr, s, target=None, targets=None):
+    """Dijkstra sobre um CSRGraph trabalhando só com índices (sem dicts).
+    Retorna (dist, prev) como arrays de tamanho n: dist[i] = inf e prev[i] = -1 para não alcançados."""
+    dist, prev, _ = _dijkstra_csr(csr, s, _stop_set(target, targets))
+    return dist, prev
+
+
+def _stop_set(target, targets):
+    """Conjunto de nós cuja fixação encerra a busca (None = busca completa)."""
+    if targets:
+        stop = set(targets)
+        if target is not None:
+            stop.add(target)
+        return stop
+    return None if target is None else {target}
+
+
+def _dijkstra_csr(csr, s, stop):
+    n = len(csr)
+    offsets = csr.offsets
+    targets = csr.targets
+    weights = csr.weights
+    dist = array("d", [INF]) * n
+    prev = array("i", [-1]) * n
+    done = bytearray(n)
+    reached = [s]   # nós tocados, para converter o resultado sem varrer os n índices
+    dist[s] = 0.0
+    pq = [(0.0, s)]
+    push = heapq.heappush
+    pop = heapq.heappop
+    while pq:
+        d, u = pop(pq)
+        if done[u]:
+            continue  # entrada obsoleta (remoção preguiçosa)
+        done[u] = 1
+        if stop and u in stop:
+            stop.discard(u)
+            if not stop:
+                break
+        # indexa os arrays direto: fatiar copiaria os vizinhos a cada nó fixado
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            nd = d + weights[k]
+            if nd < dist[v]:
+                if prev[v] < 0:
+                    reached.append(v)
+                dist[v] = nd
+                prev[v] = u
+                push(pq, (nd, v))
+    return dist, prev, reached
+
+
+def _csr_to_dicts(csr, dist_arr, prev_arr, reached):
+    """Converte o resultado por índices para o contrato (dist, prev) com ids originais."""
+    node_id = csr.node_id
+    dist = {}
+    prev = {}
+    for i in reached:
+        u = node_id(i)
+        dist[u] = dist_arr[i]
+        p = prev_arr[i]
+        if p >= 0:
+            prev[u] = node_id(p)
+    return dist, prev
+
+
+def reconstruct_path(prev, src, dest):
+    """Reconstrói o caminho src -> dest a partir de prev. Retorna None se dest não foi alcançado."""
+    seg = []
+    c = dest
+    while c != src:
+        seg.append(c)
+        c = prev.get(c)
+        if c is None:
+            return None
+    seg.append(src)
+    seg.reverse()
+    return seg
@@ -0,0 +1,184 @@
+"""Índice espacial (grade uniforme) de nós e arestas, para seleção e recorte na interface.
+
+Cada célula da grade guarda as chaves cujas caixas a tocam: um nó ocupa uma célula, uma
+aresta as células do seu retângulo envolvente. Achar o nó sob o cursor ou a aresta mais
+próxima de um clique custa O(itens nas células vizinhas), não O(V) / O(E). Mover um nó
+reinsere só ele e as arestas incidentes (SpatialIndex.incident).
+"""
+
+import math
+
+# caixas que cobririam mais células que isso (arestas muito longas) ficam numa lista à parte,
+# sempre testada: evita que uma aresta atravessando o mapa ocupe milhares de células
+MAX_CELLS_PER_BOX = 64
+
+
+def point_segment_distance(px, py, x1, y1, x2, y2):
+    """Distância do ponto (px, py) ao segmento (x1, y1)-(x2, y2)."""
+    vx = x2 - x1
+    vy = y2 - y1
+    vv = vx * vx + vy * vy
+    if vv == 0:
+        return math.hypot(px - x1, py - y1)
+    t = max(0.0, min(1.0, ((px - x1) * vx + (py - y1) * vy) / vv))
+    return math.hypot(px - (x1 + t * vx), py - (y1 + t * vy))
+
+
+class UniformGrid:
+    def __init__(self, cell):
+        self.cell = float(cell)
+        self.cells = {}    # (cx, cy) -> [chaves]
+        self.boxes = {}    # chave -> (x0, y0, x1, y1)
+        self.large = set()
+
+    def __len__(self):
+        return len(self.boxes)
+
+    def _range(self, x0, y0, x1, y1):
+        c = self.cell
+        return math.floor(x0 / c), math.floor(y0 / c), math.floor(x1 / c), math.floor(y1 / c)
+
+    def insert(self, key, x0, y0, x1=None, y1=None):
+        """Insere um ponto (x0, y0) ou a caixa de (x0, y0) a (x1, y1)."""
+        if x1 is None:
+            box = (x0, y0, x0, y0)
+        else:
+            box = (min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1))
+        self.boxes[key] = box
+        cx0, cy0, cx1, cy1 = self._range(*box)
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > MAX_CELLS_PER_BOX:
+            self.large.add(key)
+            return
+        cells = self.cells
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [key]
+                else:
+                    bucket.append(key)
+
+    def remove(self, key):
+        box = self.boxes.pop(key, None)
+        if box is None:
+            return
+        if key in self.large:
+            self.large.discard(key)
+            return
+        cx0, cy0, cx1, cy1 = self._range(*box)
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                bucket = self.cells[(cx, cy)]
+                bucket.remove(key)
+                if not bucket:
+                    del self.cells[(cx, cy)]
+
+    def query(self, x0, y0, x1, y1):
+        """Chaves cujas caixas cruzam o retângulo (x0, y0)-(x1, y1)."""
+        boxes = self.boxes
+        cx0, cy0, cx1, cy1 = self._range(x0, y0, x1, y1)
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) >= len(self.cells):
+            # retângulo cobre a grade quase toda: varrer as caixas sai mais barato
+            return [k for k, (a, b, c, d) in boxes.items() if a <= x1 and c >= x0 and b <= y1 and d >= y0]
+        found = []
+        seen = set()
+        cells = self.cells
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                for key in cells.get((cx, cy), ()):
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    a, b, c, d = boxes[key]
+                    if a <= x1 and c >= x0 and b <= y1 and d >= y0:
+                        found.append(key)
+        for key in self.large:
+            a, b, c, d = boxes[key]
+            if a <= x1 and c >= x0 and b <= y1 and d >= y0:
+                found.append(key)
+        return found
+
+
+class SpatialIndex:
+    """Grades de nós e de arestas sobre `positions` (dict compartilhado com o GraphModel)."""
+
+    def __init__(self, positions, adj, directed=False, cell=None):
+        self.positions = positions
+        self.directed = directed
+        if cell is None:
+            # ~4 nós por célula, pela área ocupada pelo layout
+            if positions:
+                xs = [x for x, _ in positions.values()]
+                ys = [y for _, y in positions.values()]
+                area = max(max(xs) - min(xs), 1.0) * max(max(ys) - min(ys), 1.0)
+            else:
+                area = 1.0
+            cell = 2.0 * math.sqrt(area / max(1, len(positions)))
+        self.nodes = UniformGrid(cell)
+        self.edges = UniformGrid(cell)
+        self.incident = {}   # nó -> chaves das arestas que tocam o nó
+        for node, (x, y) in positions.items():
+            self.nodes.insert(node, x, y)
+        for u, nbrs in adj.items():
+            for v in nbrs:
+                if directed or u <= v:
+                    self.add_edge(u, v)
+
+    def edge_key(self, u, v):
+        return (u, v) if self.directed else tuple(sorted((u, v)))
+
+    def add_edge(self, u, v):
+        key = self.edge_key(u, v)
+        if key in self.edges.boxes:
+            return
+        (x1, y1), (x2, y2) = self.positions[u], self.positions[v]
+        self.edges.insert(key, x1, y1, x2, y2)
+        self.incident.setdefault(u, []).append(key)
+        self.incident.setdefault(v, []).append(key)
+
+    def remove_edge(self, u, v):
+        key = self.edge_key(u, v)
+        if key not in self.edges.boxes:
+            return
+        self.edges.remove(key)
+        self.incident[u].remove(key)
+        self.incident[v].remove(key)
+
+    def move_node(self, node, x, y):
+        """Atualiza o nó e as caixas das arestas incidentes (positions já deve ter (x, y))."""
+        self.nodes.remove(node)
+        self.nodes.insert(node, x, y)
+        for key in self.incident.get(node, ()):
+            (x1, y1), (x2, y2) = self.positions[key[0]], self.positions[key[1]]
+            self.edges.remove(key)
+            self.edges.insert(key, x1, y1, x2, y2)
+
+    def nodes_in(self, x0, y0, x1, y1):
+        return self.nodes.query(x0, y0, x1, y1)
+
+    def edges_in(self, x0, y0, x1, y1):
+        return self.edges.query(x0, y0, x1, y1)
+
+    def nearest_node(self, x, y, radius):
+        """Nó mais próximo de (x, y) a no máximo `radius` (None se nenhum)."""
+        best = None
+        best_d = radius
+        for node in self.nodes.query(x - radius, y - radius, x + radius, y + radius):
+            nx, ny = self.positions[node]
+            d = math.hypot(nx - x, ny - y)
+            if d <= best_d:
+                best = node
+                best_d = d
+        return best
+
+    def nearest_edge(self, x, y, tolerance):
+        """Chave da aresta mais próxima de (x, y) a no máximo `tolerance` (None se nenhuma)."""
+        best = None
+        best_d = tolerance
+        for key in self.edges.query(x - tolerance, y - tolerance, x + tolerance, y + tolerance):
+            (x1, y1), (x2, y2) = self.positions[key[0]], self.positions[key[1]]
+            d = point_segment_distance(x, y, x1, y1, x2, y2)
+            if d <= best_d:
+                best = key
+                best_d = d
+        return best
@@ -0,0 +1,158 @@
+"""Pesos dependentes do horário: tempo de viagem linear por partes e chegada mais cedo.
+
+O peso estático de adj continua sendo o tempo em fluxo livre. Um perfil é a lista de fatores
+de congestionamento nos horários de `breakpoints` — um único vetor de horários, compartilhado
+por todos os perfis e arestas. Entrar na aresta u->v no minuto t custa w * fator(t), com
+interpolação linear entre os horários vizinhos e período de um dia. Arestas sem perfil custam
+o mesmo que no grafo estático; as demais, uma entrada de dict com o índice do perfil. Tempos
+próprios de uma aresta (set_values) ficam num array plano com len(breakpoints) valores por
+aresta.
+
+earliest_arrival supõe FIFO: sair mais tarde nunca faz chegar antes (inclinação do tempo de
+viagem >= -1 em todo trecho, incluindo a virada do dia). Com isso o Dijkstra pelo horário de
+chegada continua exato. set_values rejeita tempos que violam FIFO; num perfil a inclinação
+escala com o peso, então add_profile guarda o maior peso que o mantém FIFO e assign com w
+rejeita arestas acima dele.
+"""
+
+import bisect
+import heapq
+from array import array
+
+from .shortest_path import INF, _stop_set
+
+DAY = 1440.0   # minutos
+
+
+class TravelTimes:
+    """Funções de tempo de viagem por aresta sobre horários compartilhados (minutos do dia)."""
+
+    def __init__(self, breakpoints, period=DAY):
+        points = sorted(set(float(b) for b in breakpoints))
+        if not points or points[0] < 0 or points[-1] >= period:
+            raise ValueError(f"Horários devem estar em [0, {period}).")
+        self.breakpoints = array("d", points)
+        self.period = period
+        self.profiles = [array("d", [1.0] * len(points))]   # perfil 0 = fluxo livre
+        self.max_weight = [INF]  # maior peso com que cada perfil continua FIFO
+        self.edge_profile = {}   # (u, v) -> índice do perfil
+        self.values = array("d")
+        self.edge_values = {}    # (u, v) -> deslocamento do primeiro valor em `values`
+
+    @classmethod
+    def hourly(cls, period=DAY):
+        """Um horário por hora cheia."""
+        return cls([h * 60.0 for h in range(int(period // 60))], period)
+
+    def add_profile(self, factors):
+        """Registra um perfil (um fator por horário, > 0) e retorna seu índice."""
+        if len(factors) != len(self.breakpoints) or min(factors) <= 0:
+            raise ValueError("Perfil precisa de um fator positivo por horário.")
+        self.profiles.append(array("d", factors))
+        slope = self._min_slope(factors)
+        self.max_weight.append(-1.0 / slope if slope < 0 else INF)
+        return len(self.profiles) - 1
+
+    def assign(self, u, v, profile, both=False, w=None):
+        """Aplica o perfil à aresta u->v (e v->u com both=True). O perfil 0 remove o efeito.
+        Com w (peso estático da aresta) rejeita o perfil se w * fator violar FIFO."""
+        if not 0 <= profile < len(self.profiles):
+            raise ValueError(f"Perfil desconhecido: {profile}.")
+        if w is not None and w > self.max_weight[profile]:
+            raise ValueError(f"Perfil {profile} não é FIFO com peso {w} "
+                             f"(máximo {self.max_weight[profile]:.6g}).")
+        for key in ((u, v), (v, u)) if both else ((u, v),):
+            self.edge_values.pop(key, None)
+            if profile:
+                self.edge_profile[key] = profile
+            else:
+                self.edge_profile.pop(key, None)
+
+    def set_values(self, u, v, times, both=False):
+        """Tempos de viagem próprios de u->v (um por horário), em vez de peso x perfil."""
+        if len(times) != len(self.breakpoints) or min(times) < 0:
+            raise ValueError("Informe um tempo não negativo por horário.")
+        if self._min_slope(times) < -1:
+            raise ValueError("Tempos violam FIFO: sair mais tarde faria chegar antes.")
+        for key in ((u, v), (v, u)) if both else ((u, v),):
+            self.edge_profile.pop(key, None)
+            offset = self.edge_values.get(key)
+            if offset is None:
+                self.edge_values[key] = len(self.values)
+                self.values.extend(times)
+            else:
+                self.values[offset:offset + len(times)] = array("d", times)
+
+    def discard(self, u, v):
+        """Esquece a função de u->v (a área em `values` é reaproveitada só por set_values)."""
+        self.edge_profile.pop((u, v), None)
+        self.edge_values.pop((u, v), None)
+
+    def _min_slope(self, ys):
+        """Menor inclinação entre horários vizinhos (com o trecho que vira o dia)."""
+        bp = self.breakpoints
+        xs = list(bp) + [bp[0] + self.period]
+        ys = list(ys) + [ys[0]]
+        return min((y1 - y0) / (x1 - x0) for x0, x1, y0, y1 in zip(xs, xs[1:], ys, ys[1:]))
+
+    def _interpolate(self, ys, offset, t):
+        bp = self.breakpoints
+        k = len(bp)
+        t %= self.period
+        i = bisect.bisect_right(bp, t) - 1
+        if i < 0:
+            # antes do primeiro horário: trecho que vem do último horário do dia anterior
+            x0, y0 = bp[-1] - self.period, ys[offset + k - 1]
+            x1, y1 = bp[0], ys[offset]
+        elif i + 1 < k:
+            x0, y0 = bp[i], ys[offset + i]
+            x1, y1 = bp[i + 1], ys[offset + i + 1]
+        else:
+            x0, y0 = bp[i], ys[offset + i]
+            x1, y1 = bp[0] + self.period, ys[offset]
+        if x1 == x0:
+            return y0
+        return y0 + (y1 - y0) * (t - x0) / (x1 - x0)
+
+    def travel_time(self, u, v, w, t):
+        """Tempo para percorrer u->v (peso estático w) entrando no minuto t."""
+        offset = self.edge_values.get((u, v))
+        if offset is not None:
+            return self._interpolate(self.values, offset, t)
+        profile = self.edge_profile.get((u, v))
+        if profile is None:
+            return w
+        return w * self._interpolate(self.profiles[profile], 0, t)
+
+
+def earliest_arrival(adj, src, depart, travel_times=None, target=None, targets=None):
+    """Dijkstra pelo horário de chegada saindo de src no minuto `depart`.
+    Retorna (arrival, prev): arrival[n] é o horário mais cedo em que se chega a n. Sem
+    travel_times usa os pesos estáticos (arrival = depart + distância). target/targets
+    encerram a busca como em shortest_path.dijkstra."""
+    stop = _stop_set(target, targets)
+    cost = travel_times.travel_time if travel_times is not None else None
+    arrival = {src: depart}
+    prev = {}
+    done = set()
+    pq = [(depart, src)]
+    push = heapq.heappush
+    pop = heapq.heappop
+    while pq:
+        t, u = pop(pq)
+        if u in done:
+            continue
+        done.add(u)
+        if stop and u in stop:
+            stop.discard(u)
+            if not stop:
+                break
+        for v, w in adj.get(u, {}).items():
+            if v in done:
+                continue
+            a = t + (cost(u, v, w, t) if cost else w)
+            if a < arrival.get(v, INF):
+                arrival[v] = a
+                prev[v] = u
+                push(pq, (a, v))
+    return arrival, prev
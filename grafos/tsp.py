@@ -0,0 +1,191 @@
+"""Sequenciamento de paradas (TSP de caminho aberto a partir da origem).
+
+Dada a matriz D de distâncias de caminho mínimo entre a origem (índice 0) e os destinos
+(índices 1..k), procura a ordem de visita de menor custo total. A rota termina no último
+destino (não volta à origem), como em GraphDeliveryApp.find_shortest_path.
+
+- até `exact_limit` destinos: programação dinâmica de Held-Karp (ótimo exato);
+- acima disso: vizinho mais próximo + melhorias 2-opt e Or-opt até não haver ganho.
+
+Todos os deltas são O(1) (somas de prefixo), então D pode ser assimétrica (grafo direcionado).
+"""
+
+INF = float("inf")
+
+
+def distance_matrix(graph, nodes):
+    """Matriz len(nodes) x len(nodes) com as distâncias de caminho mínimo entre `nodes`.
+    `graph` é um GraphModel; cada linha sai de uma busca com parada múltipla."""
+    wanted = set(nodes)
+    D = []
+    for s in nodes:
+        dist, _ = graph.dijkstra(s, targets=wanted - {s})
+        D.append([0.0 if t == s else dist.get(t, INF) for t in nodes])
+    return D
+
+
+def route_cost(order, D):
+    """Custo do caminho aberto que visita `order` (lista de índices de D) nessa ordem."""
+    return sum(D[a][b] for a, b in zip(order, order[1:]))
+
+
+def nearest_neighbor(D, start=0):
+    """Rota gulosa: a partir de start, sempre vai para o destino ainda não visitado mais próximo."""
+    n = len(D)
+    left = set(range(n))
+    left.discard(start)
+    order = [start]
+    cur = start
+    while left:
+        row = D[cur]
+        cur = min(left, key=row.__getitem__)
+        left.remove(cur)
+        order.append(cur)
+    return order
+
+
+def two_opt(order, D):
+    """Inverte trechos order[i..j] enquanto houver ganho. order[0] fica fixo."""
+    n = len(order)
+
+    def prefixes():
+        # custo acumulado no sentido da rota e no sentido inverso (para D assimétrica)
+        fwd = [0.0] * n
+        bwd = [0.0] * n
+        for k in range(1, n):
+            fwd[k] = fwd[k - 1] + D[order[k - 1]][order[k]]
+            bwd[k] = bwd[k - 1] + D[order[k]][order[k - 1]]
+        return fwd, bwd
+
+    fwd, bwd = prefixes()
+    improved = True
+    while improved:
+        improved = False
+        for i in range(1, n - 1):
+            a = order[i - 1]
+            b = order[i]
+            Da = D[a]
+            Db = D[b]
+            ab = Da[b]
+            for j in range(i + 1, n):
+                c = order[j]
+                old = ab + fwd[j] - fwd[i]
+                new = Da[c] + bwd[j] - bwd[i]
+                if j + 1 < n:
+                    d = order[j + 1]
+                    old += D[c][d]
+                    new += Db[d]
+                if new < old - 1e-9:
+                    order[i:j + 1] = order[i:j + 1][::-1]
+                    fwd, bwd = prefixes()
+                    improved = True
+                    b = order[i]
+                    Db = D[b]
+                    ab = Da[b]
+    return order
+
+
+def or_opt(order, D, max_len=3):
+    """Move blocos de 1..max_len paradas consecutivas para outra posição enquanto houver ganho."""
+    n = len(order)
+    improved = True
+    while improved:
+        improved = False
+        for seg_len in range(1, max_len + 1):
+            for i in range(1, n - seg_len + 1):
+                j = i + seg_len - 1          # bloco order[i..j]
+                p = order[i - 1]
+                s0 = order[i]
+                s1 = order[j]
+                nx = order[j + 1] if j + 1 < n else None
+                # ganho ao retirar o bloco
+                removed = D[p][s0] + (D[s1][nx] if nx is not None else 0.0)
+                bridge = D[p][nx] if nx is not None else 0.0
+                gain = removed - bridge
+                if gain <= 1e-9:
+                    continue
+                for k in range(n):
+                    # inserir entre order[k] e order[k+1] (k fora do bloco e diferente de i-1)
+                    if i - 1 <= k <= j:
+                        continue
+                    x = order[k]
+                    y = order[k + 1] if k + 1 < n else None
+                    add = D[x][s0] + (D[s1][y] - D[x][y] if y is not None else 0.0)
+                    if add < gain - 1e-9:
+                        block = order[i:j + 1]
+                        del order[i:j + 1]
+                        pos = k + 1 if k < i else k + 1 - seg_len
+                        order[pos:pos] = block
+                        improved = True
+                        break
+                if improved:
+                    break
+            if improved:
+                break
+    return order
+
+
+def held_karp(D, start=0):
+    """Ordem ótima (caminho aberto a partir de start) por DP sobre subconjuntos: O(2^k · k²)."""
+    others = [i for i in range(len(D)) if i != start]
+    k = len(others)
+    if k == 0:
+        return [start]
+    # dp[mask][j]: menor custo saindo de start, visitando `mask` e terminando em others[j]
+    full = (1 << k) - 1
+    dp = [None] * (1 << k)
+    parent = [None] * (1 << k)
+    sub = [[D[others[i]][others[j]] for j in range(k)] for i in range(k)]
+    for j in range(k):
+        row = [INF] * k
+        row[j] = D[start][others[j]]
+        dp[1 << j] = row
+        parent[1 << j] = [-1] * k
+    for mask in range(1, full + 1):
+        if dp[mask] is not None:
+            continue
+        bits = [j for j in range(k) if mask >> j & 1]
+        row = [INF] * k
+        par = [-1] * k
+        for j in bits:
+            prev_row = dp[mask ^ (1 << j)]
+            best = INF
+            arg = -1
+            for i in bits:
+                c = prev_row[i] + sub[i][j]
+                if c < best:
+                    best = c
+                    arg = i
+            row[j] = best
+            par[j] = arg
+        dp[mask] = row
+        parent[mask] = par
+    # reconstruir a partir do melhor fim
+    last = min(range(k), key=dp[full].__getitem__)
+    mask = full
+    tail = []
+    while last >= 0:
+        tail.append(others[last])
+        nxt = parent[mask][last]
+        mask ^= 1 << last
+        last = nxt
+    tail.reverse()
+    return [start] + tail
+
+
+def optimize_order(D, start=0, exact_limit=15):
+    """Melhor ordem encontrada para a matriz D. Retorna (ordem, custo)."""
+    if len(D) - 1 <= exact_limit:
+        order = held_karp(D, start)
+    else:
+        order = nearest_neighbor(D, start)
+        # alternar as duas vizinhanças até nenhuma melhorar
+        cost = route_cost(order, D)
+        while True:
+            two_opt(order, D)
+            or_opt(order, D)
+            new_cost = route_cost(order, D)
+            if new_cost >= cost - 1e-9:
+                break
+            cost = new_cost
+    return order, route_cost(order, D)
@@ -0,0 +1,246 @@
+"""Roteirização de frota com capacidade (CVRP) sobre a matriz de caminhos mínimos.
+
+Vários caminhões saem da origem (índice 0 de D), cada um levando no máximo `capacity`; a
+parada i (1..k) tem demanda demands[i] e é atendida por exatamente um caminhão. Com
+return_to_depot=True (padrão) as rotas voltam à origem; com False terminam na última parada,
+como em GraphModel.find_shortest_path.
+
+1. Clarke-Wright (economias, versão paralela): começa com um caminhão por parada e junta o fim
+   de uma rota ao início de outra em ordem decrescente de economia, quando a carga cabe;
+2. busca local até não haver melhora: realocar uma parada (na mesma rota ou em outra), trocar
+   duas paradas entre rotas e trocar as caudas de duas rotas (2-opt*).
+
+Só os `neighbors` destinos mais próximos de cada parada entram nas economias e nos movimentos
+(lista granular): O(k * neighbors) por passada em vez de O(k²). Cada movimento é avaliado pela
+variação de custo — arcos que saem e que entram, O(1) —, sem recalcular rotas inteiras. Nada é
+invertido, então D pode ser assimétrica (grafo direcionado).
+"""
+
+import heapq
+import time
+
+INF = float("inf")
+EPS = 1e-9
+
+
+def solve_vrp(D, demands, capacity, return_to_depot=True, neighbors=20, time_limit=None):
+    """Rotas para as paradas 1..len(D)-1. demands[i] é a demanda da parada i (demands[0] é
+    ignorado). Retorna (rotas, custo): cada rota é a lista de índices de D na ordem de visita,
+    sem a origem. time_limit (s) interrompe a busca local."""
+    n = len(D)
+    stops = range(1, n)
+    for i in stops:
+        if demands[i] > capacity:
+            raise ValueError(f"Demanda da parada {i} ({demands[i]}) excede a capacidade ({capacity}).")
+        if D[0][i] == INF or (return_to_depot and D[i][0] == INF):
+            raise ValueError(f"Parada {i} não alcançável a partir da origem (ou sem volta).")
+    if n < 2:
+        return [], 0.0
+    # END (= n) é o fim de toda rota: chegar nele custa a volta à origem (ou nada, rota aberta)
+    end = n
+    E = [row + [row[0] if return_to_depot else 0.0] for row in D]
+    E.append([INF] * (n + 1))
+    near = _nearest(D, min(neighbors, n - 2))
+    search = _Routes(E, demands, capacity, near)
+    search.savings()
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+    search.local_search(deadline)
+    routes = [r[1:-1] for r in search.routes if r is not None]
+    cost = sum(E[a][b] for r in search.routes if r is not None for a, b in zip(r, r[1:]))
+    return routes, cost
+
+
+def _nearest(D, k):
+    """Para cada parada, as k outras paradas mais próximas (pela distância de saída, D[i])."""
+    n = len(D)
+    others = range(1, n)
+    near = [[] for _ in range(n)]
+    if k <= 0:
+        return near
+    for i in others:
+        near[i] = [j for j in heapq.nsmallest(k + 1, others, key=D[i].__getitem__) if j != i][:k]
+    return near
+
+
+class _Routes:
+    """Estado da busca: rotas [0, paradas..., END], posição/rota de cada parada e cargas."""
+
+    def __init__(self, E, demands, capacity, near):
+        self.E = E
+        self.demands = demands
+        self.capacity = capacity
+        self.near = near
+        n = len(E) - 1
+        self.end = n
+        self.routes = [[0, i, n] for i in range(1, n)]
+        self.route_of = [None] + list(range(n - 1))
+        self.pos = [None] + [1] * (n - 1)
+        self.load = [demands[i] for i in range(1, n)]
+        self.cum = [None] * (n - 1)   # carga acumulada por posição (calculada sob demanda)
+
+    def _refresh(self, r):
+        route = self.routes[r]
+        if len(route) == 2:
+            self.routes[r] = None   # caminhão vazio sai da frota
+            return
+        pos = self.pos
+        route_of = self.route_of
+        for k in range(1, len(route) - 1):
+            pos[route[k]] = k
+            route_of[route[k]] = r
+        self.cum[r] = None
+
+    def _cum(self, r):
+        c = self.cum[r]
+        if c is None:
+            c = [0]
+            demands = self.demands
+            for x in self.routes[r][1:-1]:
+                c.append(c[-1] + demands[x])
+            self.cum[r] = c
+        return c
+
+    # ------------------------------------------------------------
+    # CLARKE-WRIGHT
+    # ------------------------------------------------------------
+
+    def savings(self):
+        E = self.E
+        end = self.end
+        cand = []
+        for i, js in enumerate(self.near):
+            for j in js:
+                # rota ...i -> END e rota 0 -> j...: ligar i -> j economiza s
+                s = E[i][end] + E[0][j] - E[i][j]
+                if s > EPS:
+                    cand.append((s, i, j))
+        cand.sort(reverse=True)
+        routes = self.routes
+        route_of = self.route_of
+        load = self.load
+        for _, i, j in cand:
+            ri = route_of[i]
+            rj = route_of[j]
+            if ri == rj or load[ri] + load[rj] > self.capacity:
+                continue
+            a = routes[ri]
+            b = routes[rj]
+            if a[-2] != i or b[1] != j:
+                continue   # i precisa ser o fim de sua rota e j o início da outra
+            a.pop()
+            a.extend(b[1:])
+            load[ri] += load[rj]
+            for x in b[1:-1]:
+                route_of[x] = ri
+            routes[rj] = None
+        for r, route in enumerate(routes):
+            if route is not None:
+                self._refresh(r)
+
+    # ------------------------------------------------------------
+    # BUSCA LOCAL
+    # ------------------------------------------------------------
+
+    def local_search(self, deadline=None):
+        improved = True
+        while improved:
+            improved = False
+            for x in range(1, self.end):
+                if deadline is not None and time.perf_counter() > deadline:
+                    return
+                for y in self.near[x]:
+                    if self._relocate(x, y) or self._swap(x, y) or self._two_opt_star(x, y):
+                        improved = True
+                        break
+
+    def _relocate(self, x, y):
+        """Move x para logo depois ou logo antes de y."""
+        E = self.E
+        ra = self.route_of[x]
+        rb = self.route_of[y]
+        a = self.routes[ra]
+        b = self.routes[rb]
+        i = self.pos[x]
+        j = self.pos[y]
+        if ra != rb and self.load[rb] + self.demands[x] > self.capacity:
+            return False
+        p = a[i - 1]
+        nx = a[i + 1]
+        gain = E[p][x] + E[x][nx] - E[p][nx]
+        if gain <= EPS:
+            return False
+        yn = b[j + 1]
+        yp = b[j - 1]
+        # depois de y (entre y e seu sucessor) ou antes (entre o antecessor e y)
+        after = E[y][x] + E[x][yn] - E[y][yn] if y != p else INF
+        before = E[yp][x] + E[x][y] - E[yp][y] if y != nx else INF
+        if min(after, before) >= gain - EPS:
+            return False
+        del a[i]
+        j = self.pos[y] - (1 if ra == rb and i < j else 0)
+        b.insert(j + 1 if after <= before else j, x)
+        self.load[ra] -= self.demands[x]
+        self.load[rb] += self.demands[x]
+        self._refresh(rb)
+        if ra != rb:
+            self._refresh(ra)
+        return True
+
+    def _swap(self, x, y):
+        """Troca x e y de rota (cada um assume a posição do outro)."""
+        ra = self.route_of[x]
+        rb = self.route_of[y]
+        if ra == rb:
+            return False
+        dx = self.demands[x]
+        dy = self.demands[y]
+        if self.load[ra] - dx + dy > self.capacity or self.load[rb] - dy + dx > self.capacity:
+            return False
+        E = self.E
+        a = self.routes[ra]
+        b = self.routes[rb]
+        i = self.pos[x]
+        j = self.pos[y]
+        p, n = a[i - 1], a[i + 1]
+        q, m = b[j - 1], b[j + 1]
+        delta = (E[p][y] + E[y][n] + E[q][x] + E[x][m]
+                 - E[p][x] - E[x][n] - E[q][y] - E[y][m])
+        if delta >= -EPS:
+            return False
+        a[i] = y
+        b[j] = x
+        self.load[ra] += dy - dx
+        self.load[rb] += dx - dy
+        self._refresh(ra)
+        self._refresh(rb)
+        return True
+
+    def _two_opt_star(self, x, y):
+        """Liga x -> y trocando as caudas: a[..x] + b[y..] e b[..antes de y] + a[depois de x..]."""
+        ra = self.route_of[x]
+        rb = self.route_of[y]
+        if ra == rb:
+            return False
+        E = self.E
+        a = self.routes[ra]
+        b = self.routes[rb]
+        i = self.pos[x]
+        j = self.pos[y]
+        xn = a[i + 1]
+        yp = b[j - 1]
+        delta = E[x][y] + E[yp][xn] - E[x][xn] - E[yp][y]
+        if delta >= -EPS:
+            return False
+        ca = self._cum(ra)
+        cb = self._cum(rb)
+        new_a = ca[i] + self.load[rb] - cb[j - 1]
+        new_b = cb[j - 1] + self.load[ra] - ca[i]
+        if new_a > self.capacity or new_b > self.capacity:
+            return False
+        self.routes[ra] = a[:i + 1] + b[j:]
+        self.routes[rb] = b[:j] + a[i + 1:]
+        self.load[ra] = new_a
+        self.load[rb] = new_b
+        self._refresh(ra)
+        self._refresh(rb)
+        return True
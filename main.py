@@ -1,8 +1,75 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
+import hashlib
+import io
 import math
+import os
 import random
-from PIL import Image, ImageTk  # para rotação do caminhão PNG
+import time
+from PIL import Image, ImageChops, ImageDraw, ImageTk  # para rotação do caminhão PNG e fundo raster
+
+from grafos import GraphModel, RouteError, reconstruct_path
+from grafos.animation import Fleet, Track
+from grafos.formats import read_dimacs, read_edge_csv
+
+MAX_NODES = 100000      # limite do Spinbox "Nº de Nós"
+
+# renderização com nível de detalhe (LOD): só o que está na vista vira item do canvas
+MAX_EDGE_ITEMS = 1500   # acima disso as arestas visíveis são desenhadas numa imagem PIL de fundo
+MAX_NODE_ITEMS = 1500   # idem para os nós (rota, origem/destinos e seleção continuam como itens)
+MAX_LABEL_ITEMS = 400   # pesos só aparecem com poucas arestas visíveis...
+LABEL_MIN_ZOOM = 0.6    # ...e zoom a partir deste valor
+NODE_LABEL_MIN_RADIUS = 7  # raio mínimo (px na tela) para escrever o número do nó
+ZOOM_STEP = 1.2
+FRAME_MS = 16           # ~60 quadros/s: arrasto aplica no máximo uma atualização por quadro
+TRUCK_HEADINGS = 72     # direções pré-renderizadas do caminhão (passos de 5°)
+FLEET_SIZE = 24         # caminhões do botão "Frota"
+# sprite do caminhão já sem fundo, por hash do truck.gif (mude a versão se o processamento mudar)
+SPRITE_CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+                                "grafos")
+SPRITE_CACHE_VERSION = b"1"
+FORCE_LAYOUT_WORK = 50000  # nós x iterações por clique em "Organizar" (~3 s); clicar de novo refina
+MIN_ZOOM = 0.05
+MAX_ZOOM = 500.0
+
+
+# ============================================================
+#  SPRITE DO CAMINHÃO
+# ============================================================
+
+def remove_background(img):
+    """Torna transparente a cor do pixel (0, 0) (MakeTransparent equivalente), em RGBA.
+    Máscaras por canal (tabelas de 256 entradas via Image.point), sem laço por pixel."""
+    bg = img.getpixel((0, 0))[:3]
+    mask = None
+    for channel, value in zip(img.split()[:3], bg):
+        hit = channel.point([255 if v == value else 0 for v in range(256)])
+        mask = hit if mask is None else ImageChops.multiply(mask, hit)
+    img.paste((255, 255, 255, 0), mask=mask)
+    return img
+
+
+def load_truck_sprite(path):
+    """Imagem RGBA do caminhão sem fundo. O resultado fica em SPRITE_CACHE_DIR com a hash do
+    arquivo no nome: nas próximas aberturas basta ler o PNG pronto."""
+    with open(path, "rb") as f:
+        data = f.read()
+    key = hashlib.sha1(data + SPRITE_CACHE_VERSION).hexdigest()
+    cached = os.path.join(SPRITE_CACHE_DIR, f"truck-{key}.png")
+    try:
+        with Image.open(cached) as img:
+            return img.convert("RGBA")
+    except OSError:
+        pass
+    img = remove_background(Image.open(io.BytesIO(data)).convert("RGBA"))
+    try:
+        os.makedirs(SPRITE_CACHE_DIR, exist_ok=True)
+        tmp = f"{cached}.{os.getpid()}.tmp"
+        img.save(tmp, "PNG")
+        os.replace(tmp, cached)   # outro processo nunca lê um PNG pela metade
+    except OSError:
+        pass   # sem cache (diretório só leitura etc.): só custa reprocessar na próxima vez
+    return img
 
 
 # ============================================================
@@ -19,21 +86,38 @@ class GraphDeliveryApp:
         self.node_font_size = 12
         self.edge_weight_font_size = 9
 
-        # --- model ---
-        self.n_nodes = 0
-        self.positions = {}
-        self.adj = {}
+        # --- model --- (grafo headless; adj/positions/n_nodes delegam para ele)
+        self.graph = GraphModel()
         self.node_items = {}
         self.node_label_items = {}
         self.edge_items = {}
         self.edge_weight_items = {}   # mapa key->text_id para pesos desenhados
         self.selected_edge = None     # key da aresta selecionada (para destacar)
         self.current_path = None
-
-        # Caminhão animado
-        self.truck_id = None
-        self.truck_image = None
+        self.current_route = None     # (origem, destinos) da rota atual, para reroteamento
+
+        # vista: tela = mundo * zoom + pan (posições do modelo ficam em coordenadas de mundo)
+        self.zoom = 1.0
+        self.pan_x = 0.0
+        self.pan_y = 0.0
+        self.show_weights = True      # decidido a cada render() pelo nível de detalhe
+        self._raster_image = None     # PhotoImage do fundo raster (mantida viva aqui)
+        self._raster_key = None
+        # o que está desenhado, para render() só tocar no que mudou
+        self._scene = None            # estilo (zoom, raio, direção, pesos) e pan dos itens atuais
+        self._node_state = {}         # nó -> posição (mundo) desenhada
+        self._edge_state = {}         # chave -> (x1, y1, x2, y2, peso) desenhado
+        self._render_job = None
+        self._pan_last = None
+        self._drag_job = None
+
+        # Caminhões animados: um relógio (Fleet) move todos; posições em coordenadas de mundo
         self.truck_original = None
+        self.fleet = Fleet(fps=1000 / FRAME_MS)
+        self.vehicles = {}            # chave -> [item, direção quantizada, x, y (mundo)]
+        self._fleet_job = None
+        self._fleet_done = None       # callback quando todos chegam
+        self._truck_sprites = {}      # direção quantizada -> PhotoImage já rotacionada
 
         # Paleta "flat" / modern (cores reutilizadas pelo app)
         self.color_bg = "#2D3436"             # fundo geral (dark mode)
@@ -84,7 +168,7 @@ class GraphDeliveryApp:
         # ---------------- NODE CONTROLS ----------------
         ttk.Label(left, text="Nº de Nós:").grid(row=0, column=0)
         self.node_count_var = tk.IntVar(value=6)
-        ttk.Spinbox(left, from_=2, to=50, width=5,
+        ttk.Spinbox(left, from_=2, to=MAX_NODES, width=7,
                     textvariable=self.node_count_var).grid(row=0, column=1)
 
         ttk.Label(left, text="Layout:").grid(row=0, column=2)
@@ -92,6 +176,7 @@ class GraphDeliveryApp:
         ttk.OptionMenu(left, self.layout_var, "Círculo", "Círculo", "Aleatório").grid(row=0, column=3)
 
         self.directed_var = tk.BooleanVar(value=False)
+        self.directed_var.trace_add("write", lambda *a: setattr(self.graph, "directed", self.directed_var.get()))
         ttk.Checkbutton(left, text="Direcionado", variable=self.directed_var).grid(row=0, column=4)
 
         # botão flat modern
@@ -104,8 +189,9 @@ class GraphDeliveryApp:
         self.v_var = tk.StringVar()
         self.weight_var = tk.StringVar(value="1")
 
-        self.u_menu = ttk.OptionMenu(left, self.u_var, "")
-        self.v_menu = ttk.OptionMenu(left, self.v_var, "")
+        # Combobox (em vez de OptionMenu): aceita digitar o nó e suporta milhares de opções
+        self.u_menu = ttk.Combobox(left, textvariable=self.u_var, width=6)
+        self.v_menu = ttk.Combobox(left, textvariable=self.v_var, width=6)
         self.u_menu.grid(row=1, column=1)
         self.v_menu.grid(row=1, column=2)
         # usar tk.Entry para permitir bg/fg personalizados (cursor, contraste)
@@ -114,6 +200,8 @@ class GraphDeliveryApp:
         self.weight_entry.grid(row=1, column=3)
 
         self._make_button(left, "Adicionar", self.add_edge_from_controls, row=1, column=4)
+        # layout por forças sobre as arestas atuais (grafos grandes)
+        self._make_button(left, "Organizar", self.apply_force_layout, row=1, column=5)
 
         # LISTA DE ARESTAS
         ttk.Label(left, text="Arestas:").grid(row=2, column=0, pady=5)
@@ -123,12 +211,19 @@ class GraphDeliveryApp:
                                        selectbackground="#505050", selectforeground="white",
                                        highlightthickness=0, relief="flat", bd=0)
         self.edge_listbox.grid(row=3, column=0, columnspan=4)
+        # carregar rede real (lista de arestas CSV ou DIMACS .gr)
+        self._make_button(left, "Importar", self.import_graph, row=2, column=4)
+        self._make_button(left, "Ajustar Vista", self.reset_view, row=2, column=5)
+        # overlay com o tempo de cada redesenho
+        self.debug_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(left, text="Debug", variable=self.debug_var,
+                        command=lambda: self.render()).grid(row=2, column=6)
         self._make_button(left, "Remover", self.remove_selected_edge, row=3, column=4)
 
         # ---------------- PATH CONTROLS ----------------
         ttk.Label(left, text="Origem:").grid(row=4, column=0)
         self.source_var = tk.StringVar()
-        self.source_menu = ttk.OptionMenu(left, self.source_var, "")
+        self.source_menu = ttk.Combobox(left, textvariable=self.source_var, width=6)
         self.source_menu.grid(row=4, column=1)
 
         ttk.Label(left, text="Destinos:").grid(row=4, column=2, sticky="n")
@@ -155,6 +250,17 @@ class GraphDeliveryApp:
         # Ao clicar em "Menor Caminho" agora calcula E anima automaticamente
         self._make_button(left, "Menor Caminho", self.find_shortest_path, row=5, column=0, columnspan=3, pady=5)
         self._make_button(left, "Simular Falha", self.simulate_failure_and_reroute, row=5, column=3, columnspan=2)
+        # vários caminhões ao mesmo tempo, da origem para destinos sorteados
+        self._make_button(left, "Frota", self.simulate_fleet, row=6, column=6)
+        # destinos selecionados divididos entre caminhões com capacidade (1 unidade por destino)
+        ttk.Label(left, text="Capacidade:").grid(row=4, column=4)
+        self.capacity_var = tk.IntVar(value=5)
+        ttk.Spinbox(left, from_=1, to=MAX_NODES, width=5,
+                    textvariable=self.capacity_var).grid(row=4, column=5)
+        self._make_button(left, "Roteirizar", self.plan_fleet_routes, row=5, column=6)
+        # reordenar destinos para menor distância total (em vez da ordem de clique)
+        self.optimize_order_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(left, text="Otimizar ordem", variable=self.optimize_order_var).grid(row=5, column=5)
 
         # Novo: botão para criar tudo aleatoriamente (nós, arestas, origem/destino)
         self._make_button(left, "Criar Aleatório (Completo)", self.create_random_complete, row=0, column=6, padx=5)
@@ -169,6 +275,9 @@ class GraphDeliveryApp:
                                     highlightthickness=0, bd=0, length=180)
         self.speed_scale.grid(row=6, column=1, columnspan=3, sticky="we")
 
+        # custo de desvio de cada aresta da rota atual (todas de uma vez)
+        self._make_button(left, "Resiliência", self.show_resilience_report, row=6, column=4, columnspan=2)
+
         # NOTE: removido o botão "Animar Caminhão" — animação agora ocorre ao calcular o menor caminho.
 
         # ---------------- LEGEND E EXPLICAÇÃO ----------------
@@ -214,39 +323,51 @@ class GraphDeliveryApp:
         self.canvas.bind("<Button-1>", self.on_canvas_button1)
         self.canvas.bind("<B1-Motion>", self.on_canvas_drag)
         self.canvas.bind("<ButtonRelease-1>", self.on_canvas_release)
+        # pan com o botão direito/do meio, zoom com a roda do mouse
+        for button in (2, 3):
+            self.canvas.bind(f"<ButtonPress-{button}>", self.on_pan_start)
+            self.canvas.bind(f"<B{button}-Motion>", self.on_pan_move)
+            self.canvas.bind(f"<ButtonRelease-{button}>", self.on_pan_end)
+        self.canvas.bind("<MouseWheel>", self.on_zoom)
+        self.canvas.bind("<Button-4>", self.on_zoom)
+        self.canvas.bind("<Button-5>", self.on_zoom)
 
         # Dica discreta abaixo do canvas
         self.tip_label = tk.Label(right,
-                                  text="DICA: Arraste os nós para organizar. Segure CTRL + Clique Esquerdo do mouse em um nó e em outro para criar conexões.",
+                                  text="DICA: Arraste os nós para organizar. Segure CTRL + Clique Esquerdo do mouse em um nó e em outro para criar conexões.\n"
+                                       "Roda do mouse: zoom; botão direito: mover a vista.",
                                   bg=self.color_bg, fg="#b2bec3", font=("Arial", 9))
         self.tip_label.pack(pady=(8,0))
 
         self.status_var = tk.StringVar(value="Pronto")
         ttk.Label(root, textvariable=self.status_var).grid(row=1, column=0)
 
-        # Carregar imagem PNG do caminhão
+        # Carregar imagem do caminhão (fundo removido; cache em disco)
         try:
-            # carregar e forçar canal alfa
-            img = Image.open("truck.gif").convert("RGBA")
-            # tornar transparente a cor do pixel (0,0) para remover fundo sólido (MakeTransparent equivalente)
-            try:
-                bg_col = img.getpixel((0, 0))[:3]
-                datas = []
-                for px in img.getdata():
-                    if px[:3] == bg_col:
-                        datas.append((255, 255, 255, 0))
-                    else:
-                        datas.append(px)
-                img.putdata(datas)
-            except Exception:
-                pass
-            self.truck_original = img
+            self.truck_original = load_truck_sprite("truck.gif")
         except Exception:
             messagebox.showwarning("Aviso", "truck.gif não encontrado ou inválido. Usando placeholder transparente.")
             self.truck_original = Image.new("RGBA", (60, 30), (0, 0, 0, 0))
 
         self.create_nodes()
 
+    # atalhos para o modelo (mantém o código da interface legível)
+    @property
+    def adj(self):
+        return self.graph.adj
+
+    @property
+    def positions(self):
+        return self.graph.positions
+
+    @property
+    def n_nodes(self):
+        return self.graph.n_nodes
+
+    @n_nodes.setter
+    def n_nodes(self, n):
+        self.graph.n_nodes = n
+
     # ============================================================
     # CRIAÇÃO DE NÓS
     # ============================================================
@@ -255,77 +376,55 @@ class GraphDeliveryApp:
         self.clear_graph()
 
         n = self.node_count_var.get()
-        self.n_nodes = n
+        self.graph.reset(n)
 
         # ajustar escala antes de gerar layout e desenhar nós
         self._adjust_scale()
-        
-        for i in range(n):
-            self.adj[i] = {}
 
         if self.layout_var.get() == "Círculo":
             self.generate_circle_layout()
         else:
             self.generate_random_layout()
 
-        for i in range(n):
-            x, y = self.positions[i]
-            self.draw_node(i, x, y)
-
         self.update_menus()
+        self.render()
         self.status_var.set("Nós criados.")
 
     def clear_graph(self):
         self.canvas.delete("all")
-        self.positions.clear()
-        self.adj.clear()
+        self.graph.reset()
         self.node_items.clear()
         self.node_label_items.clear()
         self.edge_items.clear()
         self.edge_weight_items.clear()
+        self._node_state.clear()
+        self._edge_state.clear()
+        self._scene = None
         self.current_path = None
+        self.current_route = None
+        self.selected_edge = None
+        self._raster_image = None
+        self._raster_key = None
+        self.zoom = 1.0
+        self.pan_x = 0.0
+        self.pan_y = 0.0
 
-        if self.truck_id:
-            self.canvas.delete(self.truck_id)
-            self.truck_id = None
+        self.stop_animation()
 
     def generate_circle_layout(self):
-        R = self.canvas_size / 2 - 60
-        cx = cy = self.canvas_size / 2
-
-        for i in range(self.n_nodes):
-            ang = 2 * math.pi * i / self.n_nodes
-            x = cx + R * math.cos(ang)
-            y = cy + R * math.sin(ang)
-            self.positions[i] = (x, y)
+        self.graph.generate_circle_layout(self.canvas_size)
 
     def generate_random_layout(self):
-        # gera posições com tentativa de espaçamento mínimo para evitar sobreposição das labels
-        n = self.n_nodes
-        # min_dist adaptado ao tamanho do nó (evita números encostados)
-        min_dist = max(20, int(self.node_radius * 4), int(160 / max(6, n)))
-        positions = []
-        attempts = 0
-        for i in range(n):
-            placed = False
-            for _ in range(200):
-                x = random.randint(40, self.canvas_size - 40)
-                y = random.randint(40, self.canvas_size - 40)
-                ok = True
-                for (ox, oy) in positions:
-                    if math.hypot(ox - x, oy - y) < min_dist:
-                        ok = False
-                        break
-                if ok:
-                    positions.append((x, y))
-                    placed = True
-                    break
-            if not placed:
-                # fallback: aceita posição mesmo assim
-                positions.append((random.randint(40, self.canvas_size - 40), random.randint(40, self.canvas_size - 40)))
-            attempts += 1
-        for i, pos in enumerate(positions):
-            self.positions[i] = pos
+        self.graph.generate_random_layout(self.canvas_size, self.node_radius)
+
+    def apply_force_layout(self):
+        if not self.n_nodes:
+            return
+        iterations = max(5, min(50, FORCE_LAYOUT_WORK // self.n_nodes))
+        t0 = time.perf_counter()
+        self.graph.generate_force_layout(self.canvas_size, iterations)
+        self.render()
+        self.status_var.set(f"Layout por forças: {iterations} iterações em {time.perf_counter() - t0:.1f} s.")
 
     def _adjust_scale(self):
         # escala contínua baseada na área disponível por nó (valores aumentados para maior legibilidade)
@@ -335,43 +434,28 @@ class GraphDeliveryApp:
         area_per_node = (effective * effective) / n
         k = 0.20  # aumentado de 0.12 para deixar nós maiores
         # limites maiores: min diâmetro 20, max diâmetro 72
-        diameter = int(max(20, min(72, k * math.sqrt(area_per_node))))
-        self.node_radius = max(10, diameter // 2)
+        # até o antigo limite do Spinbox (50 nós) mantém os tamanhos mínimos de antes;
+        # redes maiores usam nós menores (o zoom aumenta o raio na tela)
+        small = n <= 50
+        diameter = int(max(20 if small else 4, min(72, k * math.sqrt(area_per_node))))
+        self.node_radius = max(10 if small else 2, diameter // 2)
         self.node_font_size = max(9, int(self.node_radius * 0.7))
         self.edge_weight_font_size = max(8, int(self.node_radius * 0.45))
-        # atualizar gráficos existentes (se houver) para refletir nova escala
-        try:
-            self._update_node_graphics()
-            # redesenhar arestas para reposicionar pesos conforme novo centro
-            self.redraw_edges()
-        except Exception:
-            pass
-
-    def _update_node_graphics(self):
-        # atualiza posições/fonte/raio dos nós já desenhados sem recriar dados
-        for i, oval_id in list(self.node_items.items()):
-            if i not in self.positions:
-                continue
-            x, y = self.positions[i]
-            r = self.node_radius
-            try:
-                # atualizar oval
-                self.canvas.coords(oval_id, x - r, y - r, x + r, y + r)
-                # atualizar texto: posição e fonte
-                txt_id = self.node_label_items.get(i)
-                if txt_id:
-                    self.canvas.coords(txt_id, x, y)
-                    self.canvas.itemconfig(txt_id, font=("Arial", self.node_font_size, "bold"))
-            except Exception:
-                pass
+        # o redesenho com a nova escala fica a cargo de render() (chamado por quem criou o grafo)
 
     def draw_node(self, i, x, y):
-        r = self.node_radius
+        self._node_state[i] = (x, y)
+        x, y = self._to_screen(x, y)
+        r = self._screen_radius()
         # flat node: sem borda 3D, preenchimento plano. labels em cor clara.
-        node_id = self.canvas.create_oval(x - r, y - r, x + r, y + r, fill=self.color_node, outline=self.color_node)
-        label_id = self.canvas.create_text(x, y, text=str(i), font=("Arial", self.node_font_size, "bold"), fill=self.label_color)
+        node_id = self.canvas.create_oval(x - r, y - r, x + r, y + r, fill=self.color_node, outline=self.color_node,
+                                          tags=("graph", "node"))
         self.node_items[i] = node_id
-        self.node_label_items[i] = label_id
+        if r >= NODE_LABEL_MIN_RADIUS:
+            size = min(48, max(6, int(self.node_font_size * self.zoom)))
+            label_id = self.canvas.create_text(x, y, text=str(i), font=("Arial", size, "bold"), fill=self.label_color,
+                                               tags=("graph", "node_label"))
+            self.node_label_items[i] = label_id
 
     # ============================================================
     # MENUS E ARESTAS
@@ -384,17 +468,14 @@ class GraphDeliveryApp:
                           (self.v_menu, self.v_var),
                           (self.source_menu, self.source_var)]:
 
-            menu["menu"].delete(0, "end")
-            for n in nodes:
-                menu["menu"].add_command(label=n, command=lambda v=n, vv=var: vv.set(v))
-
+            menu["values"] = nodes
             if nodes:
                 var.set(nodes[0])
-        # popular listbox de destinos (multi-select)
+        # popular listbox de destinos (multi-select) numa única chamada ao Tk
         try:
             self.target_listbox.delete(0, tk.END)
-            for n in nodes:
-                self.target_listbox.insert(tk.END, n)
+            if nodes:
+                self.target_listbox.insert(tk.END, *nodes)
         except Exception:
             pass
         # garantir origem padrão
@@ -417,20 +498,16 @@ class GraphDeliveryApp:
         self.update_edge_list()
 
     def add_edge(self, u, v, w):
-        # Não permitir arestas que liguem um nó a si mesmo (self-loop)
-        if u == v:
-            messagebox.showerror("Erro", "Arestas que ligam um nó a si mesmo não são permitidas.")
+        try:
+            self.graph.add_edge(u, v, w)
+        except ValueError as e:
+            messagebox.showerror("Erro", str(e))
             return
-
-        directed = self.directed_var.get()
-        self.adj[u][v] = w
-        if not directed:
-            self.adj[v][u] = w
         self.draw_edge(u, v)
 
     def draw_edge(self, u, v):
-        x1, y1 = self.positions[u]
-        x2, y2 = self.positions[v]
+        x1, y1 = self._to_screen(*self.positions[u])
+        x2, y2 = self._to_screen(*self.positions[v])
 
         # Use chave consistente para armazenamento: para grafos não direcionados usamos par ordenado menor->maior
         key = (u, v) if self.directed_var.get() else tuple(sorted((u, v)))
@@ -449,10 +526,17 @@ class GraphDeliveryApp:
 
         # se o grafo estiver marcado como direcionado, desenhar seta
         if self.directed_var.get():
-            line = self.canvas.create_line(x1, y1, x2, y2, width=2, fill=self.color_edge, arrow=tk.LAST, smooth=True)
+            line = self.canvas.create_line(x1, y1, x2, y2, width=2, fill=self.color_edge, arrow=tk.LAST, smooth=True,
+                                           tags=("graph", "edge"))
         else:
-            line = self.canvas.create_line(x1, y1, x2, y2, width=2, fill=self.color_edge)
+            line = self.canvas.create_line(x1, y1, x2, y2, width=2, fill=self.color_edge, tags=("graph", "edge"))
+        if self.node_items:
+            # linhas por baixo dos nós (e acima do fundo raster)
+            self.canvas.tag_lower(line, "node")
         self.edge_items[key] = line
+        self._edge_state[key] = self._edge_geometry(u, v)
+        if not self.show_weights:
+            return
 
         # adicionar label com peso no meio da aresta
         # obter peso (usar self.adj[u][v] já que estamos iterando nessa direção)
@@ -464,8 +548,9 @@ class GraphDeliveryApp:
             midx = (x1 + x2) / 2
             midy = (y1 + y2) / 2
             # peso das arestas em cor clara para alto contraste (acessibilidade)
+            size = min(36, max(7, int(self.edge_weight_font_size * self.zoom)))
             txt = self.canvas.create_text(midx, midy, text=str(w), fill=self.edge_weight_color,
-                                          font=("Arial", max(7, self.edge_weight_font_size), "bold"))
+                                          font=("Arial", size, "bold"), tags=("graph", "weight"))
             self.edge_weight_items[key] = txt
         except Exception:
             pass
@@ -473,6 +558,7 @@ class GraphDeliveryApp:
     def update_edge_list(self):
         self.edge_listbox.delete(0, tk.END)
         seen = set()
+        lines = []
 
         for u in self.adj:
             for v in self.adj[u]:
@@ -480,7 +566,9 @@ class GraphDeliveryApp:
                 if key in seen and not self.directed_var.get():
                     continue
                 seen.add(key)
-                self.edge_listbox.insert(tk.END, f"{u} - {v} : {self.adj[u][v]}")
+                lines.append(f"{u} - {v} : {self.adj[u][v]}")
+        if lines:
+            self.edge_listbox.insert(tk.END, *lines)
         # bind seleção (após atualizar)
         self.edge_listbox.bind("<<ListboxSelect>>", self.on_edge_list_select)
 
@@ -551,72 +639,58 @@ class GraphDeliveryApp:
         u = int(u.strip())
         v = int(v.strip())
 
-        directed = self.directed_var.get()
-
-        if v in self.adj[u]:
-            del self.adj[u][v]
-        if not directed and u in self.adj[v]:
-            del self.adj[v][u]
+        self.graph.remove_edge(u, v)
 
         # limpar seleção guardada caso seja a aresta removida
-        key_candidate = (u, v) if directed else tuple(sorted((u, v)))
+        key_candidate = self.graph.edge_key(u, v)
         if self.selected_edge == key_candidate:
             self.selected_edge = None
         self.redraw_edges()
         self.update_edge_list()
 
     def redraw_edges(self):
-        # apagar linhas e textos de pesos existentes
-        for line in self.edge_items.values():
-            self.canvas.delete(line)
-        for txt in self.edge_weight_items.values():
-            self.canvas.delete(txt)
-        self.edge_items.clear()
-        self.edge_weight_items.clear()
-
-        for u in self.adj:
-            for v in self.adj[u]:
-                if not self.directed_var.get() and v < u:
-                    continue
-                self.draw_edge(u, v)
-
-    def update_node_colors(self):
-        # colore todos os nós com a cor padrão, depois aplica origem/destinos e mantém caminho se existir
-        for n, oval in self.node_items.items():
-            # reset fill/outline
-            self.canvas.itemconfig(oval, fill=self.color_node, outline=self.color_node, width=1)
-        # origem
+        # arestas dependem do nível de detalhe da vista: refaz a cena visível
+        self.render()
+
+    def update_node_colors(self, nodes=None):
+        # colore os nós desenhados (ou só `nodes`, ex.: os recém-criados por render) conforme
+        # origem/destinos, início de criação de aresta e caminho atual (por cima)
+        s, dests, path = self._node_roles()
+        on_path = set(path)
+        for n in (self.node_items if nodes is None else nodes):
+            oval = self.node_items.get(n)
+            if not oval:
+                continue
+            fill, outline, width = self.color_node, self.color_node, 1
+            if n == s:
+                fill, outline, width = self.color_origin, self.label_color, 2
+            elif n in dests:
+                # destacar destino com contorno para ficar mais visível
+                fill, outline, width = self.color_destination, self.label_color, 2
+            # se existe nodo marcado como inicio de criação de aresta, mantê-lo destacado
+            if n == self.edge_creation_start:
+                outline, width = self.color_selected, 3
+            if n in on_path:
+                fill = self.color_node_on_path
+                if n == path[0]:
+                    fill = self.color_origin
+                if n == path[-1]:
+                    fill = self.color_destination
+            self.canvas.itemconfig(oval, fill=fill, outline=outline, width=width)
+
+    def _node_roles(self):
         try:
             s = int(self.source_var.get())
-            if s in self.node_items:
-                self.canvas.itemconfig(self.node_items[s], fill=self.color_origin, outline=self.label_color, width=2)
-        except Exception:
-            pass
-        # destinos (multi)
-        try:
-            sels = self.target_listbox.curselection()
-            for i in sels:
-                d = int(self.target_listbox.get(i))
-                if d in self.node_items and (not (hasattr(self, 'source_var') and str(d) == self.source_var.get())):
-                    # destacar destino com contorno para ficar mais visível
-                    self.canvas.itemconfig(self.node_items[d], fill=self.color_destination, outline=self.label_color, width=2)
-        except Exception:
-            pass
-        # se existe nodo marcado como inicio de criação de aresta, mantê-lo destacado
+        except ValueError:
+            s = None
+        dests = set()
         try:
-            if self.edge_creation_start is not None and self.edge_creation_start in self.node_items:
-                oid = self.node_items[self.edge_creation_start]
-                self.canvas.itemconfig(oid, outline=self.color_selected, width=3)
+            for i in self.target_listbox.curselection():
+                dests.add(int(self.target_listbox.get(i)))
         except Exception:
             pass
-        # se existe caminho atual, highlight por cima
-        if self.current_path:
-            for n in self.current_path:
-                if n in self.node_items:
-                    self.canvas.itemconfig(self.node_items[n], fill=self.color_node_on_path)
-            if self.current_path:
-                self.canvas.itemconfig(self.node_items[self.current_path[0]], fill=self.color_origin)
-                self.canvas.itemconfig(self.node_items[self.current_path[-1]], fill=self.color_destination)
+        dests.discard(s)
+        return s, dests, self.current_path or []
 
     def on_source_change(self, *args):
         # quando origem muda, remover destino igual (se selecionado) e atualizar cores
@@ -660,36 +734,9 @@ class GraphDeliveryApp:
     # DIJKSTRA
     # ============================================================
 
-    def dijkstra(self, src):
-        """Dijkstra simples (O(n^2)).
-        Retorna (dist, prev) onde dist[n] é a distância mínima de src a n e prev permite reconstruir caminhos."""
-        INF = float("inf")
-        dist = {node: INF for node in self.adj.keys()}
-        dist[src] = 0
-        prev = {}
-        visited = set()
-
-        while True:
-            # escolher nodo não visitado com menor distância
-            u = None
-            u_dist = INF
-            for node, d in dist.items():
-                if node not in visited and d < u_dist:
-                    u = node
-                    u_dist = d
-            if u is None:
-                break
-            visited.add(u)
-
-            for v, w in self.adj[u].items():
-                if v in visited:
-                    continue
-                nd = dist[u] + w
-                if nd < dist[v]:
-                    dist[v] = nd
-                    prev[v] = u
-
-        return dist, prev
+    def dijkstra(self, src, target=None, heap="binary"):
+        """Ver GraphModel.dijkstra. Retorna (dist, prev)."""
+        return self.graph.dijkstra(src, target=target, heap=heap)
 
     def find_shortest_path(self):
         try:
@@ -714,40 +761,29 @@ class GraphDeliveryApp:
             except:
                 messagebox.showerror("Erro", "Selecione pelo menos um destino.")
                 return
+        order_msg = ""
+        if self.optimize_order_var.get() and len(dests) > 1:
+            dests, before, after = self.graph.optimize_delivery_order(src, dests)
+            order_msg = f" Ordem otimizada: {before:.2f} -> {after:.2f}."
         # percorrer destinos na ordem selecionada: calcular caminho sequencial src->d1, d1->d2, ...
-        total_path = []
-        total_dist = 0.0
-        cur_start = src
-        for dest in dests:
-            dist, prev = self.dijkstra(cur_start)
-            if dest not in dist or dist[dest] == float("inf"):
-                messagebox.showerror("Erro", f"Destino {dest} não alcançável a partir de {cur_start}.")
-                return
-            # reconstruir segmento
-            seg = []
-            c = dest
-            while c != cur_start:
-                seg.append(c)
-                c = prev.get(c)
-                if c is None:
-                    messagebox.showerror("Erro", "Erro ao reconstruir caminho.")
-                    return
-            seg.append(cur_start)
-            seg.reverse()
-            # concatenar sem duplicar o nó de ligação
-            if total_path:
-                # remover último nó pois será igual ao primeiro de seg
-                if total_path[-1] == seg[0]:
-                    total_path.pop()
-            total_path.extend(seg)
-            total_dist += dist[dest]
-            cur_start = dest
+        # (dynamic=True guarda as árvores para reparo incremental em "Simular Falha")
+        try:
+            total_path, total_dist = self.graph.find_shortest_path(src, dests, dynamic=True)
+        except RouteError as e:
+            messagebox.showerror("Erro", str(e))
+            return
 
+        self.current_route = (src, dests)
         self.current_path = total_path
         self.highlight_path(total_path)
         # animar
         self.animate_route()
-        self.status_var.set(f"Caminho calculado (dist total={total_dist:.2f}).")
+        stats = self.graph.last_route_stats
+        cache = self.graph.route_cache
+        self.status_var.set(f"Caminho calculado (dist total={total_dist:.2f}; "
+                            f"{stats['searches']} buscas para {stats['legs']} trechos, "
+                            f"{self.graph.searches_saved} poupadas no total; "
+                            f"cache {cache.hits} acertos/{cache.misses} falhas).{order_msg}")
         # manter seleção visual (se houver)
         if self.selected_edge:
             self.highlight_selected_edge(self.selected_edge)
@@ -757,6 +793,10 @@ class GraphDeliveryApp:
     # ============================================================
 
     def highlight_path(self, path):
+        # em modo raster os nós/arestas da rota podem não ser itens ainda: render() os fixa
+        if (any(n not in self.node_items for n in path)
+                or any(self.graph.edge_key(u, v) not in self.edge_items for u, v in zip(path, path[1:]))):
+            self.render()
         self.clear_highlight()
 
         directed = self.directed_var.get()
@@ -802,29 +842,53 @@ class GraphDeliveryApp:
     # ============================================================
 
     def simulate_failure_and_reroute(self):
-        if not self.current_path or len(self.current_path) < 2:
+        # plano de frota (Roteirizar) não guarda current_route: só rotas de "Menor Caminho"
+        if not self.current_path or len(self.current_path) < 2 or self.current_route is None:
             messagebox.showerror("Erro", "Calcule primeiro o caminho.")
             return
 
-        idx = random.randint(0, len(self.current_path)-2)
-        u = self.current_path[idx]
-        v = self.current_path[idx+1]
-
-        directed = self.directed_var.get()
-
-        removed = False
-        if v in self.adj[u]:
-            del self.adj[u][v]
-            removed = True
-        if not directed and u in self.adj.get(v, {}):
-            del self.adj[v][u]
+        src, dests = self.current_route
+        version = self.graph.version
+        u, v, removed = self.graph.simulate_failure(self.current_path)
 
         if removed:
             self.status_var.set(f"Aresta {u}-{v} removida.")
             self.redraw_edges()
 
-        # recalcula e anima automaticamente
-        self.find_shortest_path()
+        # recalcula (só os trechos afetados) e anima automaticamente
+        try:
+            total_path, total_dist = self.graph.reroute_after_failure(src, dests, u, v, version)
+        except RouteError as e:
+            messagebox.showerror("Erro", str(e))
+            return
+        self.current_path = total_path
+        self.highlight_path(total_path)
+        self.animate_route()
+        info = self.graph.last_reroute
+        legs = ", ".join(str(k + 1) for k in info["recomputed"]) or "nenhum"
+        self.status_var.set(f"Aresta {u}-{v} removida. Nova dist total={total_dist:.2f} "
+                            f"(trechos recalculados: {legs}; {info['affected']} nós afetados).")
+
+    def show_resilience_report(self):
+        """Mostra a tabela de criticidade: quanto a rota atual piora se cada aresta falhar."""
+        if not self.current_route:
+            messagebox.showerror("Erro", "Calcule primeiro o caminho.")
+            return
+        src, dests = self.current_route
+        rows = self.graph.resilience_sweep(src, dests)
+        if not rows:
+            messagebox.showinfo("Resiliência", "A rota atual não usa nenhuma aresta.")
+            return
+        lines = []
+        for r in rows[:15]:
+            u, v = r["edge"]
+            delta = "desconecta" if r["delta"] == float("inf") else f"+{r['delta']:.2f}"
+            lines.append(f"{u} - {v}: {delta}")
+        if len(rows) > 15:
+            lines.append(f"... (+{len(rows) - 15} arestas)")
+        messagebox.showinfo("Resiliência (custo extra se a aresta falhar)", "\n".join(lines))
+        # destacar a aresta mais crítica
+        self.highlight_single_edge(rows[0]["edge"])
 
     # ============================================================
     # ANIMAÇÃO DO CAMINHÃO
@@ -834,91 +898,132 @@ class GraphDeliveryApp:
         if not self.current_path:
             messagebox.showerror("Erro", "Nenhuma rota para animar.")
             return
-
-        # Remover caminhão antigo
-        if self.truck_id:
-            self.canvas.delete(self.truck_id)
-
-        # Ponto inicial (centrado)
-        x, y = self.positions[self.current_path[0]]
-
-        # Criar caminhão
-        self.truck_image = ImageTk.PhotoImage(self.truck_original)
-        self.truck_id = self.canvas.create_image(x, y, image=self.truck_image, anchor="center")
-
-        self.animate_segment(0)
-
-    def animate_segment(self, index):
-        if index >= len(self.current_path)-1:
-            self.status_var.set("Entrega concluída!")
+        self.stop_animation()
+        self.start_vehicle("truck", self.current_path)
+        self._fleet_done = lambda: self.status_var.set(
+            "Entrega concluída!" + (f" ({self._fleet_report()})" if self.debug_var.get() else ""))
+
+    def animate_fleet(self, routes):
+        """Anima vários caminhões ao mesmo tempo, um por caminho (lista de nós) em routes."""
+        self.stop_animation()
+        for i, path in enumerate(routes):
+            if len(path) > 1:
+                self.start_vehicle(i, path)
+        self._fleet_done = lambda: self.status_var.set(
+            f"Frota: {len(self.vehicles)} entregas concluídas ({self._fleet_report()}).")
+
+    def simulate_fleet(self):
+        # FLEET_SIZE caminhões saindo da origem para destinos sorteados (uma única árvore de caminhos)
+        try:
+            src = int(self.source_var.get())
+        except ValueError:
+            messagebox.showerror("Erro", "Selecione a origem.")
             return
+        dist, prev = self.graph.shortest_path_tree(src)
+        reachable = [v for v in dist if v != src]
+        if not reachable:
+            messagebox.showerror("Erro", "Nenhum destino alcançável a partir da origem.")
+            return
+        rng = random.Random()
+        dests = [rng.choice(reachable) for _ in range(FLEET_SIZE)]
+        self.animate_fleet([reconstruct_path(prev, src, d) for d in dests])
+        self.status_var.set(f"Frota: {len(self.vehicles)} caminhões em rota.")
 
-        u = self.current_path[index]
-        v = self.current_path[index+1]
-
-        x1, y1 = self.positions[u]
-        x2, y2 = self.positions[v]
-
-        # ângulo de rotação
-        dx = x2 - x1
-        dy = y2 - y1
-        ang = math.degrees(math.atan2(dy, dx))
-
-        # Rotaciona a imagem
-        rotated = self.truck_original.rotate(-ang, expand=True)
-        self.truck_image = ImageTk.PhotoImage(rotated)
-        self.canvas.itemconfig(self.truck_id, image=self.truck_image)
-
-        steps = int(35 / self.speed_var.get())  # muda recuperação
-        delay = int(18 / self.speed_var.get())
-
-        self.animate_move(x1, y1, x2, y2, steps, delay,
-                          callback=lambda: self.animate_segment(index+1))
-
-    def animate_move(self, x1, y1, x2, y2, steps, delay, callback):
-        # proteger contra passos inválidos / ausência do caminhão
-        if steps <= 0:
-            callback()
+    def plan_fleet_routes(self):
+        try:
+            src = int(self.source_var.get())
+            capacity = self.capacity_var.get()
+        except (ValueError, tk.TclError):
+            messagebox.showerror("Erro", "Selecione a origem e uma capacidade válida.")
             return
-        if not self.truck_id:
-            callback()
+        dests = [int(self.target_listbox.get(i)) for i in self.target_listbox.curselection()]
+        if not dests:
+            messagebox.showerror("Erro", "Selecione pelo menos um destino.")
             return
-
-        dx = (x2 - x1) / steps
-        dy = (y2 - y1) / steps
-
-        def step(i=0):
-            # item pode ter sido removido durante animação
-            if not self.truck_id:
-                callback()
-                return
-            if i >= steps:
-                # garantir posição final exata
-                try:
-                    self.canvas.coords(self.truck_id, x2, y2)
-                except:
-                    pass
-                callback()
-                return
-
-            # ler posição atual e aplicar deslocamento incremental
-            try:
-                coords = self.canvas.coords(self.truck_id)
-                if coords and len(coords) >= 2:
-                    cx, cy = coords[0], coords[1]
-                    self.canvas.coords(self.truck_id, cx + dx, cy + dy)
-                else:
-                    # fallback: definir diretamente em função do passo
-                    newx = x1 + dx * (i + 1)
-                    newy = y1 + dy * (i + 1)
-                    self.canvas.coords(self.truck_id, newx, newy)
-            except Exception:
-                # em caso de erro com coords, avançar sem travar
-                pass
-
-            self.canvas.after(delay, lambda: step(i+1))
-
-        step()
+        try:
+            paths = self.graph.plan_fleet(src, dests, capacity)
+        except RouteError as e:
+            messagebox.showerror("Erro", str(e))
+            return
+        # as rotas começam e terminam na origem: juntas formam um único passeio para o destaque
+        walk = [src]
+        for path in paths:
+            walk.extend(path[1:])
+        self.current_route = None
+        self.current_path = walk
+        self.highlight_path(walk)
+        self.animate_fleet(paths)
+        stats = self.graph.last_fleet_stats
+        self.status_var.set(f"{stats['trucks']} caminhões (cargas {stats['loads']}), "
+                            f"custo total {stats['cost']:.2f}, {stats['seconds']:.2f} s.")
+
+    def start_vehicle(self, key, path):
+        """Coloca um caminhão percorrendo `path`; cada trecho dura o mesmo que na animação
+        passo a passo anterior (passos x atraso, ambos divididos pela velocidade)."""
+        speed = self.speed_var.get()
+        leg = (35 / speed) * (18 / speed) / 1000
+        track = Track.uniform([self.positions[u] for u in path], leg)
+        x, y, ang = track.at(0)
+        k = self._heading_index(ang)
+        item = self.canvas.create_image(*self._to_screen(x, y), image=self._truck_sprite(k),
+                                        anchor="center", tags=("vehicle",))
+        self.vehicles[key] = [item, k, x, y]
+        self.fleet.add(key, track)
+        if self._fleet_job is None:
+            self._fleet_job = self.canvas.after(FRAME_MS, self._fleet_tick)
+
+    def stop_animation(self):
+        if self._fleet_job is not None:
+            self.canvas.after_cancel(self._fleet_job)
+            self._fleet_job = None
+        self.canvas.delete("vehicle")
+        self.vehicles.clear()
+        self.fleet.clear()
+        self._fleet_done = None
+
+    def _fleet_tick(self):
+        # um quadro para todos os caminhões: posição pelo tempo decorrido, sem ler o canvas
+        self._fleet_job = None
+        positions, _ = self.fleet.tick()
+        coords = self.canvas.coords
+        for key, (x, y, ang) in positions.items():
+            state = self.vehicles[key]
+            coords(state[0], *self._to_screen(x, y))
+            state[2] = x
+            state[3] = y
+            k = self._heading_index(ang)
+            if k != state[1]:
+                state[1] = k
+                self.canvas.itemconfig(state[0], image=self._truck_sprite(k))
+        if len(self.fleet):
+            self._fleet_job = self.canvas.after(self.fleet.next_delay(), self._fleet_tick)
+        elif self._fleet_done is not None:
+            done, self._fleet_done = self._fleet_done, None
+            done()
+
+    def _place_vehicles(self):
+        # após pan/zoom: recoloca os caminhões (inclusive parados) a partir do mundo
+        for item, _, x, y in self.vehicles.values():
+            self.canvas.coords(item, *self._to_screen(x, y))
+        self.canvas.tag_raise("vehicle")
+
+    def _fleet_report(self):
+        f = self.fleet
+        return f"{f.fps:.0f} fps, {f.frames} quadros, {f.skipped} pulados"
+
+    def _heading_index(self, ang):
+        # direção em graus -> uma das TRUCK_HEADINGS direções pré-renderizadas
+        return round(ang * TRUCK_HEADINGS / 360) % TRUCK_HEADINGS
+
+    def _truck_sprite(self, k):
+        """PhotoImage do caminhão na direção k (de TRUCK_HEADINGS). Cada direção é rotacionada
+        uma única vez e reaproveitada (memoização)."""
+        sprite = self._truck_sprites.get(k)
+        if sprite is None:
+            # feito uma vez só por direção: dá para pagar a interpolação bicúbica
+            rotated = self.truck_original.rotate(-k * 360 / TRUCK_HEADINGS, resample=Image.BICUBIC, expand=True)
+            sprite = self._truck_sprites[k] = ImageTk.PhotoImage(rotated)
+        return sprite
 
     def _make_button(self, parent, text, cmd, **grid_opts):
         """Cria um tk.Button flat com hover e aplica grid usando grid_opts."""
@@ -945,51 +1050,52 @@ class GraphDeliveryApp:
             b.grid(**grid_opts)
         return b
 
+    def import_graph(self):
+        path = filedialog.askopenfilename(
+            title="Importar grafo",
+            filetypes=[("Lista de arestas", "*.csv *.txt"), ("DIMACS", "*.gr"), ("Todos", "*.*")])
+        if not path:
+            return
+        self.clear_graph()
+        try:
+            if path.endswith(".gr"):
+                co = path[:-3] + ".co"
+                read_dimacs(path, coords=co if os.path.exists(co) else None, graph=self.graph)
+            else:
+                read_edge_csv(path, directed=self.directed_var.get(), graph=self.graph)
+        except (OSError, ValueError, IndexError) as e:
+            self.graph.reset()
+            messagebox.showerror("Erro", f"Falha ao importar {os.path.basename(path)}: {e}")
+            return
+        self.directed_var.set(self.graph.directed)
+        self._adjust_scale()
+        if len(self.positions) == self.n_nodes:
+            self.graph.fit_layout(self.canvas_size)
+        else:
+            self.generate_circle_layout()
+        self.update_edge_list()
+        self.update_menus()
+        self.render()
+        self.status_var.set(f"Importado: {self.n_nodes} nós, {sum(1 for _ in self.graph.edges())} arestas.")
+
     # Novo: cria grafo aleatório conectado, com arestas e define origem/destino automaticamente
     def create_random_complete(self):
         # criar nós com layout aleatório
         n = self.node_count_var.get()
         self.clear_graph()
         self.n_nodes = n
-        for i in range(n):
-            self.adj[i] = {}
         # ajustar escala antes de gerar layout/descrições
         self._adjust_scale()
-        self.generate_random_layout()
-        for i in range(n):
-            x, y = self.positions[i]
-            self.draw_node(i, x, y)
-
-        # garantir conectividade: criar uma árvore geradora aleatória
-        for i in range(1, n):
-            j = random.randint(0, i-1)
-            w = round(random.uniform(1.0, 10.0), 1)
-            # adicionar aresta em ambos sentidos para garantir conectividade (se não direcionado)
-            self.adj[i][j] = w
-            if not self.directed_var.get():
-                self.adj[j][i] = w
-
-        # adicionar algumas arestas extras aleatórias
-        extra_prob = 0.25
-        for u in range(n):
-            for v in range(u+1, n):
-                if random.random() < extra_prob:
-                    w = round(random.uniform(1.0, 10.0), 1)
-                    self.adj[u][v] = w
-                    if not self.directed_var.get():
-                        self.adj[v][u] = w
-
-        # desenhar arestas
-        self.redraw_edges()
+        pair = self.graph.create_random_complete(n, self.canvas_size, self.node_radius)
+
         self.update_edge_list()
         self.update_menus()
+        # desenhar nós e arestas (só o que cabe na vista)
+        self.render()
 
-        # escolher origem e destino distintos
-        if n >= 2:
-            s = random.randint(0, n-1)
-            t = s
-            while t == s:
-                t = random.randint(0, n-1)
+        # origem e destino distintos sorteados pelo modelo
+        if pair is not None:
+            s, t = pair
             self.source_var.set(str(s))
             self.target_var.set(str(t))
 
@@ -999,44 +1105,18 @@ class GraphDeliveryApp:
         self.update_node_colors()
 
     def on_canvas_click(self, event):
-        # encontra a aresta mais próxima do clique e a destaca
-        best = None
-        bestd = float("inf")
-        px, py = event.x, event.y
-        for key in list(self.edge_items.keys()):
-            # key pode ser (u,v) se direcionado, ou tuple(sorted((u,v))) se não
-            try:
-                u, v = key
-            except Exception:
-                continue
-            x1, y1 = self.positions.get(u, (None, None))
-            x2, y2 = self.positions.get(v, (None, None))
-            if x1 is None or x2 is None:
-                continue
-            d = self._point_segment_distance(px, py, x1, y1, x2, y2)
-            if d < bestd:
-                bestd = d
-                best = key
-        # tolerância em pixels para evitar selecionar por engano
-        if best is not None and bestd <= 10:
+        # encontra a aresta mais próxima do clique (índice espacial) e a destaca
+        px, py = self._to_world(event.x, event.y)
+        # tolerância de 10 px na tela para evitar selecionar por engano
+        best = self.graph.spatial_index().nearest_edge(px, py, 10 / self.zoom)
+        if best is not None:
+            if best not in self.edge_items:
+                # aresta no fundo raster: vira item (fixado como seleção) antes do destaque
+                self.selected_edge = best
+                self.render()
             # destacar apenas a aresta clicada
             self.highlight_single_edge(best)
 
-    def _point_segment_distance(self, px, py, x1, y1, x2, y2):
-        # distância do ponto (px,py) ao segmento (x1,y1)-(x2,y2)
-        vx = x2 - x1
-        vy = y2 - y1
-        wx = px - x1
-        wy = py - y1
-        vv = vx*vx + vy*vy
-        if vv == 0:
-            return math.hypot(px - x1, py - y1)
-        t = (vx*wx + vy*wy) / vv
-        t = max(0.0, min(1.0, t))
-        cx = x1 + t*vx
-        cy = y1 + t*vy
-        return math.hypot(px - cx, py - cy)
-
     # ---------------------------
     # Drag & Drop dos nós no Canvas
     # ---------------------------
@@ -1045,19 +1125,11 @@ class GraphDeliveryApp:
         - Se Ctrl pressionado: iniciar/confirmar criação de aresta (primeiro/segundo nó).
         - Caso contrário: se clicou em nó inicia arrasto; senão tenta selecionar aresta.
         """
-        # procurar nó clicado (verifica pontos internos usando coords dos ovais)
-        found = None
-        for node, oval_id in self.node_items.items():
-            try:
-                x1, y1, x2, y2 = self.canvas.coords(oval_id)
-            except Exception:
-                continue
-            cx = (x1 + x2) / 2
-            cy = (y1 + y2) / 2
-            r = (x2 - x1) / 2
-            if math.hypot(event.x - cx, event.y - cy) <= r:
-                found = node
-                break
+        # procurar nó clicado no índice espacial (coordenadas de mundo; raio do nó na tela)
+        wx, wy = self._to_world(event.x, event.y)
+        found = self.graph.spatial_index().nearest_node(wx, wy, self._screen_radius() / self.zoom)
+        if found is not None:
+            cx, cy = self._to_screen(*self.positions[found])
 
         # detectar Ctrl (bit 0x4); tentar ambos métodos de máscara por compatibilidade
         ctrl = (event.state & 0x4) != 0 or (event.state & 0x0004) != 0
@@ -1079,6 +1151,8 @@ class GraphDeliveryApp:
             if self.edge_creation_start is None:
                 # marcar primeiro nó
                 self.edge_creation_start = found
+                if found not in self.node_items:
+                    self.render()
                 # destacar visualmente
                 try:
                     oid = self.node_items[found]
@@ -1116,6 +1190,9 @@ class GraphDeliveryApp:
             # opcional: armazenar offset se quiser fixar ponto de clique relativo ao centro
             self.drag_data["offset_x"] = event.x - cx
             self.drag_data["offset_y"] = event.y - cy
+            if found not in self.node_items:
+                # nó no fundo raster: passa a ser item (fixado enquanto arrastado)
+                self.render()
         else:
             # não clicou em nó: comport. anterior (seleção de aresta)
             try:
@@ -1124,29 +1201,40 @@ class GraphDeliveryApp:
                 pass
 
     def on_canvas_drag(self, event):
-        """Ao arrastar (B1-Motion):
-        - Atualiza posição do nó em self.positions.
-        - Move o oval/texto do nó e atualiza arestas/pesos conectados chamando update_all_edges_positions.
-        """
+        """Ao arrastar (B1-Motion): guarda só a última posição do mouse e agenda uma atualização
+        por quadro (_apply_drag); eventos intermediários do mesmo quadro são descartados."""
+        if self.drag_data.get("item") is None:
+            return
+        self.drag_data["pending"] = (event.x, event.y)
+        if self._drag_job is None:
+            self._drag_job = self.canvas.after(FRAME_MS, self._apply_drag)
+
+    def _apply_drag(self):
+        """Move o nó arrastado para a última posição pendente: modelo, oval/texto e só as
+        arestas/pesos incidentes a ele."""
+        self._drag_job = None
         node = self.drag_data.get("item")
-        if node is None:
+        pending = self.drag_data.pop("pending", None)
+        if node is None or pending is None:
             return
         # nova posição centrada no mouse (usar offset para manter posição relativa)
         ox = self.drag_data.get("offset_x", 0)
         oy = self.drag_data.get("offset_y", 0)
-        newx = event.x - ox
-        newy = event.y - oy
+        newx = pending[0] - ox
+        newy = pending[1] - oy
         # limitar dentro do canvas (opcional)
-        margin = self.node_radius + 4
+        r = self._screen_radius()
+        margin = r + 4
         newx = max(margin, min(self.canvas_size - margin, newx))
         newy = max(margin, min(self.canvas_size - margin, newy))
 
-        # atualizar modelo
-        self.positions[node] = (newx, newy)
+        # atualizar modelo (posições em coordenadas de mundo)
+        wx, wy = self._to_world(newx, newy)
+        self.graph.move_node(node, wx, wy)
+        self._node_state[node] = (wx, wy)
         # atualizar oval e label
         oval_id = self.node_items.get(node)
         txt_id = self.node_label_items.get(node)
-        r = self.node_radius
         try:
             if oval_id:
                 self.canvas.coords(oval_id, newx - r, newy - r, newx + r, newy + r)
@@ -1155,48 +1243,318 @@ class GraphDeliveryApp:
         except Exception:
             pass
 
-        # atualizar todas as arestas/pesos conectados (simples e robusto)
-        self.update_all_edges_positions()
+        self.update_incident_edges(node)
 
     def on_canvas_release(self, event):
-        """Mouse up: finaliza arrasto."""
+        """Mouse up: aplica a última posição pendente e finaliza arrasto."""
+        dragged = self.drag_data.get("item") is not None
+        if self._drag_job is not None:
+            self.canvas.after_cancel(self._drag_job)
+            self._apply_drag()
         self.drag_data["item"] = None
+        if dragged:
+            # arestas no fundo raster ou que entraram na vista só aparecem ao sincronizar a cena
+            self.render()
         # remover offsets
         self.drag_data.pop("offset_x", None)
         self.drag_data.pop("offset_y", None)
 
-    def update_all_edges_positions(self):
-        """Recalcula coordenadas de linhas (ou loops) e textos de peso para acompanhar posições atualizadas dos nós."""
+    def update_incident_edges(self, node):
+        """Recalcula coordenadas das linhas e textos de peso das arestas que tocam `node`
+        (índice nó -> arestas do SpatialIndex), em vez de percorrer todas as arestas."""
+        for key in self.graph.spatial_index().incident.get(node, ()):
+            line_id = self.edge_items.get(key)
+            if not line_id:
+                continue  # aresta fora da vista ou no fundo raster
+            p1 = self.positions[key[0]]
+            p2 = self.positions[key[1]]
+            x1, y1 = self._to_screen(*p1)
+            x2, y2 = self._to_screen(*p2)
+            self.canvas.coords(line_id, x1, y1, x2, y2)
+            state = self._edge_state.get(key)
+            if state:
+                self._edge_state[key] = p1 + p2 + state[4:]
+            # atualizar texto do peso (se existir)
+            txt_id = self.edge_weight_items.get(key)
+            if txt_id:
+                self.canvas.coords(txt_id, (x1 + x2) / 2, (y1 + y2) / 2)
+
+    # ============================================================
+    # VISTA (PAN/ZOOM) E NÍVEL DE DETALHE
+    # ============================================================
+
+    def _to_screen(self, x, y):
+        return x * self.zoom + self.pan_x, y * self.zoom + self.pan_y
+
+    def _to_world(self, sx, sy):
+        return (sx - self.pan_x) / self.zoom, (sy - self.pan_y) / self.zoom
+
+    def _screen_radius(self):
+        return max(2, self.node_radius * self.zoom)
+
+    def _pinned(self):
+        """Nós e arestas que sempre viram itens do canvas (origem, destinos, rota, seleção),
+        mesmo fora da vista ou com o resto do grafo no fundo raster."""
+        nodes = set()
+        edges = set()
         try:
-            for key, line_id in list(self.edge_items.items()):
-                # obter nós u,v a partir da key (key foi (u,v) ou tuple(sorted))
-                try:
-                    u, v = key
-                except Exception:
-                    continue
-                p1 = self.positions.get(u)
-                p2 = self.positions.get(v)
-                if not p1 or not p2:
-                    continue
-                x1, y1 = p1
-                x2, y2 = p2
-                # atualizar linha
-                try:
-                    self.canvas.coords(line_id, x1, y1, x2, y2)
-                except Exception:
-                    pass
-                # atualizar texto do peso (se existir)
-                txt_id = self.edge_weight_items.get(key)
-                if txt_id:
-                    try:
-                        midx = (x1 + x2) / 2
-                        midy = (y1 + y2) / 2
-                        self.canvas.coords(txt_id, midx, midy)
-                    except Exception:
-                        pass
-        except Exception:
-            # segurança: ignorar erros durante movimento para não travar UI
+            nodes.add(int(self.source_var.get()))
+        except ValueError:
             pass
+        for i in self.target_listbox.curselection():
+            nodes.add(int(self.target_listbox.get(i)))
+        for n in (self.edge_creation_start, self.drag_data.get("item")):
+            if n is not None:
+                nodes.add(n)
+        path = self.current_path or []
+        nodes.update(path)
+        edges.update(self.graph.edge_key(u, v) for u, v in zip(path, path[1:]))
+        if self.selected_edge:
+            edges.add(self.selected_edge)
+        # rota antiga pode conter a aresta que acabou de falhar
+        edges = {(u, v) for u, v in edges if v in self.adj.get(u, ())}
+        for e in edges:
+            nodes.update(e)
+        return [n for n in nodes if n in self.positions], edges
+
+    def render(self):
+        """Sincroniza o canvas com a cena visível. Até MAX_*_ITEMS cada nó/aresta na vista vira um
+        item do canvas; acima disso vão para uma imagem PIL de fundo e só os itens fixados
+        (_pinned) continuam interativos. Assim o canvas guarda O(itens visíveis), não O(grafo).
+
+        A atualização é por diferença: itens cujo nó/aresta não mudou ficam intactos, e só os que
+        entraram, saíram, mudaram de posição ou de peso geram chamadas ao Tk."""
+        t0 = time.perf_counter()
+        if self._render_job is not None:
+            self.canvas.after_cancel(self._render_job)
+            self._render_job = None
+
+        # retângulo visível em coordenadas de mundo (folga de um raio para nós na borda)
+        pad = self.node_radius
+        x0, y0 = self._to_world(0, 0)
+        x1, y1 = self._to_world(self.canvas_size, self.canvas_size)
+        x0 -= pad
+        y0 -= pad
+        x1 += pad
+        y1 += pad
+        pos = self.positions
+        directed = self.graph.directed
+        # recorte pelo índice espacial: arestas cuja caixa toca a vista
+        index = self.graph.spatial_index()
+        nodes = index.nodes_in(x0, y0, x1, y1)
+        edges = index.edges_in(x0, y0, x1, y1)
+
+        pinned_nodes, pinned_edges = self._pinned()
+        raster_edges = len(edges) > MAX_EDGE_ITEMS
+        raster_nodes = len(nodes) > MAX_NODE_ITEMS
+        self.show_weights = (not raster_edges and len(edges) <= MAX_LABEL_ITEMS
+                             and self.zoom >= LABEL_MIN_ZOOM)
+
+        # zoom, tamanho dos nós, direção e pesos mudam a aparência de todos os itens: recria a cena
+        style = (self.zoom, self.node_radius, directed, self.show_weights)
+        created = moved = deleted = 0
+        if self._scene is None or self._scene["style"] != style:
+            deleted += len(self.node_items) + len(self.edge_items)
+            self._discard_scene()
+            self._scene = {"style": style, "pan": (self.pan_x, self.pan_y)}
+        # pan desde a última sincronização (sem move() nos itens): todos precisam de coords novas
+        panned = self._scene["pan"] != (self.pan_x, self.pan_y)
+        self._scene["pan"] = (self.pan_x, self.pan_y)
+
+        raster_key = (self.zoom, self.pan_x, self.pan_y, self.graph.version, self.graph.layout_version,
+                      raster_edges, raster_nodes)
+        if not (raster_edges or raster_nodes):
+            self.canvas.delete("raster")
+            self._raster_image = None
+            self._raster_key = None
+        elif raster_key != self._raster_key:
+            self.canvas.delete("raster")
+            self._draw_raster(edges if raster_edges else (), nodes if raster_nodes else ())
+            self._raster_key = raster_key
+
+        # nós
+        want_nodes = dict.fromkeys(pinned_nodes if raster_nodes else nodes + pinned_nodes)
+        for i in [i for i in self.node_items if i not in want_nodes]:
+            self.canvas.delete(self.node_items.pop(i))
+            label = self.node_label_items.pop(i, None)
+            if label:
+                self.canvas.delete(label)
+            self._node_state.pop(i, None)
+            deleted += 1
+        new_nodes = []
+        r = self._screen_radius()
+        for i in want_nodes:
+            p = pos[i]
+            if i not in self.node_items:
+                self.draw_node(i, *p)
+                new_nodes.append(i)
+                created += 1
+            elif panned or self._node_state.get(i) != p:
+                x, y = self._to_screen(*p)
+                self.canvas.coords(self.node_items[i], x - r, y - r, x + r, y + r)
+                label = self.node_label_items.get(i)
+                if label:
+                    self.canvas.coords(label, x, y)
+                self._node_state[i] = p
+                moved += 1
+
+        # arestas
+        edge_key = self.graph.edge_key
+        want_edges = {}
+        for u, v in (list(pinned_edges) if raster_edges else edges + list(pinned_edges)):
+            want_edges[edge_key(u, v)] = (u, v)
+        for key in [k for k in self.edge_items if k not in want_edges]:
+            self.canvas.delete(self.edge_items.pop(key))
+            txt = self.edge_weight_items.pop(key, None)
+            if txt:
+                self.canvas.delete(txt)
+            self._edge_state.pop(key, None)
+            deleted += 1
+        new_edges = []
+        for key, (u, v) in want_edges.items():
+            state = self._edge_geometry(u, v)
+            old = self._edge_state.get(key)
+            if key not in self.edge_items:
+                self.draw_edge(u, v)
+                new_edges.append(key)
+                created += 1
+            elif panned or old != state:
+                if old is None or old[4] != state[4]:
+                    txt = self.edge_weight_items.get(key)
+                    if txt:
+                        self.canvas.itemconfig(txt, text=str(state[4]))
+                self._move_edge_items(key, state)
+                moved += 1
+
+        self._place_vehicles()
+        self._restore_highlights(new_nodes, new_edges)
+        self._update_debug_overlay((time.perf_counter() - t0) * 1000, created, moved, deleted)
+
+    def _discard_scene(self):
+        # apaga todos os itens do grafo (não o caminhão nem o overlay)
+        self.canvas.delete("graph")
+        self.node_items.clear()
+        self.node_label_items.clear()
+        self.edge_items.clear()
+        self.edge_weight_items.clear()
+        self._node_state.clear()
+        self._edge_state.clear()
+        self._raster_image = None
+        self._raster_key = None
+        self._scene = None
+
+    def _edge_geometry(self, u, v):
+        # estado desenhado de uma aresta: extremos (mundo) e peso
+        (x1, y1), (x2, y2) = self.positions[u], self.positions[v]
+        w = self.adj.get(u, {}).get(v)
+        if w is None:
+            w = self.adj.get(v, {}).get(u, "")
+        return x1, y1, x2, y2, w
+
+    def _move_edge_items(self, key, state):
+        x1, y1 = self._to_screen(state[0], state[1])
+        x2, y2 = self._to_screen(state[2], state[3])
+        self.canvas.coords(self.edge_items[key], x1, y1, x2, y2)
+        txt = self.edge_weight_items.get(key)
+        if txt:
+            self.canvas.coords(txt, (x1 + x2) / 2, (y1 + y2) / 2)
+        self._edge_state[key] = state
+
+    def _update_debug_overlay(self, ms, created, moved, deleted):
+        """Tempo do último render e itens criados/movidos/apagados (caixa "Debug")."""
+        self.canvas.delete("overlay")
+        if not self.debug_var.get():
+            return
+        items = (len(self.node_items) + len(self.node_label_items) + len(self.edge_items)
+                 + len(self.edge_weight_items) + (self._raster_image is not None))
+        text = (f"render {ms:.1f} ms  +{created} ~{moved} -{deleted}  "
+                f"itens {items}{'  raster' if self._raster_image is not None else ''}  zoom {self.zoom:.2f}")
+        self.canvas.create_text(8, 8, text=text, anchor="nw", fill="#f1c40f",
+                                font=("Courier", 9), tags=("overlay",))
+
+    def _draw_raster(self, edges, nodes):
+        """Desenha arestas/nós densos numa única imagem (um item do canvas, abaixo de todos)."""
+        img = Image.new("RGBA", (self.canvas_size, self.canvas_size), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(img)
+        z = self.zoom
+        px = self.pan_x
+        py = self.pan_y
+        pos = self.positions
+        for u, v in edges:
+            ux, uy = pos[u]
+            vx, vy = pos[v]
+            draw.line((ux * z + px, uy * z + py, vx * z + px, vy * z + py), fill=self.color_edge)
+        r = min(3, self._screen_radius())
+        for i in nodes:
+            x, y = pos[i]
+            x = x * z + px
+            y = y * z + py
+            draw.ellipse((x - r, y - r, x + r, y + r), fill=self.color_node)
+        self._raster_image = ImageTk.PhotoImage(img)
+        item = self.canvas.create_image(0, 0, image=self._raster_image, anchor="nw", tags=("graph", "raster"))
+        self.canvas.tag_lower(item)
+
+    def _restore_highlights(self, nodes, edges):
+        # itens recém-criados nascem com o estilo padrão: aplica origem/destinos/rota e seleção só neles
+        self.update_node_colors(nodes)
+        path = self.current_path or []
+        on_path = {self.graph.edge_key(u, v) for u, v in zip(path, path[1:])}
+        for key in edges:
+            if key in on_path:
+                self.canvas.itemconfig(self.edge_items[key], fill=self.color_edge_highlight, width=4)
+            elif key == self.selected_edge:
+                self.canvas.itemconfig(self.edge_items[key], fill=self.color_selected, width=4)
+
+    def _schedule_render(self, delay=120):
+        # agrupa vários eventos (roda do mouse) num único render
+        if self._render_job is not None:
+            self.canvas.after_cancel(self._render_job)
+        self._render_job = self.canvas.after(delay, self.render)
+
+    def reset_view(self):
+        self.zoom = 1.0
+        self.pan_x = 0.0
+        self.pan_y = 0.0
+        self.render()
+
+    def on_pan_start(self, event):
+        self._pan_last = (event.x, event.y)
+
+    def on_pan_move(self, event):
+        # durante o arrasto só desloca os itens existentes; render() ao soltar completa a vista
+        if self._pan_last is None:
+            return
+        dx = event.x - self._pan_last[0]
+        dy = event.y - self._pan_last[1]
+        self._pan_last = (event.x, event.y)
+        self.pan_x += dx
+        self.pan_y += dy
+        self.canvas.move("graph", dx, dy)
+        self.canvas.move("vehicle", dx, dy)
+        if self._scene is not None:
+            # itens já deslocados: continuam coerentes com a vista
+            self._scene["pan"] = (self.pan_x, self.pan_y)
+            self._raster_key = None
+
+    def on_pan_end(self, event):
+        self._pan_last = None
+        self.render()
+
+    def on_zoom(self, event):
+        # Windows/macOS: event.delta; X11: botões 4 (cima) e 5 (baixo)
+        up = event.num == 4 or getattr(event, "delta", 0) > 0
+        zoom = min(MAX_ZOOM, max(MIN_ZOOM, self.zoom * (ZOOM_STEP if up else 1 / ZOOM_STEP)))
+        f = zoom / self.zoom
+        if f == 1:
+            return
+        # mantém fixo o ponto sob o cursor
+        self.zoom = zoom
+        self.pan_x = event.x - (event.x - self.pan_x) * f
+        self.pan_y = event.y - (event.y - self.pan_y) * f
+        # prévia imediata escalando os itens; o redesenho com o LOD certo vem logo depois
+        self.canvas.scale("graph", event.x, event.y, f, f)
+        self.canvas.scale("vehicle", event.x, event.y, f, f)
+        self._schedule_render()
 
 
 # ============================================================
@@ -0,0 +1,48 @@
+"""Grafos sorteados (com semente) para os testes."""
+
+import math
+
+
+def random_adj(n, rng, directed=False, extra=2, integer=False, with_positions=False):
+    """adj {u: {v: w}} conexo a partir do nó 0: árvore aleatória + extra * n arestas sorteadas.
+    Os nós ficam no quadrado 1000x1000 e o peso é a distância vezes um fator em [1, 2)
+    (a heurística euclidiana continua admissível); integer=True arredonda os pesos para cima.
+    with_positions=True retorna (adj, positions)."""
+    pos = {i: (rng.random() * 1000, rng.random() * 1000) for i in range(n)}
+    adj = {i: {} for i in range(n)}
+
+    def link(u, v):
+        if u == v:
+            return
+        w = math.dist(pos[u], pos[v]) * (1 + rng.random()) + 1
+        if integer:
+            w = math.ceil(w)
+        adj[u][v] = w
+        if not directed:
+            adj[v][u] = w
+
+    for i in range(1, n):
+        link(rng.randrange(i), i)
+        if directed:
+            link(i, rng.randrange(i))   # volta até a árvore: todos alcançam 0
+    for _ in range(extra * n):
+        link(rng.randrange(n), rng.randrange(n))
+    return (adj, pos) if with_positions else adj
+
+
+def reference_dijkstra(adj, src):
+    """Dijkstra O(n²) por varredura linear, a versão original da aplicação."""
+    dist = {src: 0}
+    done = set()
+    while True:
+        u = min((x for x in dist if x not in done), key=dist.get, default=None)
+        if u is None:
+            return dist
+        done.add(u)
+        for v, w in adj[u].items():
+            if dist[u] + w < dist.get(v, math.inf):
+                dist[v] = dist[u] + w
+
+
+def path_cost(adj, path):
+    return sum(adj[a][b] for a, b in zip(path, path[1:]))
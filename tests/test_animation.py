@@ -0,0 +1,30 @@
+"""Relógio de quadros da frota (grafos.animation)."""
+
+import unittest
+
+from grafos.animation import Fleet, Track
+
+
+class FleetTest(unittest.TestCase):
+    def test_tick_moves_and_finishes(self):
+        fleet = Fleet(fps=10)
+        fleet.add("a", Track.uniform([(0, 0), (10, 0)], 1.0), now=0.0)
+        positions, finished = fleet.tick(0.5)
+        self.assertEqual(positions["a"][:2], (5.0, 0.0))
+        self.assertEqual(finished, [])
+        positions, finished = fleet.tick(1.0)
+        self.assertEqual(finished, ["a"])
+        self.assertEqual(len(fleet), 0)
+
+    def test_fps_with_equal_timestamps(self):
+        fleet = Fleet(fps=60)
+        fleet.add("a", Track.uniform([(0, 0), (1, 0)], 10.0), now=0.0)
+        fleet.tick(1.0)
+        fleet.tick(1.0)
+        self.assertEqual(fleet.fps, 0.0)
+        fleet.tick(1.5)
+        self.assertAlmostEqual(fleet.fps, 4.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+"""Cache de árvores por origem (grafos.cache.RouteCache): rotas servidas pelo cache depois de
+edições sorteadas comparadas com rotas recalculadas do zero."""
+
+import random
+import unittest
+
+from grafos import GraphModel, RouteError
+from grafos.cache import RouteCache
+from helpers import random_adj
+
+
+def model(adj, directed):
+    g = GraphModel(directed=directed)
+    g.reset(len(adj))
+    for u, nbrs in adj.items():
+        for v, w in nbrs.items():
+            if directed or u < v:
+                g.add_edge(u, v, w)
+    return g
+
+
+class RouteCacheTest(unittest.TestCase):
+    def test_cached_routes_after_edits(self):
+        for seed in range(5):
+            for directed in (False, True):
+                with self.subTest(seed=seed, directed=directed):
+                    rng = random.Random(seed)
+                    g = model(random_adj(200, rng, directed, extra=1), directed)
+                    pool = rng.sample(range(200), 6)   # poucas origens, para haver acertos
+                    for _ in range(30):
+                        src, *dests = rng.sample(pool, 5)
+                        try:
+                            expected = g.find_shortest_path(src, dests)[1]
+                        except RouteError:
+                            with self.assertRaises(RouteError):
+                                g.find_shortest_path(src, dests, use_cache=True)
+                        else:
+                            self.assertAlmostEqual(g.find_shortest_path(src, dests, use_cache=True)[1],
+                                                   expected, places=6)
+                        # edição aleatória: remoção, peso maior/menor ou aresta nova
+                        u, v = rng.sample(range(200), 2)
+                        if v in g.adj[u] and rng.random() < 0.4:
+                            g.remove_edge(u, v)
+                        else:
+                            g.add_edge(u, v, rng.uniform(1, 1500))
+                    self.assertGreater(g.route_cache.hits, 0)
+                    self.assertGreater(g.route_cache.invalidations, 0)
+
+    def test_lru_budget(self):
+        cache = RouteCache(max_bytes=10_000)
+        trees = {s: ({i: float(i) for i in range(40)}, {i: i - 1 for i in range(1, 40)}) for s in range(20)}
+        for s, tree in trees.items():
+            cache.put(s, *tree)
+            self.assertLessEqual(cache.nbytes, 10_000)
+        self.assertIn(19, cache)
+        self.assertNotIn(0, cache)   # a menos recente saiu primeiro
+        self.assertIsNone(cache.get(0))
+        self.assertEqual(cache.get(19), trees[19])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+"""Contraction Hierarchies (grafos.ch, GraphModel.ch_query) contra o Dijkstra comum, incluindo
+a volta ao Dijkstra após edições e o salvamento/carga com impressão digital."""
+
+import os
+import random
+import tempfile
+import unittest
+
+from grafos import GraphModel
+from grafos.ch import ContractionHierarchy, graph_fingerprint
+from grafos.shortest_path import dijkstra
+from helpers import path_cost, random_adj
+
+
+def model(adj, directed):
+    g = GraphModel(directed=directed)
+    g.reset(len(adj))
+    for u, nbrs in adj.items():
+        for v, w in nbrs.items():
+            if directed or u < v:
+                g.add_edge(u, v, w)
+    return g
+
+
+class ContractionHierarchyTest(unittest.TestCase):
+    def check_queries(self, g, rng, pairs=40):
+        for _ in range(pairs):
+            s, t = rng.sample(list(g.adj), 2)
+            expected = dijkstra(g.adj, s, target=t)[0][t]
+            path, cost = g.ch_query(s, t)
+            self.assertAlmostEqual(cost, expected, places=6)
+            self.assertEqual((path[0], path[-1]), (s, t))
+            self.assertAlmostEqual(path_cost(g.adj, path), expected, places=6)
+
+    def test_query_matches_dijkstra(self):
+        for seed in range(4):
+            for directed in (False, True):
+                with self.subTest(seed=seed, directed=directed):
+                    rng = random.Random(seed)
+                    g = model(random_adj(200, rng, directed, extra=1), directed)
+                    g.build_hierarchy()
+                    self.check_queries(g, rng)
+                    self.assertFalse(g.last_ch_fallback)
+
+    def test_arbitrary_ids(self):
+        rng = random.Random(4)
+        adj = random_adj(120, rng)
+        named = {f"n{u}": {f"n{v}": w for v, w in nbrs.items()} for u, nbrs in adj.items()}
+        ch = ContractionHierarchy.build(named)
+        for _ in range(20):
+            s, t = rng.sample(range(120), 2)
+            cost, path = ch.query(f"n{s}", f"n{t}")
+            self.assertAlmostEqual(cost, dijkstra(adj, s, target=t)[0][t], places=6)
+            self.assertEqual((path[0], path[-1]), (f"n{s}", f"n{t}"))
+
+    def test_fallback_after_edit(self):
+        g = model(random_adj(200, random.Random(1)), False)
+        g.build_hierarchy()
+        u, v, w = next(iter(g.edges()))
+        g.add_edge(u, v, w / 10)
+        self.check_queries(g, random.Random(1), pairs=15)
+        self.assertTrue(g.last_ch_fallback)
+
+    def test_save_load_round_trip(self):
+        adj = random_adj(200, random.Random(2), directed=True)
+        g = model(adj, True)
+        g.build_hierarchy()
+        fd, path = tempfile.mkstemp(suffix=".ch")
+        os.close(fd)
+        try:
+            g.save_hierarchy(path)
+            other = model(adj, True)
+            self.assertTrue(other.load_hierarchy(path))
+            self.assertEqual(other.hierarchy.fingerprint, graph_fingerprint(other.adj))
+            self.check_queries(other, random.Random(2))
+            self.assertFalse(other.last_ch_fallback)
+
+            # grafo diferente: impressão digital não bate e as consultas caem no Dijkstra
+            u, v, w = next(iter(other.edges()))
+            other.add_edge(u, v, w + 1)
+            self.assertFalse(other.load_hierarchy(path))
+            self.check_queries(other, random.Random(3), pairs=15)
+            self.assertTrue(other.last_ch_fallback)
+        finally:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
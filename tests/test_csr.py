@@ -0,0 +1,51 @@
+"""Representação CSR (grafos.csr) e Dijkstra por índices contra os dicts de adj."""
+
+import random
+import unittest
+
+from grafos.csr import CSRGraph
+from grafos.shortest_path import dijkstra, dijkstra_csr
+from helpers import random_adj
+
+
+class CSRGraphTest(unittest.TestCase):
+    def test_neighbors_match_adj(self):
+        for directed in (False, True):
+            adj = random_adj(200, random.Random(1), directed)
+            csr = CSRGraph.from_adj(adj)
+            self.assertIsNone(csr.nodes)   # ids 0..n-1: sem mapa
+            self.assertEqual(len(csr), 200)
+            self.assertEqual(csr.n_edges, sum(map(len, adj.values())))
+            for u, nbrs in adj.items():
+                self.assertEqual(dict(csr.neighbors(u)), nbrs)
+
+    def test_arbitrary_ids(self):
+        adj = {"a": {"b": 1.0, 7: 2.5}, "b": {"c": 4.0}, 7: {}}   # "c" só aparece como destino
+        csr = CSRGraph.from_adj(adj)
+        self.assertEqual(len(csr), 4)
+        for u, nbrs in adj.items():
+            got = {csr.node_id(v): w for v, w in csr.neighbors(csr.node_index(u))}
+            self.assertEqual(got, nbrs)
+        self.assertEqual(list(csr.neighbors(csr.node_index("c"))), [])
+
+    def test_dijkstra_matches_dicts(self):
+        for seed in range(5):
+            for directed in (False, True):
+                with self.subTest(seed=seed, directed=directed):
+                    rng = random.Random(seed)
+                    adj = random_adj(300, rng, directed)
+                    # ids não contíguos forçam o mapa de ids do CSR
+                    adj = {u * 3 + 1: {v * 3 + 1: w for v, w in nbrs.items()} for u, nbrs in adj.items()}
+                    csr = CSRGraph.from_adj(adj)
+                    src = rng.choice(list(adj))
+                    dist, prev = dijkstra(adj, src)
+                    self.assertEqual(dijkstra(csr, src), (dist, prev))
+                    dist_i, prev_i = dijkstra_csr(csr, csr.node_index(src))
+                    for v, d in dist.items():
+                        self.assertEqual(dist_i[csr.node_index(v)], d)
+                    t = rng.choice(list(adj))
+                    self.assertEqual(dijkstra(csr, src, target=t)[0][t], dist[t])
+
+
+if __name__ == "__main__":
+    unittest.main()
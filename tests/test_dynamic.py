@@ -0,0 +1,53 @@
+"""Reparo incremental da árvore de caminhos mínimos (grafos.dynamic) contra um Dijkstra novo."""
+
+import random
+import unittest
+
+from grafos.dynamic import DynamicSPT
+from grafos.shortest_path import dijkstra
+from helpers import path_cost, random_adj
+
+
+class DynamicSPTTest(unittest.TestCase):
+    def test_repairs_match_dijkstra(self):
+        for seed in range(5):
+            for directed in (False, True):
+                with self.subTest(seed=seed, directed=directed):
+                    rng = random.Random(seed)
+                    adj = random_adj(250, rng, directed, extra=1)
+                    src = rng.randrange(250)
+                    tree = DynamicSPT(adj, src, directed)
+                    for _ in range(40):
+                        # derruba de preferência arestas da árvore (as que exigem reparo)
+                        if tree.prev and rng.random() < 0.8:
+                            v = rng.choice(list(tree.prev))
+                            u = tree.prev[v]
+                        else:
+                            u = rng.randrange(250)
+                            if not adj[u]:
+                                continue
+                            v = rng.choice(list(adj[u]))
+                        # como GraphModel.remove_edge: tira as duas mãos antes de reparar
+                        del adj[u][v]
+                        if not directed:
+                            del adj[v][u]
+                        tree.delete_edge(u, v)
+                        if not directed:
+                            tree.delete_edge(v, u)
+                        dist, _ = dijkstra(adj, src)
+                        self.assertEqual(tree.dist.keys(), dist.keys())
+                        for x, d in dist.items():
+                            self.assertAlmostEqual(tree.dist[x], d, places=6)
+                            if x != src:
+                                self.assertAlmostEqual(path_cost(adj, tree.path_to(x)), d, places=6)
+
+    def test_non_tree_edge_changes_nothing(self):
+        adj = {0: {1: 1.0, 2: 5.0}, 1: {2: 1.0}, 2: {}}
+        tree = DynamicSPT(adj, 0, directed=True)
+        del adj[0][2]
+        self.assertEqual(tree.delete_edge(0, 2), set())
+        self.assertEqual(tree.dist, {0: 0, 1: 1.0, 2: 2.0})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+"""Ingestão em memória externa (grafos.external): CSR montado por runs ordenados e consultas
+no arquivo mapeado contra o Dijkstra sobre os dicts."""
+
+import os
+import random
+import tempfile
+import unittest
+
+from grafos.external import MappedGraph, build_external, iter_edge_file
+from grafos.formats import open_binary
+from grafos.shortest_path import dijkstra
+from helpers import random_adj
+
+
+class ExternalTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def build(self, edges, directed, chunk):
+        path = os.path.join(self.tmp.name, "g.bin")
+        n, m = build_external(iter(edges), path, directed, chunk_edges=chunk, tmpdir=self.tmp.name)
+        return path, n, m
+
+    def test_matches_dijkstra(self):
+        for seed in range(3):
+            for directed in (False, True):
+                with self.subTest(seed=seed, directed=directed):
+                    rng = random.Random(seed)
+                    adj = random_adj(300, rng, directed)
+                    edges = [(u, v, w) for u, nbrs in adj.items() for v, w in nbrs.items()
+                             if directed or u < v]
+                    rng.shuffle(edges)
+                    # duplicatas mais caras e laços são descartados; chunk pequeno força vários runs
+                    noise = [(u, v, w + 5) for u, v, w in rng.sample(edges, 30)] + [(7, 7, 1.0)]
+                    path, n, m = self.build(edges + noise, directed, chunk=97)
+                    self.assertEqual((n, m), (300, sum(map(len, adj.values()))))
+                    csr = open_binary(path)
+                    for u in rng.sample(range(300), 20):
+                        a, b = csr.offsets[u], csr.offsets[u + 1]
+                        self.assertEqual(dict(zip(csr.targets[a:b], csr.weights[a:b])), adj[u])
+                    g = MappedGraph(path)
+                    for _ in range(10):
+                        s, t = rng.sample(range(300), 2)
+                        cost, route = g.shortest_path(s, t)
+                        self.assertAlmostEqual(cost, dijkstra(adj, s, target=t)[0][t], places=6)
+                        self.assertEqual((route[0], route[-1]), (s, t))
+                        self.assertGreater(g.last_stats["settled"], 0)
+
+    def test_iter_edge_file(self):
+        csv_path = os.path.join(self.tmp.name, "e.csv")
+        with open(csv_path, "w", encoding="utf-8") as f:
+            f.write("u,v,w\n0,1,2.5\n1,2\n")
+        self.assertEqual(list(iter_edge_file(csv_path)), [(0, 1, 2.5), (1, 2, 1.0)])
+        gr_path = os.path.join(self.tmp.name, "e.gr")
+        with open(gr_path, "w", encoding="utf-8") as f:
+            f.write("c teste\np sp 3 2\na 1 2 7\na 3 1 4\n")
+        self.assertEqual(list(iter_edge_file(gr_path)), [(0, 1, 7.0), (2, 0, 4.0)])
+
+    def test_rejects_negative_ids(self):
+        with self.assertRaises(ValueError):
+            self.build([(0, -1, 1.0)], True, chunk=10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+"""Leitura de lista de arestas CSV e DIMACS (grafos.formats.read_edge_csv / read_dimacs)."""
+
+import os
+import tempfile
+import unittest
+
+from grafos.formats import read_dimacs, read_edge_csv
+
+
+def write_temp(test, text, suffix):
+    fd, path = tempfile.mkstemp(suffix=suffix)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(text)
+    test.addCleanup(os.remove, path)
+    return path
+
+
+class ReadEdgeCsvTest(unittest.TestCase):
+    def read(self, text, **kwargs):
+        path = write_temp(self, text, ".csv")
+        return read_edge_csv(path, **kwargs)
+
+    def test_two_column_header(self):
+        g = self.read("u,v\n1,2\n2,3\n")
+        self.assertEqual(g.labels, [1, 2, 3])
+        self.assertEqual(g.adj, {0: {1: 1.0}, 1: {0: 1.0, 2: 1.0}, 2: {1: 1.0}})
+
+    def test_weighted_header_and_comments(self):
+        g = self.read("# rede\nfrom,to,w\n1,2,3.5\n2,3,1\n", directed=True)
+        self.assertEqual(g.adj, {0: {1: 3.5}, 1: {2: 1.0}, 2: {}})
+
+    def test_no_header(self):
+        self.assertEqual(self.read("1,2\n2,3\n").labels, [1, 2, 3])
+
+    def test_text_ids(self):
+        self.assertEqual(self.read("A,B\nB,C\n", header=False).labels, ["A", "B", "C"])
+        self.assertEqual(self.read("de,para\nA,B\n", header=True).labels, ["A", "B"])
+
+    def test_bad_weight(self):
+        with self.assertRaises(ValueError):
+            self.read("1,2,x\n", header=False)
+
+
+class ReadDimacsTest(unittest.TestCase):
+    def read(self, text, co=None):
+        path = write_temp(self, text, ".gr")
+        return read_dimacs(path, coords=co and write_temp(self, co, ".co"))
+
+    def test_arcs_and_coords(self):
+        g = self.read("c exemplo\np sp 3 3\na 1 2 4\na 2 3 1.5\na 3 3 9\n",
+                      co="p aux sp co 3\nv 1 10 20\nv 2 30 40\nv 3 50 60\n")
+        self.assertTrue(g.directed)
+        self.assertEqual(g.n_nodes, 3)
+        self.assertEqual(g.adj, {0: {1: 4.0}, 1: {2: 1.5}, 2: {}})
+        self.assertEqual(g.positions[2], (50.0, 60.0))
+        self.assertEqual(g.dijkstra(0)[0][2], 5.5)
+
+    def test_errors_name_the_line(self):
+        cases = [
+            ("p sp 2 1\na 1 3 1\n", ":2: nó 3 fora de 1..2"),
+            ("p sp 2 1\na 0 1 1\n", ":2: nó 0 fora"),
+            ("a 1 2 1\np sp 2 1\n", ":1: arco antes"),
+            ("p sp 2 1\nc\na 1 2 x\n", ":3: linha inválida"),
+            ("p sp 2 1\na 1 2\n", ":2: linha inválida"),
+            ("p sp dois 1\n", ":1: linha 'p' inválida"),
+            ("c sem cabecalho\n", "falta a linha 'p'"),
+        ]
+        for text, message in cases:
+            with self.subTest(text=text):
+                with self.assertRaises(ValueError) as ctx:
+                    self.read(text)
+                self.assertIn(message, str(ctx.exception))
+
+    def test_coords_out_of_range(self):
+        with self.assertRaisesRegex(ValueError, r"\.co:2: nó 5 fora de 1\.\.2"):
+            self.read("p sp 2 1\na 1 2 1\n", co="p aux sp co 2\nv 5 0 0\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
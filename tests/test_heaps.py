@@ -0,0 +1,71 @@
+"""Fila RadixHeap e Dijkstra com heap binário / radix contra a varredura linear original."""
+
+import heapq
+import random
+import unittest
+
+from grafos.heaps import RadixHeap
+from grafos.shortest_path import dijkstra
+from helpers import random_adj, reference_dijkstra
+
+
+class RadixHeapTest(unittest.TestCase):
+    def test_matches_heapq(self):
+        for seed in range(5):
+            rng = random.Random(seed)
+            radix = RadixHeap()
+            ref = []
+            last = 0
+            for _ in range(2000):
+                if ref and rng.random() < 0.45:
+                    key, _ = radix.pop()
+                    self.assertEqual(key, heapq.heappop(ref)[0])
+                    last = key
+                else:
+                    key = last + rng.randrange(200)   # chaves monótonas, como no Dijkstra
+                    radix.push(key, key)
+                    heapq.heappush(ref, (key, key))
+                self.assertEqual(len(radix), len(ref))
+            while ref:
+                self.assertEqual(radix.pop()[0], heapq.heappop(ref)[0])
+
+    def test_rejects_non_monotone_and_empty(self):
+        radix = RadixHeap()
+        radix.push(5, "a")
+        radix.pop()
+        with self.assertRaises(ValueError):
+            radix.push(4, "b")
+        with self.assertRaises(IndexError):
+            radix.pop()
+
+
+class DijkstraTest(unittest.TestCase):
+    def test_heaps_match_linear_scan(self):
+        for seed in range(5):
+            for directed in (False, True):
+                with self.subTest(seed=seed, directed=directed):
+                    rng = random.Random(seed)
+                    adj = random_adj(150, rng, directed, integer=True)
+                    src = rng.randrange(150)
+                    expected = reference_dijkstra(adj, src)
+                    for heap in ("binary", "radix"):
+                        dist, prev = dijkstra(adj, src, heap=heap)
+                        self.assertEqual(dist, expected)
+                        for v, u in prev.items():
+                            self.assertEqual(dist[u] + adj[u][v], dist[v])
+
+    def test_target_stops_early(self):
+        rng = random.Random(9)
+        adj = random_adj(300, rng)
+        expected = reference_dijkstra(adj, 0)
+        for t in rng.sample(range(300), 20):
+            dist, _ = dijkstra(adj, 0, target=t)
+            self.assertAlmostEqual(dist[t], expected[t])
+
+    def test_radix_rejects_fractional_weights(self):
+        with self.assertRaises(ValueError):
+            dijkstra({0: {1: 0.5}, 1: {}}, 0, heap="radix")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+"""Layouts (grafos.layout): espaçamento do Poisson disk e forças com Barnes-Hut."""
+
+import math
+import random
+import unittest
+
+from grafos.layout import force_directed, poisson_disk
+
+
+def min_pair_distance(points):
+    """Menor distância entre dois pontos (varredura por x, sem O(n²) completo)."""
+    pts = sorted(points)
+    best = math.inf
+    for i, (x, y) in enumerate(pts):
+        for x2, y2 in pts[i + 1:]:
+            if x2 - x >= best:
+                break
+            best = min(best, math.hypot(x2 - x, y2 - y))
+    return best
+
+
+class PoissonDiskTest(unittest.TestCase):
+    def test_spacing_bounds_and_count(self):
+        for seed in range(4):
+            for n, min_dist in ((10, None), (300, None), (2000, None), (50, 60.0), (500, 300.0)):
+                with self.subTest(seed=seed, n=n, min_dist=min_dist):
+                    points, r = poisson_disk(n, 800, 600, min_dist=min_dist,
+                                             rng=random.Random(seed), margin=40)
+                    self.assertEqual(len(points), n)
+                    self.assertGreaterEqual(min_pair_distance(points), r * (1 - 1e-9))
+                    for x, y in points:
+                        self.assertTrue(40 <= x <= 760 and 40 <= y <= 560)
+                    if min_dist == 60.0:
+                        self.assertGreaterEqual(r, min_dist)   # cabe: o espaçamento pedido vale
+                    elif min_dist is not None:
+                        self.assertLess(r, min_dist)           # 500 pontos a 300 não cabem
+
+    def test_small_min_dist_still_spreads(self):
+        # min_dist muito menor que o necessário: amostra no espaçamento que cabe, cobrindo a
+        # área, em vez de ~10⁸ candidatos a 0.1
+        points, r = poisson_disk(200, 1000, 1000, min_dist=0.1, rng=random.Random(5))
+        self.assertEqual(len(points), 200)
+        self.assertGreater(r, 50)
+        self.assertGreaterEqual(min_pair_distance(points), r * (1 - 1e-9))
+        xs = sorted(x for x, _ in points)
+        ys = sorted(y for _, y in points)
+        self.assertTrue(xs[0] < 100 and xs[-1] > 900 and ys[0] < 100 and ys[-1] > 900)
+
+    def test_seeded(self):
+        a = poisson_disk(100, 500, 500, rng=random.Random(3))
+        b = poisson_disk(100, 500, 500, rng=random.Random(3))
+        self.assertEqual(a, b)
+
+
+class ForceDirectedTest(unittest.TestCase):
+    def test_clusters_pull_together(self):
+        # dois cliques de 15 nós ligados por uma aresta, partindo de posições sorteadas
+        rng = random.Random(1)
+        groups = [range(15), range(15, 30)]
+        edges = [(u, v) for g in groups for u in g for v in g if u < v] + [(0, 15)]
+        placed = force_directed(range(30), edges, {}, 500, iterations=80, rng=rng)
+        self.assertEqual(set(placed), set(range(30)))
+        for x, y in placed.values():
+            self.assertTrue(0 <= x <= 500 and 0 <= y <= 500)
+
+        def mean(pairs):
+            return sum(math.dist(placed[u], placed[v]) for u, v in pairs) / len(pairs)
+        inside = [(u, v) for u, v in edges if (u < 15) == (v < 15)]
+        across = [(u, v) for u in groups[0] for v in groups[1]]
+        self.assertLess(mean(inside) * 2, mean(across))
+
+    def test_keeps_given_positions_as_start(self):
+        start = {i: (100.0 + i, 100.0) for i in range(5)}
+        placed = force_directed(range(5), [], start, 400, iterations=0)
+        self.assertEqual(placed, start)
+
+
+if __name__ == "__main__":
+    unittest.main()
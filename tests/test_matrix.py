@@ -0,0 +1,35 @@
+"""Matriz muitos-para-muitos (grafos.matrix): processos paralelos contra a execução serial."""
+
+import random
+import unittest
+
+from grafos import GraphModel
+from grafos.matrix import many_to_many
+from grafos.shortest_path import dijkstra
+from helpers import random_adj
+
+
+class ManyToManyTest(unittest.TestCase):
+    def test_parallel_matches_serial_and_dijkstra(self):
+        rng = random.Random(5)
+        adj = random_adj(400, rng, directed=True)
+        sources = rng.sample(range(400), 12)
+        targets = rng.sample(range(400), 9) + sources[:2]
+        serial = many_to_many(adj, sources, targets, workers=1)
+        parallel = many_to_many(adj, sources, targets, workers=2, batch_size=3)
+        self.assertEqual([list(r) for r in parallel], [list(r) for r in serial])
+        for s, row in zip(sources, serial):
+            dist, _ = dijkstra(adj, s)
+            self.assertEqual(list(row), [dist[t] for t in targets])
+
+    def test_graph_model_and_unreachable(self):
+        g = GraphModel(directed=True)
+        g.reset(4)
+        g.add_edge(0, 1, 2.0)
+        g.add_edge(1, 2, 3.0)
+        rows = many_to_many(g, [0, 2], [2, 3, 0], workers=1)
+        self.assertEqual([list(r) for r in rows], [[5.0, float("inf"), 0.0], [0.0, float("inf"), float("inf")]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+"""Caminhos de substituição (grafos.resilience) contra um Dijkstra refeito sem cada aresta."""
+
+import random
+import unittest
+
+from grafos import GraphModel
+from grafos.resilience import replacement_path_costs
+from grafos.shortest_path import dijkstra
+from helpers import random_adj
+
+INF = float("inf")
+
+
+def rerun_without(adj, s, t, u, v, directed):
+    """Custo s -> t numa cópia de adj sem a aresta u-v."""
+    copy = {x: dict(nbrs) for x, nbrs in adj.items()}
+    del copy[u][v]
+    if not directed:
+        del copy[v][u]
+    dist, _ = dijkstra(copy, s, target=t)
+    return dist.get(t, INF)
+
+
+class ReplacementPathTest(unittest.TestCase):
+    def test_matches_rerun_per_edge(self):
+        for seed in range(6):
+            for directed in (False, True):
+                with self.subTest(seed=seed, directed=directed):
+                    rng = random.Random(seed)
+                    # poucas arestas extras: sobram pontes (custo inf) para testar
+                    adj = random_adj(200, rng, directed, extra=rng.choice((0, 1)))
+                    snapshot = {x: dict(nbrs) for x, nbrs in adj.items()}
+                    for _ in range(5):
+                        s, t = rng.sample(range(200), 2)
+                        path, base, costs = replacement_path_costs(adj, s, t, directed)
+                        dist, _ = dijkstra(adj, s, target=t)
+                        self.assertAlmostEqual(base, dist[t], places=6)
+                        self.assertEqual(len(costs), len(path) - 1)
+                        for (u, v), c in zip(zip(path, path[1:]), costs):
+                            expected = rerun_without(adj, s, t, u, v, directed)
+                            if expected == INF:
+                                self.assertEqual(c, INF)
+                            else:
+                                self.assertAlmostEqual(c, expected, places=6)
+                    self.assertEqual(adj, snapshot)   # a análise não altera o grafo
+
+    def test_sweep_deltas(self):
+        rng = random.Random(11)
+        adj = random_adj(150, rng, extra=1)
+        g = GraphModel()
+        g.reset(150)
+        for u, nbrs in adj.items():
+            for v, w in nbrs.items():
+                if u < v:
+                    g.add_edge(u, v, w)
+        dests = rng.sample(range(1, 150), 3)
+        rows = g.resilience_sweep(0, dests)
+        self.assertEqual([r["delta"] for r in rows], sorted((r["delta"] for r in rows), reverse=True))
+        legs = list(zip([0] + dests[:-1], dests))
+        for row in rows[:10]:
+            u, v = row["edge"]
+            expected = 0.0
+            for k in row["legs"]:
+                s, t = legs[k]
+                base = dijkstra(adj, s, target=t)[0][t]
+                expected += rerun_without(adj, s, t, u, v, False) - base
+            if expected == INF:
+                self.assertEqual(row["delta"], INF)
+            else:
+                self.assertAlmostEqual(row["delta"], expected, places=6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+"""Buscas ponto a ponto (grafos.search): bidirecional, A* euclidiano e ALT contra Dijkstra."""
+
+import random
+import unittest
+
+from grafos.search import (Landmarks, astar, bidirectional_dijkstra, euclidean_heuristic,
+                           min_cost_per_unit, reverse_adj)
+from grafos.shortest_path import dijkstra
+from helpers import path_cost, random_adj
+
+
+class PointToPointTest(unittest.TestCase):
+    def check(self, adj, s, t, result, expected):
+        cost, path, settled = result
+        self.assertAlmostEqual(cost, expected, places=6)
+        self.assertEqual((path[0], path[-1]), (s, t))
+        self.assertAlmostEqual(path_cost(adj, path), expected, places=6)
+        self.assertGreater(settled, 0)
+
+    def test_all_methods_match_dijkstra(self):
+        for seed in range(5):
+            for directed in (False, True):
+                with self.subTest(seed=seed, directed=directed):
+                    rng = random.Random(seed)
+                    adj, pos = random_adj(400, rng, directed, with_positions=True)
+                    radj = reverse_adj(adj) if directed else None
+                    k = min_cost_per_unit(adj, pos)
+                    self.assertGreaterEqual(k, 1.0 - 1e-9)   # pesos >= distância
+                    landmarks = Landmarks(adj, count=6, directed=directed, start=0)
+                    for _ in range(15):
+                        s, t = rng.sample(range(400), 2)
+                        expected = dijkstra(adj, s, target=t)[0][t]
+                        self.check(adj, s, t, bidirectional_dijkstra(adj, s, t, radj), expected)
+                        self.check(adj, s, t, astar(adj, s, t, euclidean_heuristic(pos, t, k)), expected)
+                        self.check(adj, s, t, astar(adj, s, t, landmarks.heuristic(t)), expected)
+
+    def test_heuristics_are_lower_bounds(self):
+        rng = random.Random(8)
+        adj, pos = random_adj(300, rng, directed=True, with_positions=True)
+        landmarks = Landmarks(adj, count=4, directed=True)
+        radj = reverse_adj(adj)
+        for t in rng.sample(range(300), 5):
+            to_t, _ = dijkstra(radj, t)   # distância de cada nó até t
+            h_alt = landmarks.heuristic(t)
+            h_euc = euclidean_heuristic(pos, t, min_cost_per_unit(adj, pos))
+            for v, d in to_t.items():
+                self.assertLessEqual(h_alt(v), d + 1e-6)
+                self.assertLessEqual(h_euc(v), d + 1e-6)
+
+    def test_unreachable(self):
+        adj = {0: {1: 1.0}, 1: {}, 2: {}}
+        self.assertEqual(astar(adj, 0, 2)[:2], (float("inf"), None))
+        self.assertEqual(bidirectional_dijkstra(adj, 0, 2, reverse_adj(adj))[:2], (float("inf"), None))
+
+
+if __name__ == "__main__":
+    unittest.main()
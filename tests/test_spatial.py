@@ -0,0 +1,73 @@
+"""Índice espacial do canvas (grafos.spatial) contra varreduras lineares."""
+
+import math
+import random
+import unittest
+
+from grafos.spatial import SpatialIndex, point_segment_distance
+from helpers import random_adj
+
+
+def scan_node(positions, x, y, radius):
+    best = min(positions, key=lambda n: math.dist(positions[n], (x, y)))
+    return best if math.dist(positions[best], (x, y)) <= radius else None
+
+
+def edge_distance(positions, key, x, y):
+    (x1, y1), (x2, y2) = positions[key[0]], positions[key[1]]
+    return point_segment_distance(x, y, x1, y1, x2, y2)
+
+
+def scan_edge(positions, keys, x, y, tol):
+    best = min(edge_distance(positions, key, x, y) for key in keys)
+    return best if best <= tol else None
+
+
+class SpatialIndexTest(unittest.TestCase):
+    def test_picking_matches_linear_scan(self):
+        for seed in range(4):
+            for directed in (False, True):
+                with self.subTest(seed=seed, directed=directed):
+                    rng = random.Random(seed)
+                    adj, positions = random_adj(300, rng, directed, extra=1, with_positions=True)
+                    index = SpatialIndex(positions, adj, directed)
+                    keys = {index.edge_key(u, v) for u, nbrs in adj.items() for v in nbrs}
+                    for step in range(150):
+                        if step % 10 == 0:
+                            # arrasta um nó e derruba uma aresta, como a interface faz
+                            node = rng.randrange(300)
+                            positions[node] = (rng.random() * 1000, rng.random() * 1000)
+                            index.move_node(node, *positions[node])
+                            key = rng.choice(sorted(keys))
+                            keys.discard(key)
+                            index.remove_edge(*key)
+                        x = rng.random() * 1000
+                        y = rng.random() * 1000
+                        self.assertEqual(index.nearest_node(x, y, 40), scan_node(positions, x, y, 40))
+                        # arestas com um extremo em comum empatam; compara a distância
+                        hit = index.nearest_edge(x, y, 15)
+                        expected = scan_edge(positions, keys, x, y, 15)
+                        if expected is None:
+                            self.assertIsNone(hit)
+                        else:
+                            self.assertIn(hit, keys)
+                            self.assertAlmostEqual(edge_distance(positions, hit, x, y), expected)
+
+    def test_rectangle_queries(self):
+        rng = random.Random(7)
+        adj, positions = random_adj(200, rng, with_positions=True)
+        index = SpatialIndex(positions, adj)
+        for _ in range(30):
+            x0, x1 = sorted(rng.random() * 1000 for _ in range(2))
+            y0, y1 = sorted(rng.random() * 1000 for _ in range(2))
+            inside = {n for n, (x, y) in positions.items() if x0 <= x <= x1 and y0 <= y <= y1}
+            self.assertEqual(set(index.nodes_in(x0, y0, x1, y1)), inside)
+            # toda aresta com um extremo dentro do retângulo cruza a caixa consultada
+            found = set(index.edges_in(x0, y0, x1, y1))
+            for u in inside:
+                for v in adj[u]:
+                    self.assertIn(index.edge_key(u, v), found)
+
+
+if __name__ == "__main__":
+    unittest.main()
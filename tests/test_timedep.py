@@ -0,0 +1,29 @@
+"""Tempos de viagem por horário (grafos.timedep): validação FIFO."""
+
+import unittest
+
+from grafos.timedep import TravelTimes
+
+
+class FifoTest(unittest.TestCase):
+    def setUp(self):
+        self.tt = TravelTimes([0, 60, 120])   # trechos de 60 min; a virada do dia tem 1320
+
+    def test_set_values_rejects_overtaking(self):
+        self.tt.set_values(1, 2, [10, 70, 10])   # cai 60 em 60 min: inclinação -1, ainda FIFO
+        with self.assertRaises(ValueError):
+            self.tt.set_values(1, 2, [10, 71, 10])
+        with self.assertRaises(ValueError):
+            self.tt.set_values(1, 2, [10, 10, 1400])   # queda na virada do dia (de 120 para 1440)
+
+    def test_profile_limit_scales_with_weight(self):
+        p = self.tt.add_profile([1.0, 3.0, 1.0])   # fator cai 2 em 60 min
+        self.assertAlmostEqual(self.tt.max_weight[p], 30.0)
+        self.tt.assign(1, 2, p, w=30)
+        with self.assertRaises(ValueError):
+            self.tt.assign(1, 2, p, w=31, both=True)
+        self.assertEqual(self.tt.edge_profile, {(1, 2): p})
+
+
+if __name__ == "__main__":
+    unittest.main()
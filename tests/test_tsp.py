@@ -0,0 +1,66 @@
+"""Ordem de entrega (grafos.tsp): Held-Karp contra força bruta e heurísticas contra a gulosa."""
+
+import itertools
+import math
+import random
+import unittest
+
+from grafos import GraphModel
+from grafos.shortest_path import dijkstra
+from grafos.tsp import (distance_matrix, held_karp, nearest_neighbor, optimize_order, or_opt,
+                        route_cost, two_opt)
+from helpers import random_adj
+
+
+def random_matrix(k, rng, asym=False):
+    pts = [(rng.random() * 1000, rng.random() * 1000) for _ in range(k)]
+    return [[0.0 if i == j else math.dist(p, q) * (1 + 0.5 * rng.random() if asym else 1)
+             for j, q in enumerate(pts)] for i, p in enumerate(pts)]
+
+
+class TspTest(unittest.TestCase):
+    def test_held_karp_matches_brute_force(self):
+        for seed in range(6):
+            with self.subTest(seed=seed):
+                rng = random.Random(seed)
+                D = random_matrix(8, rng, asym=seed % 2 == 1)
+                best = min(route_cost((0,) + p, D) for p in itertools.permutations(range(1, 8)))
+                order = held_karp(D)
+                self.assertEqual(sorted(order), list(range(8)))
+                self.assertEqual(order[0], 0)
+                self.assertAlmostEqual(route_cost(order, D), best, places=6)
+
+    def test_heuristics_never_worse_than_greedy(self):
+        for seed in range(4):
+            with self.subTest(seed=seed):
+                D = random_matrix(60, random.Random(seed), asym=seed % 2 == 1)
+                greedy = nearest_neighbor(D)
+                base = route_cost(greedy, D)
+                for improve in (two_opt, or_opt):
+                    order = improve(list(greedy), D)
+                    self.assertEqual(sorted(order), list(range(60)))
+                    self.assertEqual(order[0], 0)
+                    self.assertLessEqual(route_cost(order, D), base + 1e-6)
+                order, cost = optimize_order(D, exact_limit=10)
+                self.assertEqual(sorted(order), list(range(60)))
+                self.assertAlmostEqual(cost, route_cost(order, D), places=6)
+                self.assertLessEqual(cost, base + 1e-6)
+
+    def test_distance_matrix(self):
+        rng = random.Random(3)
+        adj = random_adj(120, rng, directed=True)
+        g = GraphModel(directed=True)
+        g.reset(120)
+        for u, nbrs in adj.items():
+            for v, w in nbrs.items():
+                g.add_edge(u, v, w)
+        nodes = rng.sample(range(120), 7)
+        D = distance_matrix(g, nodes)
+        for i, s in enumerate(nodes):
+            dist, _ = dijkstra(adj, s)
+            for j, t in enumerate(nodes):
+                self.assertAlmostEqual(D[i][j], dist[t], places=6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+"""Roteirização de frota (grafos.vrp e GraphModel.plan_fleet) com instâncias sorteadas."""
+
+import itertools
+import math
+import random
+import unittest
+
+from grafos import generators
+from grafos.vrp import solve_vrp
+
+
+def instance(k, seed, asym=False):
+    """Origem + k paradas no plano; asym=True deixa D assimétrica (como num grafo direcionado)."""
+    rng = random.Random(seed)
+    pts = [(rng.random() * 1000, rng.random() * 1000) for _ in range(k + 1)]
+    D = [[0.0 if p == q else math.dist(p, q) * (1 + 0.3 * rng.random() if asym else 1)
+          for q in pts] for p in pts]
+    demands = [0] + [rng.randint(1, 10) for _ in range(k)]
+    return D, demands
+
+
+def routes_cost(D, routes, closed=True):
+    total = 0.0
+    for r in routes:
+        seq = [0] + r + ([0] if closed else [])
+        total += sum(D[a][b] for a, b in zip(seq, seq[1:]))
+    return total
+
+
+def brute_force(D, demands, capacity, closed=True):
+    """Ótimo exato: toda solução é uma permutação das paradas cortada em rotas."""
+    k = len(D) - 1
+    best = math.inf
+    for perm in itertools.permutations(range(1, k + 1)):
+        for cuts in itertools.product((False, True), repeat=k - 1):
+            routes = [[perm[0]]]
+            for x, cut in zip(perm[1:], cuts):
+                if cut:
+                    routes.append([x])
+                else:
+                    routes[-1].append(x)
+            if all(sum(demands[x] for x in r) <= capacity for r in routes):
+                best = min(best, routes_cost(D, routes, closed))
+    return best
+
+
+class SolveVrpTest(unittest.TestCase):
+    def check(self, D, demands, capacity, routes, cost, closed=True):
+        self.assertEqual(sorted(x for r in routes for x in r), list(range(1, len(D))))
+        for r in routes:
+            self.assertLessEqual(sum(demands[x] for x in r), capacity)
+        self.assertAlmostEqual(cost, routes_cost(D, routes, closed), places=6)
+
+    def test_feasible_and_cost(self):
+        for k, capacity, closed, asym in [(30, 20, True, False), (200, 50, True, False),
+                                          (200, 50, False, True), (500, 35, True, True)]:
+            with self.subTest(k=k, closed=closed, asym=asym):
+                D, demands = instance(k, k, asym)
+                routes, cost = solve_vrp(D, demands, capacity, closed)
+                self.check(D, demands, capacity, routes, cost, closed)
+
+    def test_small_instances_near_optimal(self):
+        for seed in range(8):
+            for closed in (True, False):
+                with self.subTest(seed=seed, closed=closed):
+                    D, demands = instance(6, seed, asym=seed % 2 == 1)
+                    routes, cost = solve_vrp(D, demands, 15, closed)
+                    self.check(D, demands, 15, routes, cost, closed)
+                    best = brute_force(D, demands, 15, closed)
+                    self.assertGreaterEqual(cost, best - 1e-6)
+                    self.assertLessEqual(cost, best * 1.10)
+
+    def test_demand_above_capacity(self):
+        D, demands = instance(5, 1)
+        demands[3] = 99
+        with self.assertRaises(ValueError):
+            solve_vrp(D, demands, 10)
+
+
+class PlanFleetTest(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(7)
+        self.graph = generators.random_geometric(400, 6, rng=rng)
+        dist, _ = self.graph.dijkstra(0)
+        self.stops = rng.sample(sorted(n for n in dist if n != 0), 40)
+        self.demands = {s: rng.randint(1, 5) for s in self.stops}
+
+    def path_cost(self, path):
+        adj = self.graph.adj
+        return sum(adj[a][b] for a, b in zip(path, path[1:]))
+
+    def test_paths_follow_routes(self):
+        for closed in (True, False):
+            with self.subTest(closed=closed):
+                paths = self.graph.plan_fleet(0, self.stops, 20, self.demands, return_to_depot=closed)
+                stats = self.graph.last_fleet_stats
+                self.assertEqual(stats["trucks"], len(paths))
+                self.assertTrue(all(load <= 20 for load in stats["loads"]))
+                self.assertEqual(sum(stats["loads"]), sum(self.demands.values()))
+                served = set()
+                for path in paths:
+                    self.assertEqual(path[0], 0)
+                    if closed:
+                        self.assertEqual(path[-1], 0)
+                    served.update(path)
+                self.assertLessEqual(set(self.stops), served)
+                # cada trecho é um caminho válido e o custo total bate com o do solver
+                self.assertAlmostEqual(sum(map(self.path_cost, paths)), stats["cost"], places=6)
+
+    def test_pool_matches_serial(self):
+        serial = self.graph.plan_fleet(0, self.stops, 20, self.demands)
+        # 41 nós x 400 vértices fica abaixo de FLEET_POOL_WORK: o padrão roda no processo atual
+        self.assertEqual(self.graph.last_fleet_stats["workers"], 1)
+        cost = self.graph.last_fleet_stats["cost"]
+        pooled = self.graph.plan_fleet(0, self.stops, 20, self.demands, workers=2)
+        self.assertAlmostEqual(self.graph.last_fleet_stats["cost"], cost, places=6)
+        self.assertEqual(len(pooled), len(serial))
+
+
+if __name__ == "__main__":
+    unittest.main()